@@ -0,0 +1,54 @@
+"""
+Microbenchmark of the fixed layout date parser and formatter against strptime and strftime
+
+Run from the project root: python -m benchmarks.bench_date_format
+"""
+import datetime
+import random
+import timeit
+
+from utils.date_format import parse_date, format_date, DATE_FORMAT
+
+
+def main():
+    """
+    Runs the benchmark over dates spread across a few hours, as in a day of rentals
+    """
+    start = datetime.datetime(2021, 12, 16, 8, 0)
+    dates = [start + datetime.timedelta(minutes=random.randint(0, 12 * 60)) for _ in range(100000)]
+    texts = [date.strftime(DATE_FORMAT) for date in dates]
+
+    def run_strptime():
+        for text in texts:
+            datetime.datetime.strptime(text, DATE_FORMAT)
+
+    def run_parse_date():
+        for text in texts:
+            parse_date(text)
+
+    def run_parse_date_uncached():
+        for text in texts:
+            parse_date.__wrapped__(text)
+
+    def run_format_date_uncached():
+        for date in dates:
+            format_date.__wrapped__(date)
+
+    def run_strftime():
+        for date in dates:
+            date.strftime(DATE_FORMAT)
+
+    def run_format_date():
+        for date in dates:
+            format_date(date)
+
+    for name, function in [("strptime", run_strptime), ("parse_date", run_parse_date),
+                           ("parse_date (no cache)", run_parse_date_uncached),
+                           ("strftime", run_strftime), ("format_date", run_format_date),
+                           ("format_date (no cache)", run_format_date_uncached)]:
+        elapsed = min(timeit.repeat(function, number=1, repeat=3))
+        print(f"{name:>23}: {elapsed / len(texts) * 1e9:7.0f} ns/date")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Memory benchmark of the entities, measured with tracemalloc
+
+Run from the project root: python -m benchmarks.bench_entity_memory
+"""
+import datetime
+import tracemalloc
+
+from domain.datatransfer import FilmDTO
+from domain.entities import Film, Client, Transaction
+from utils.date_format import parse_date
+
+
+class DictFilm:
+    """
+    Film with a per-instance __dict__, as the entities were stored before using __slots__
+    """
+    def __init__(self, id, title, description, genre):
+        self.__id = id
+        self.__title = title
+        self.__description = description
+        self.__genre = genre
+
+
+class DictClient:
+    """
+    Client with a per-instance __dict__
+    """
+    def __init__(self, id, name, cnp):
+        self.__id = id
+        self.__name = name
+        self.__cnp = cnp
+
+
+class DictTransaction:
+    """
+    Transaction with a per-instance __dict__ and its own datetime object
+    """
+    def __init__(self, id, film, client, date):
+        self.__id = id
+        self.__film = film
+        self.__client = client
+        self.__date = date
+        self.__returned = False
+
+
+class DictFilmDTO:
+    """
+    FilmDTO with a per-instance __dict__
+    """
+    def __init__(self, id, title):
+        self.__id = id
+        self.__title = title
+        self.__count = 0
+
+
+def measure(factory, count):
+    """
+    Measures the memory allocated per object created by the factory
+
+    :param factory: a function with one integer argument (the index) returning a new object
+    :param count: integer, the number of objects created
+    :return: bytes per object, float
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del objects
+    return (after - before) / count
+
+
+def main():
+    """
+    Runs the benchmark, the shared values (strings, films, clients) are created outside the measurement
+    """
+    count = 100000
+    film = Film(1, "film", "desc", "gen")
+    client = Client(1, "nume", 5211110068801)
+    text = "16.12.2021 21:06"
+
+    def loaded_transaction(i):
+        tr = Transaction(i, film, client)
+        tr.set_date(parse_date(text))  # loaded transactions share the cached datetime objects
+        return tr
+
+    results = [
+        ("Film", lambda i: DictFilm(i, "film", "desc", "gen"), lambda i: Film(i, "film", "desc", "gen")),
+        ("Client", lambda i: DictClient(i, "nume", 5211110068801), lambda i: Client(i, "nume", 5211110068801)),
+        ("Transaction",
+         lambda i: DictTransaction(i, film, client, datetime.datetime.strptime(text, "%d.%m.%Y %H:%M")),
+         loaded_transaction),
+        ("FilmDTO", lambda i: DictFilmDTO(i, "film"), lambda i: FilmDTO(i, "film")),
+    ]
+
+    for name, before, after in results:
+        # the ids below 256 are cached by the interpreter, start from a larger offset to count them fairly
+        bytes_before = measure(lambda i: before(i + 1000), count)
+        bytes_after = measure(lambda i: after(i + 1000), count)
+        print(f"{name:>12}: {bytes_before:6.1f} -> {bytes_after:6.1f} bytes/object")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark of the search of films by a misspelled title: bounded edit distance against every title, against the
+candidates given by the trigram index
+
+Run from the project root: python -m benchmarks.bench_fuzzy_title_search
+"""
+import os
+import random
+import string
+import tempfile
+import time
+
+from domain.entities import Film
+from repositories.film_repository import FilmRepository
+from repositories.sqlite_database import SQLiteDatabase
+from repositories.sqlite_film_repository import SQLiteFilmRepository
+from repositories.unit_of_work import UnitOfWork
+from utils.edit_distance import bounded_levenshtein
+
+WORDS = ["".join(random.choice(string.ascii_lowercase) for _ in range(random.randint(3, 9))) for _ in range(5000)]
+MAX_DISTANCE = 2
+TARGET_MS = 20  # the latency a search at the counter should stay under, for the 95th percentile
+
+
+def misspell(title, edits):
+    """
+    Applies random edits (insertions, deletions, substitutions) to a title
+
+    :param title: string
+    :param edits: integer
+    :return: string
+    """
+    for _ in range(edits):
+        i = random.randrange(len(title))
+        kind = random.choice(["insert", "delete", "substitute"])
+        if kind == "insert":
+            title = title[:i] + random.choice(string.ascii_lowercase) + title[i:]
+        elif kind == "delete":
+            title = title[:i] + title[i + 1:]
+        else:
+            title = title[:i] + random.choice(string.ascii_lowercase) + title[i + 1:]
+
+    return title
+
+
+def measure(function, queries):
+    """
+    Measures the latency of a search for every query
+
+    :param function: a function which receives a query
+    :param queries: a list of strings
+    :return: a tuple (median, 95th percentile), in milliseconds
+    """
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        function(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+
+    return latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.95)]
+
+
+def main():
+    """
+    Runs the benchmark over 100000 films with titles of 2 to 4 random words, in memory and in a SQLite database
+    """
+    film_repo = FilmRepository()
+    for id in range(1, 100001):
+        title = " ".join(random.choice(WORDS) for _ in range(random.randint(2, 4))).title()
+        film_repo.add(Film(id, title, "desc", "gen"))
+
+    films = film_repo.get_all()
+    queries = [misspell(film.get_title(), random.randint(1, MAX_DISTANCE)) for film in random.sample(films, 100)]
+
+    def run_scan(query):
+        query = query.casefold()
+        return [film for film in films if bounded_levenshtein(query, film.get_title().casefold(), MAX_DISTANCE) <= MAX_DISTANCE]
+
+    def run_index(query):
+        return film_repo.find_by_title_fuzzy(query, MAX_DISTANCE)
+
+    with tempfile.TemporaryDirectory() as directory:
+        sqlite_repo = SQLiteFilmRepository(SQLiteDatabase(os.path.join(directory, "filme.db")))
+        with UnitOfWork(sqlite_repo):
+            for film in films:
+                sqlite_repo.add(film)
+
+        start = time.perf_counter()
+        sqlite_repo.find_by_title_fuzzy(queries[0], MAX_DISTANCE)  # the index is built on the first search
+        print(f"sqlite index build: {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+        def run_sqlite_index(query):
+            return sqlite_repo.find_by_title_fuzzy(query, MAX_DISTANCE)
+
+        for name, function in [("linear scan", run_scan), ("trigram index", run_index), ("sqlite index", run_sqlite_index)]:
+            median, p95 = measure(function, queries)
+            verdict = "ok" if p95 <= TARGET_MS else "over"
+            print(f"{name:>13}: median {median:8.2f} ms, p95 {p95:8.2f} ms (target {TARGET_MS} ms: {verdict})")
+
+        sqlite_repo.close()
+
+
+if __name__ == '__main__':
+    main()
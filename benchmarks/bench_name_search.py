@@ -0,0 +1,66 @@
+"""
+Benchmark of the search of clients by name: normalized linear scan against the token index
+
+Run from the project root: python -m benchmarks.bench_name_search
+"""
+import os
+import random
+import tempfile
+import timeit
+
+from domain.entities import Client
+from repositories.client_repository import ClientRepository
+from repositories.sqlite_client_repository import SQLiteClientRepository
+from repositories.sqlite_database import SQLiteDatabase
+from repositories.unit_of_work import UnitOfWork
+from utils.token_index import TokenIndex
+
+FIRST_NAMES = ["Ana", "Andrei", "Ioana", "Ștefan", "Mihai", "Elena", "Răzvan", "Cristina", "Ion", "Maria"]
+SYLLABLES = ["pop", "es", "cu", "ion", "ă", "nu", "ță", "ra", "mi", "lă", "vas", "ile", "dum", "tr"]
+
+
+def main():
+    """
+    Runs the benchmark over 300000 clients, in memory and in a SQLite database
+    """
+    client_repo = ClientRepository()
+    for id in range(1, 300001):
+        last_name = "".join(random.choice(SYLLABLES) for _ in range(random.randint(2, 4))).title()
+        client_repo.add(Client(id, f"{random.choice(FIRST_NAMES)} {last_name}", 1000000000000 + id))
+
+    clients = client_repo.get_all()
+    queries = [client.get_name().split()[1][:4] for client in random.sample(clients, 10)]  # beginnings of last names
+
+    def run_scan():
+        for query in queries:
+            [client for client in clients if TokenIndex.matches(query, client.get_name())]
+
+    def run_index():
+        for query in queries:
+            client_repo.find_by_name(query)
+
+    build = timeit.timeit(lambda: client_repo.find_by_name(""), number=1)  # the index is built on the first search
+    print(f"index build: {build * 1e3:8.2f} ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        sqlite_repo = SQLiteClientRepository(SQLiteDatabase(os.path.join(directory, "filme.db")))
+        with UnitOfWork(sqlite_repo):
+            for client in clients:
+                sqlite_repo.add(client)
+
+        build = timeit.timeit(lambda: sqlite_repo.find_by_name(queries[0]), number=1)
+        print(f"sqlite index build: {build * 1e3:8.2f} ms")
+
+        def run_sqlite_index():
+            for query in queries:
+                sqlite_repo.find_by_name(query)
+
+        for name, function in [("linear scan", run_scan), ("token index", run_index), ("sqlite index", run_sqlite_index)]:
+            elapsed = min(timeit.repeat(function, number=1, repeat=1))
+            print(f"{name:>12}: {elapsed / len(queries) * 1e3:8.2f} ms/query")
+
+        sqlite_repo.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+"""
+Benchmark of the aggregation of the transactions with 1, 2, 4 and 8 worker processes
+
+Run from the project root: python -m benchmarks.bench_parallel_aggregation
+"""
+import os
+import random
+import timeit
+
+from domain.entities import Film, Client, Transaction
+from services.rental_aggregation import RentalAggregation
+
+
+def main():
+    """
+    Runs the benchmark over 1000000 transactions between 10000 films and 10000 clients
+    """
+    films = [Film(id, f"film{id}", f"desc{id}", f"gen{id % 10}") for id in range(1, 10001)]
+    clients = [Client(id, f"client{id}", 1000000000000 + id) for id in range(1, 10001)]
+    transactions = [Transaction(i, random.choice(films), random.choice(clients)) for i in range(1000000)]
+
+    print(f"{os.cpu_count()} CPUs, {len(transactions)} transactions")
+    for workers in [1, 2, 4, 8]:
+        elapsed = min(timeit.repeat(lambda: RentalAggregation.build(transactions, workers), number=1, repeat=3))
+        print(f"{workers} workers: {elapsed * 1e3:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
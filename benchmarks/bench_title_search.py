@@ -0,0 +1,42 @@
+"""
+Benchmark of the search of films by a part of the title: linear scan against the trigram index
+
+Run from the project root: python -m benchmarks.bench_title_search
+"""
+import random
+import string
+import timeit
+
+from domain.entities import Film
+from repositories.film_repository import FilmRepository
+
+WORDS = ["".join(random.choice(string.ascii_lowercase) for _ in range(random.randint(3, 9))) for _ in range(5000)]
+
+
+def main():
+    """
+    Runs the benchmark over 100000 films with titles of 2 to 4 random words
+    """
+    film_repo = FilmRepository()
+    for id in range(1, 100001):
+        title = " ".join(random.choice(WORDS) for _ in range(random.randint(2, 4))).title()
+        film_repo.add(Film(id, title, "desc", "gen"))
+
+    films = film_repo.get_all()
+    queries = [film.get_title()[2:8] for film in random.sample(films, 100)]  # parts of existing titles
+
+    def run_scan():
+        for query in queries:
+            [film for film in films if query in film.get_title()]
+
+    def run_index():
+        for query in queries:
+            film_repo.find_by_title(query)
+
+    for name, function in [("linear scan", run_scan), ("trigram index", run_index)]:
+        elapsed = min(timeit.repeat(function, number=1, repeat=3))
+        print(f"{name:>13}: {elapsed / len(queries) * 1e6:9.1f} us/query")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark of the first clients report: the full sorted report sliced to 30% against the top-k selection
+
+The full report uses bingo sort, which is quadratic in the number of distinct clients, so it is only
+measured up to 10000 clients; the top-k selection is measured up to 100000 clients.
+
+Run from the project root: python -m benchmarks.bench_top_k
+"""
+import random
+import timeit
+from math import ceil
+
+from domain.entities import Film, Client, Transaction
+from domain.validators import TransactionValidator
+from repositories.client_repository import ClientRepository
+from repositories.film_repository import FilmRepository
+from repositories.transaction_repository import TransactionRepository
+from services.transaction_service import TransactionService
+
+FULL_SORT_LIMIT = 10000
+
+
+def create_service(n):
+    """
+    Creates a transaction service with n films, n clients and n random rents
+
+    :param n: integer
+    :return: TransactionService object
+    """
+    film_repo = FilmRepository()
+    client_repo = ClientRepository()
+    transaction_repo = TransactionRepository()
+
+    for i in range(1, n + 1):
+        film_repo.add(Film(i, f"film{i}", f"desc{i}", f"gen{i % 10}"))
+        client_repo.add(Client(i, f"client{random.randint(1, n)}", 1000000000000 + i))
+
+    for i in range(1, n + 1):
+        tr = Transaction(i, film_repo.find(i), client_repo.find(random.randint(1, n)))
+        tr.set_returned(True)
+        transaction_repo.add(tr)
+
+    srv = TransactionService(transaction_repo, TransactionValidator(), film_repo, client_repo)
+    srv.report_films()  # build the aggregates once, both variants use them
+
+    return srv
+
+
+def main():
+    """
+    Runs the benchmark for a growing number of clients
+    """
+    for n in [1000, 10000, 100000]:
+        srv = create_service(n)
+
+        def run_full_sort():
+            report = srv.report_clients_by_number()
+            return report[:ceil(0.3 * len(report))]
+
+        top_k = min(timeit.repeat(srv.report_first_clients, number=1, repeat=3))
+
+        if n <= FULL_SORT_LIMIT:
+            assert len(run_full_sort()) == len(srv.report_first_clients())  # clients equal on (num_films, name) may be in any order
+            full_sort = min(timeit.repeat(run_full_sort, number=1, repeat=3))
+            print(f"{n:>7} clients: full sort {full_sort * 1e3:9.1f} ms, top-k {top_k * 1e3:7.1f} ms")
+        else:
+            print(f"{n:>7} clients: full sort {'-':>9}   , top-k {top_k * 1e3:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark for loading the transactions file against large film and client files
+
+Run from the project root: python -m benchmarks.bench_transaction_loading
+"""
+import os
+import random
+import tempfile
+import time
+
+from repositories.client_file_repository import ClientFileRepository
+from repositories.film_file_repository import FilmFileRepository
+from repositories.transaction_file_repository import TransactionFileRepository
+
+
+def write_files(directory, num_films, num_clients, num_transactions):
+    """
+    Writes the film, client and transaction files used by the benchmark
+
+    :param directory: string, the directory where the files are written
+    :param num_films: integer
+    :param num_clients: integer
+    :param num_transactions: integer
+    :return: a tuple with the paths of the film, client and transaction files
+    """
+    films_path = os.path.join(directory, "films.txt")
+    clients_path = os.path.join(directory, "clients.txt")
+    transactions_path = os.path.join(directory, "transactions.txt")
+
+    with open(films_path, "w") as fh:
+        for id in range(1, num_films + 1):
+            fh.write(f"{id};film{id};desc{id};gen{id % 10}\n")
+
+    with open(clients_path, "w") as fh:
+        for id in range(1, num_clients + 1):
+            fh.write(f"{id};client{id};{5000000000000 + id}\n")
+
+    with open(transactions_path, "w") as fh:
+        for id in range(1, num_transactions + 1):
+            id_film = random.randint(1, num_films)
+            id_client = random.randint(1, num_clients)
+            fh.write(f"{id};{id_film};{id_client};True;16.12.2021 21:06\n")
+
+    return films_path, clients_path, transactions_path
+
+
+def time_load(num_films, num_clients, num_transactions):
+    """
+    Measures the time needed to load the transactions file
+
+    :param num_films: integer
+    :param num_clients: integer
+    :param num_transactions: integer
+    :return: the time in seconds, float
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        films_path, clients_path, transactions_path = write_files(directory, num_films, num_clients, num_transactions)
+
+        film_repo = FilmFileRepository(films_path)
+        client_repo = ClientFileRepository(clients_path)
+        film_repo.size()  # the film and client files are loaded once, outside the measurement
+        client_repo.size()
+
+        tr_repo = TransactionFileRepository(transactions_path, film_repo, client_repo)
+
+        start = time.perf_counter()
+        size = tr_repo.size()
+        elapsed = time.perf_counter() - start
+
+        assert size == num_transactions
+
+    return elapsed
+
+
+def main():
+    """
+    Runs the benchmark and checks that the loading time grows linearly with the number of transactions
+    """
+    num_films = num_clients = 10000
+
+    results = []
+    for num_transactions in [25000, 50000, 100000]:
+        elapsed = time_load(num_films, num_clients, num_transactions)
+        results.append((num_transactions, elapsed))
+        print(f"{num_transactions:>7} transactions: {elapsed:.3f}s ({elapsed / num_transactions * 1e6:.2f} us/transaction)")
+
+    (n_small, t_small), (n_large, t_large) = results[0], results[-1]
+    growth = (t_large / t_small) / (n_large / n_small)
+    print(f"growth relative to linear: {growth:.2f}")
+    assert growth < 2, "loading the transactions is not linear"
+
+
+if __name__ == '__main__':
+    main()
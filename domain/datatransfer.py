@@ -7,17 +7,22 @@ class ClientDTO:
     """
     DTO for a client with a list of films rented
     """
-    def __init__(self, id, name):
+    __slots__ = ("__id", "__name", "__films", "__film_set", "__num_films")
+
+    def __init__(self, id, name, films=None, num_films=0):
         """
         Initializes the object
 
         :param id: integer
         :param name: string
+        :param films: list of distinct Film objects already rented - optional, by default empty
+        :param num_films: integer, the number of rents of those films - optional, by default 0
         """
         self.__id = id
         self.__name = name
-        self.__films = []
-        self.__num_films = 0
+        self.__films = [] if films is None else list(films)
+        self.__film_set = set(self.__films)  # the same films as in __films, for the duplicate check
+        self.__num_films = num_films
 
     def get_id(self):
         """
@@ -57,38 +62,50 @@ class ClientDTO:
 
         :param film: Film object
         """
-        if film not in self.__films:  # make sure we don't store duplicates
+        if film not in self.__film_set:  # make sure we don't store duplicates
             self.__films.append(film)
+            self.__film_set.add(film)
 
         self.__num_films += 1  # but count them to the total
 
+    def to_dict(self):
+        """
+        Gives the fields of the object as a dictionary (used by the exports)
+
+        :return: dictionary
+        """
+        return {"id": self.__id, "name": self.__name, "num_films": self.__num_films,
+                "films": [{"id": film.get_id(), "title": film.get_title()} for film in self.__films]}
+
     def __str__(self):
         """
         Gives the string representation for the object
 
         :return: string
         """
-        string = f"Id: {self.get_id()}, Nume: {self.get_name()} - {self.get_num_films()}:\n"
-        for film in self.get_films():
-            string += f"\tId: {film.get_id()}, Titlu: {film.get_title()}\n"
+        lines = [f"Id: {self.get_id()}, Nume: {self.get_name()} - {self.get_num_films()}:\n"]
+        lines.extend(f"\tId: {film.get_id()}, Titlu: {film.get_title()}\n" for film in self.__films)
 
-        return string
+        return "".join(lines)  # joined once, so the cost is linear in the number of films
 
 
 class FilmDTO:
     """
     DTO for a film with the number of transactions made with that film
     """
-    def __init__(self, id, title):
+    __slots__ = ("__id", "__title", "__count")
+
+    def __init__(self, id, title, count=0):
         """
         Initializes the object
 
         :param id: integer
         :param title: string
+        :param count: integer, the number of rents - optional, by default 0
         """
         self.__id = id
         self.__title = title
-        self.__count = 0
+        self.__count = count
 
     def get_id(self):
         """
@@ -120,6 +137,14 @@ class FilmDTO:
         """
         self.__count += 1
 
+    def to_dict(self):
+        """
+        Gives the fields of the object as a dictionary (used by the exports)
+
+        :return: dictionary
+        """
+        return {"id": self.__id, "title": self.__title, "num_rent": self.__count}
+
     def __str__(self):
         """
         Gives the string representation for the object
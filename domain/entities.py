@@ -12,6 +12,8 @@ class Film:
         id - integer
         title, description, genre - strings
     """
+    __slots__ = ("__id", "__title", "__description", "__genre")  # no per-instance __dict__, many instances are kept in memory
+
     def __init__(self, id, title, description, genre):
         """
         Constructor for Film class
@@ -89,6 +91,14 @@ class Film:
         """
         return self.get_id() == other.get_id()
 
+    def __hash__(self):
+        """
+        Computes the hash of the film from its id, consistent with the == operator
+
+        :return: the hash, integer
+        """
+        return hash(self.get_id())
+
     def __str__(self):
         """
         Builds the string representation for the current object
@@ -107,6 +117,8 @@ class Client:
         id, cnp - integers
         name - string
     """
+    __slots__ = ("__id", "__name", "__cnp")
+
     def __init__(self, id, name, cnp):
         """
         Constructor for Client class
@@ -167,6 +179,14 @@ class Client:
         """
         return self.get_id() == other.get_id()
 
+    def __hash__(self):
+        """
+        Computes the hash of the client from its id, consistent with the == operator
+
+        :return: the hash, integer
+        """
+        return hash(self.get_id())
+
     def __str__(self):
         """
         Builds the string representation of a Client object
@@ -189,6 +209,8 @@ class Transaction:
         date - datetime
         returned - boolean
     """
+    __slots__ = ("__id", "__film", "__client", "__date", "__returned")
+
     def __init__(self, id, film, client):
         """
         Constructor for Transaction
@@ -272,6 +294,15 @@ class Transaction:
         return self.get_id() == other.get_id() \
             and self.get_film() == other.get_film() and self.get_client() == other.get_client()
 
+    def __hash__(self):
+        """
+        Computes the hash of the transaction from the ids of the transaction, film and client,
+        the fields compared by the == operator (the returned flag and the date can change, so they are left out)
+
+        :return: the hash, integer
+        """
+        return hash((self.get_id(), self.get_film().get_id(), self.get_client().get_id()))
+
     def __str__(self):
         """
         Builds the string representation of a Transaction object
@@ -1,40 +1,74 @@
 """
 Scrieți o aplicație pentru o firmă de închiriere de filme.
 """
+import sys
+
 from repositories.client_file_repository import ClientFileRepository
 from repositories.client_repository import ClientRepository
 from repositories.film_file_repository import FilmFileRepository
+from repositories.sqlite_client_repository import SQLiteClientRepository
+from repositories.sqlite_database import SQLiteDatabase
+from repositories.sqlite_film_repository import SQLiteFilmRepository
+from repositories.sqlite_transaction_repository import SQLiteTransactionRepository
 from repositories.transaction_file_repository import TransactionFileRepository
 from repositories.transaction_repository import TransactionRepository
 from services.film_service import FilmService
 from services.client_service import ClientService
+from services.export_service import ExportService
 from services.transaction_service import TransactionService
 from domain.validators import FilmValidator, ClientValidator, TransactionValidator
 from repositories.film_repository import FilmRepository
 from ui.console import Console
 
 
-def run():
+def create_repositories(backend):
+    """
+    Creates the film, client and transaction repositories for the given storage backend
+
+    :param backend: string, one of "memory", "file" or "sqlite"
+    :return: a tuple (film_repo, client_repo, transaction_repo)
+    :raises ValueError: if the backend is unknown
+    """
+    if backend == "memory":
+        film_repo = FilmRepository()
+        client_repo = ClientRepository()
+        transaction_repo = TransactionRepository()
+    elif backend == "file":
+        film_repo = FilmFileRepository("films.txt", append_mode=True)
+        client_repo = ClientFileRepository("clients.txt", append_mode=True)
+        transaction_repo = TransactionFileRepository("transactions.txt", film_repo, client_repo, append_mode=True)
+    elif backend == "sqlite":
+        database = SQLiteDatabase("filme.db")  # one connection, so a unit of work spans the three repositories
+        film_repo = SQLiteFilmRepository(database)
+        client_repo = SQLiteClientRepository(database)
+        transaction_repo = SQLiteTransactionRepository(database)
+    else:
+        raise ValueError(f"Backend necunoscut: {backend}")
+
+    return film_repo, client_repo, transaction_repo
+
+
+def run(backend="file"):
     """
     Initializes the application
+
+    :param backend: string, the storage backend: "memory", "file" or "sqlite"
     """
-    # film_repo = FilmRepository()
-    film_repo = FilmFileRepository("films.txt")
+    film_repo, client_repo, transaction_repo = create_repositories(backend)
+
     film_valid = FilmValidator()
     film_srv = FilmService(film_repo, film_valid)
 
-    # client_repo = ClientRepository()
-    client_repo = ClientFileRepository("clients.txt")
     client_valid = ClientValidator()
     client_srv = ClientService(client_repo, client_valid)
 
-    # transaction_repo = TransactionRepository()
-    transaction_repo = TransactionFileRepository("transactions.txt", film_repo, client_repo)
     transaction_valid = TransactionValidator()
     transaction_srv = TransactionService(transaction_repo, transaction_valid, film_repo, client_repo)
 
-    ui = Console(film_srv, client_srv, transaction_srv)
+    export_srv = ExportService(transaction_srv)
+
+    ui = Console(film_srv, client_srv, transaction_srv, export_srv)
     ui.start()
 
 
-run()
+run(sys.argv[1] if len(sys.argv) > 1 else "file")
@@ -2,27 +2,49 @@
 Class definition of a Client File Repository
 """
 from domain.entities import Client
+from domain.exceptions import RepoException
 from repositories.client_repository import ClientRepository
+from utils.file_utils import get_file_signature, sync_file, FsyncPolicy
 
 
 class ClientFileRepository(ClientRepository):
     """
     Manages a list of Client instances and provides basic CRUD operations (with file I/O)
     """
-    def __init__(self, filename):
+    def __init__(self, filename, append_mode=False, fsync_policy=FsyncPolicy.NEVER):
         """
         Initializes a blank client file repository using the given file path
 
         :param filename: string
+        :param append_mode: boolean, if True add() appends only the new line instead of rewriting the file
+        :param fsync_policy: FsyncPolicy, when the written data is forced to the disk
         """
         super().__init__()
         self.__filename = filename
+        self.__append_mode = append_mode
+        self.__fsync_policy = fsync_policy
+        self.__loaded = False
+        self.__signature = None  # signature of the file at the last load/save
+        self.__load_count = 0
+        self.__avoided_load_count = 0
+        self.__write_count = 0
+        self.__batch_depth = 0  # number of nested units of work in progress
+        self.__pending = []  # objects added during the unit of work which still have to be appended
+        self.__dirty = False  # True if the whole file has to be rewritten at the end of the unit of work
+        self.__change_count = 0  # number of changes made to the objects
+        self.__savepoints = []  # (change_count, pending, dirty, snapshot) at the start of every unit of work in progress
 
     def __load_from_file(self):
         """
-        Loads the clients from the file into the _clients list
+        Loads the clients from the file into the repository
+
+        :raises RepoException: if several clients in the file have the same CNP (a file written before the CNPs were
+        unique), the file is loaded again on the next access
         """
-        self._clients = []
+        signature = get_file_signature(self.__filename)  # taken before reading, so a concurrent write triggers a reload
+        super().clear()
+        clients = []
+        ids_by_cnp = {}  # CNP -> ids of the clients with that CNP, to report the duplicates
         try:
             with open(self.__filename, "r") as fh:
                 for line in fh:
@@ -31,19 +53,117 @@ class ClientFileRepository(ClientRepository):
                     name = elements[1]
                     cnp = int(elements[2])
 
-                    client = Client(id, name, cnp)
-                    self._clients.append(client)
+                    clients.append(Client(id, name, cnp))
+                    ids_by_cnp.setdefault(cnp, []).append(id)
         except IOError:
-            return  # in case of file error, the _clients list will be empty
+            pass  # in case of file error, the repository will be empty
+
+        duplicates = {cnp: ids for cnp, ids in ids_by_cnp.items() if len(ids) > 1}
+        if duplicates:
+            details = "; ".join(f"{cnp} (clientii {', '.join(map(str, ids))})" for cnp, ids in duplicates.items())
+            raise RepoException(f"CNP-uri duplicate in fisierul {self.__filename}: {details}")
+
+        for client in clients:
+            super().add(client)
+
+        self.__signature = signature
+        self.__loaded = True
+        self.__load_count += 1
+
+    def __snapshot(self):
+        """
+        Saves the clients and their values, so a nested unit of work can be rolled back without touching the file
+
+        :return: a list of tuples (client, name, cnp)
+        """
+        return [(client, client.get_name(), client.get_cnp()) for client in self._clients.values()]
+
+    def __restore(self, snapshot):
+        """
+        Brings the clients back to the state saved by __snapshot
+
+        :param snapshot: a list of tuples (client, name, cnp)
+        """
+        super().clear()
+        for client, name, cnp in snapshot:
+            client.set_name(name)  # modify changes the stored objects in place
+            client.set_cnp(cnp)
+            super().add(client)
+
+    def __load_if_changed(self):
+        """
+        Loads the clients from the file only if the file changed since the last load or save
+        and no unit of work is in progress
+        """
+        if self.__batch_depth > 0 or (self.__loaded and get_file_signature(self.__filename) == self.__signature):
+            self.__avoided_load_count += 1  # a unit of work keeps its snapshot until the end
+            return
+
+        self.__load_from_file()
+
+    def __to_line(self, client):
+        """
+        Builds the line that stores the object in the file
+
+        :param client: Client object
+        :return: the line, a string
+        """
+        return f"{client.get_id()};{client.get_name()};{client.get_cnp()}\n"
 
     def __save_to_file(self):
         """
-        Saves the _clients list to the file
+        Saves the clients from the repository to the file
         """
         with open(self.__filename, "w") as fh:
-            for client in self._clients:
-                str_client = f"{client.get_id()};{client.get_name()};{client.get_cnp()}\n"
-                fh.write(str_client)
+            for client in self._clients.values():
+                fh.write(self.__to_line(client))
+            sync_file(fh, self.__fsync_policy)
+
+        self.__write_count += 1
+        self.__signature = get_file_signature(self.__filename)  # our own write must not trigger a reload
+        self.__loaded = True
+
+    def __append_to_file(self, clients):
+        """
+        Appends the given objects at the end of the file
+
+        :param clients: a list of Client objects
+        """
+        with open(self.__filename, "a") as fh:
+            for client in clients:
+                fh.write(self.__to_line(client))
+            sync_file(fh, self.__fsync_policy)
+
+        self.__write_count += 1
+        self.__signature = get_file_signature(self.__filename)  # our own write must not trigger a reload
+
+    def __persist_added(self, client):
+        """
+        Writes a newly added object to the file, appending it or rewriting the whole file depending on the mode
+
+        :param client: Client object
+        """
+        self.__change_count += 1
+        if self.__batch_depth > 0:
+            if self.__append_mode and not self.__dirty:
+                self.__pending.append(client)
+            else:
+                self.__dirty = True
+        elif self.__append_mode:
+            self.__append_to_file([client])
+        else:
+            self.__save_to_file()
+
+    def __persist_all(self):
+        """
+        Rewrites the whole file, or marks it to be rewritten at the end of the unit of work
+        """
+        self.__change_count += 1
+        if self.__batch_depth > 0:
+            self.__dirty = True
+            self.__pending = []  # the rewrite includes them
+        else:
+            self.__save_to_file()
 
     def size(self):
         """
@@ -51,7 +171,7 @@ class ClientFileRepository(ClientRepository):
 
         :return: size, an integer
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         return super().size()
 
     def add(self, client):
@@ -61,9 +181,9 @@ class ClientFileRepository(ClientRepository):
         :param client: Client object
         :raises RepoException: if an object with the same id is already stored in the repository
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         super().add(client)
-        self.__save_to_file()
+        self.__persist_added(client)
 
     def get_all(self):
         """
@@ -71,7 +191,7 @@ class ClientFileRepository(ClientRepository):
 
         :return: a list of all objects
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         return super().get_all()
 
     def find(self, id):
@@ -82,9 +202,30 @@ class ClientFileRepository(ClientRepository):
         :return: the found client
         :raises RepoException: if the id is invalid or the client with the given id doesn't exist
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         return super().find(id)
 
+    def find_by_cnp(self, cnp):
+        """
+        Finds a client by CNP from the repository
+
+        :param cnp: integer
+        :return: the found client
+        :raises RepoException: if the client with the given CNP doesn't exist
+        """
+        self.__load_if_changed()
+        return super().find_by_cnp(cnp)
+
+    def find_by_name(self, name):
+        """
+        Finds the clients in whose name every word of the given name starts a word, ignoring the case and the diacritics
+
+        :param name: string
+        :return: a list of clients, in the order they were added
+        """
+        self.__load_if_changed()
+        return super().find_by_name(name)
+
     def modify(self, client):
         """
         Modifies a client from the repository using another instance
@@ -92,9 +233,9 @@ class ClientFileRepository(ClientRepository):
         :param client: a Client object containing the new values, but with the same id
         :raises RepoException: if the id is invalid or the client with the given id doesn't exist
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         super().modify(client)
-        self.__save_to_file()
+        self.__persist_all()
 
     def delete(self, id):
         """
@@ -103,13 +244,112 @@ class ClientFileRepository(ClientRepository):
         :param id: an integer
         :raises RepoException: if the client identified by the id is not in the repository
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         super().delete(id)
-        self.__save_to_file()
+        self.__persist_all()
+
+    def compact(self):
+        """
+        Rewrites the whole file from the clients currently stored
+        """
+        self.__load_if_changed()
+        self.__persist_all()
+
+    def get_version(self):
+        """
+        Gets the version of the data, which changes every time the repository is changed (also from the file)
+
+        :return: version, integer
+        """
+        self.__load_if_changed()
+        return super().get_version()
+
+    def begin(self):
+        """
+        Starts a unit of work: until the matching commit, the file is neither reloaded nor written
+        """
+        if self.__batch_depth == 0:
+            self.__load_if_changed()
+            snapshot = None  # the outermost unit of work is rolled back by reloading the file
+        else:
+            snapshot = self.__snapshot()
+
+        self.__batch_depth += 1
+        self.__savepoints.append((self.__change_count, list(self.__pending), self.__dirty, snapshot))
+
+    def commit(self):
+        """
+        Ends a unit of work, writing the buffered changes to the file once when the outermost unit of work ends
+        """
+        self.__batch_depth -= 1
+        self.__savepoints.pop()
+        if self.__batch_depth > 0:
+            return
+
+        try:
+            if self.__dirty:
+                self.__save_to_file()
+            elif self.__pending:
+                self.__append_to_file(self.__pending)
+        except IOError:
+            self.__loaded = False  # the changes didn't reach the file, the next access reloads the clients from it
+            raise
+        finally:
+            self.__pending = []
+            self.__dirty = False
+
+    def rollback(self):
+        """
+        Abandons a unit of work, discarding the changes made since its start: the outermost unit of work reloads
+        the clients from the file, a nested one restores the state saved when it started (the outer changes are kept)
+        """
+        self.__batch_depth -= 1
+        change_count, pending, dirty, snapshot = self.__savepoints.pop()
+        if change_count == self.__change_count:  # nothing to discard
+            return
+
+        if snapshot is None:
+            self.__pending = []
+            self.__dirty = False
+            self.__load_from_file()
+        else:
+            self.__pending = pending
+            self.__dirty = dirty
+            self.__restore(snapshot)
+
+    def refresh(self):
+        """
+        Forces the repository to reload the clients from the file
+        """
+        self.__load_from_file()
+
+    def get_load_count(self):
+        """
+        Getter for the number of times the file was loaded
+
+        :return: load_count, integer
+        """
+        return self.__load_count
+
+    def get_avoided_load_count(self):
+        """
+        Getter for the number of loads avoided because the file didn't change
+
+        :return: avoided_load_count, integer
+        """
+        return self.__avoided_load_count
+
+    def get_write_count(self):
+        """
+        Getter for the number of times the file was written (rewritten or appended to)
+
+        :return: write_count, integer
+        """
+        return self.__write_count
 
     def clear(self):
         """
         Clears the repository
         """
         super().clear()
-        self.__save_to_file()
+        self.__persist_all()
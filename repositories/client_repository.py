@@ -2,6 +2,7 @@
 Class definition of a Client Repository
 """
 from domain.exceptions import RepoException
+from utils.token_index import TokenIndex
 
 
 class ClientRepository:
@@ -12,7 +13,11 @@ class ClientRepository:
         """
         Initializes a blank list of clients in the repository
         """
-        self._clients = []
+        self._clients = {}  # id -> Client object, kept in insertion order
+        self.__all = []  # the clients as a list, rebuilt lazily after a deletion
+        self.__version = 0  # incremented on every change of the repository
+        self.__by_cnp = {}  # CNP as a string -> Client object
+        self.__name_index = None  # TokenIndex id -> name, for the searches by name, built on the first search
 
     def size(self):
         """
@@ -27,12 +32,20 @@ class ClientRepository:
         Adds a Client object to the repository
 
         :param client: Client object
-        :raises RepoException: if an object with the same id is already stored in the repository
+        :raises RepoException: if an object with the same id or the same CNP is already stored in the repository
         """
-        if client in self._clients:
+        if client.get_id() in self._clients:
             raise RepoException("Id existent")
+        if str(client.get_cnp()) in self.__by_cnp:
+            raise RepoException("CNP existent")
 
-        self._clients.append(client)
+        self._clients[client.get_id()] = client
+        self.__by_cnp[str(client.get_cnp())] = client
+        if self.__name_index is not None:
+            self.__name_index.add(client.get_id(), client.get_name())
+        self.__version += 1
+        if self.__all is not None:
+            self.__all.append(client)
 
     def get_all(self):
         """
@@ -40,7 +53,10 @@ class ClientRepository:
 
         :return: a list of all objects
         """
-        return self._clients
+        if self.__all is None:
+            self.__all = list(self._clients.values())
+
+        return self.__all
 
     def find(self, id):
         """
@@ -50,15 +66,46 @@ class ClientRepository:
         :return: the found client
         :raises RepoException: if the id is invalid or the client with the given id doesn't exist
         """
-        found = False
+        if id not in self._clients:
+            raise RepoException("Id invalid")
 
-        for client in self._clients:
-            if client.get_id() == id:
-                found = True
-                return client
+        return self._clients[id]
 
-        if not found:
-            raise RepoException("Id invalid")
+    def find_by_cnp(self, cnp):
+        """
+        Finds a client by CNP from the repository
+
+        :param cnp: integer
+        :return: the found client
+        :raises RepoException: if the client with the given CNP doesn't exist
+        """
+        cnp = str(cnp)
+        if cnp not in self.__by_cnp:
+            raise RepoException("CNP invalid")
+
+        return self.__by_cnp[cnp]
+
+    def __get_name_index(self):
+        """
+        Gets the index of the names, building it with a single sort on the first search, so loading the clients
+        doesn't pay for it
+
+        :return: TokenIndex
+        """
+        if self.__name_index is None:
+            self.__name_index = TokenIndex()
+            self.__name_index.add_all((client.get_id(), client.get_name()) for client in self._clients.values())
+
+        return self.__name_index
+
+    def find_by_name(self, name):
+        """
+        Finds the clients in whose name every word of the given name starts a word, ignoring the case and the diacritics
+
+        :param name: string
+        :return: a list of clients, in the order they were added
+        """
+        return [self._clients[id] for id in self.__get_name_index().search(name)]
 
     def modify(self, client):
         """
@@ -66,11 +113,22 @@ class ClientRepository:
 
         :param client: a Client object containing the new values, but with the same id
         :raises RepoException: if the id is invalid or the cient with the given id doesn't exist
+            or another client has the same CNP
         """
         found_client = self.find(client.get_id())
 
+        cnp = str(client.get_cnp())
+        if self.__by_cnp.get(cnp, found_client) is not found_client:
+            raise RepoException("CNP existent")
+
+        del self.__by_cnp[str(found_client.get_cnp())]
+        self.__by_cnp[cnp] = found_client
+
         found_client.set_name(client.get_name())
         found_client.set_cnp(client.get_cnp())
+        if self.__name_index is not None:
+            self.__name_index.add(client.get_id(), client.get_name())
+        self.__version += 1
 
     def delete(self, id):
         """
@@ -79,19 +137,48 @@ class ClientRepository:
         :param id: an integer
         :raises RepoException: if the client identified by the id is not in the repository
         """
-        found = False
-
-        for i in range(0, self.size()):  # search for the film identified by id
-            if self._clients[i].get_id() == id:
-                found = True
-                del self._clients[i]  # if found, delete it from the list
-                return  # no need to iterate further
-
-        if not found:
+        if id not in self._clients:
             raise RepoException("Id invalid")
 
+        del self.__by_cnp[str(self._clients[id].get_cnp())]
+        del self._clients[id]
+        if self.__name_index is not None:
+            self.__name_index.remove(id)
+        self.__version += 1
+        self.__all = None  # the list is rebuilt on the next get_all
+
     def clear(self):
         """
         Clears the repository
         """
         self._clients.clear()
+        self.__by_cnp.clear()
+        self.__name_index = None
+        self.__all = []
+        self.__version += 1
+
+    def get_version(self):
+        """
+        Gets the version of the data, which changes every time the repository is changed
+
+        :return: version, integer
+        """
+        return self.__version
+
+    def begin(self):
+        """
+        Starts a unit of work (the in-memory repository has nothing to persist, so it does nothing)
+        """
+        pass
+
+    def commit(self):
+        """
+        Ends a unit of work (the in-memory repository has nothing to persist, so it does nothing)
+        """
+        pass
+
+    def rollback(self):
+        """
+        Abandons a unit of work (the in-memory repository doesn't keep the previous state, so it does nothing)
+        """
+        pass
@@ -3,26 +3,42 @@ Class definition of a Film File Repository
 """
 from domain.entities import Film
 from repositories.film_repository import FilmRepository
+from utils.file_utils import get_file_signature, sync_file, FsyncPolicy
 
 
 class FilmFileRepository(FilmRepository):
     """
     Manages a list of Film instances and provides basic CRUD operations (with file I/O)
     """
-    def __init__(self, filename):
+    def __init__(self, filename, append_mode=False, fsync_policy=FsyncPolicy.NEVER):
         """
         Initializes a blank film file repository using the given file path
 
         :param filename: string
+        :param append_mode: boolean, if True add() appends only the new line instead of rewriting the file
+        :param fsync_policy: FsyncPolicy, when the written data is forced to the disk
         """
         super().__init__()
         self.__filename = filename
+        self.__append_mode = append_mode
+        self.__fsync_policy = fsync_policy
+        self.__loaded = False
+        self.__signature = None  # signature of the file at the last load/save
+        self.__load_count = 0
+        self.__avoided_load_count = 0
+        self.__write_count = 0
+        self.__batch_depth = 0  # number of nested units of work in progress
+        self.__pending = []  # objects added during the unit of work which still have to be appended
+        self.__dirty = False  # True if the whole file has to be rewritten at the end of the unit of work
+        self.__change_count = 0  # number of changes made to the objects
+        self.__savepoints = []  # (change_count, pending, dirty, snapshot) at the start of every unit of work in progress
 
     def __load_from_file(self):
         """
-        Loads the films from the file into the _films list
+        Loads the films from the file into the repository
         """
-        self._films = []
+        signature = get_file_signature(self.__filename)  # taken before reading, so a concurrent write triggers a reload
+        super().clear()
         try:
             with open(self.__filename, "r") as fh:
                 for line in fh:
@@ -33,18 +49,109 @@ class FilmFileRepository(FilmRepository):
                     genre = elements[3]
 
                     film = Film(id, title, description, genre)
-                    self._films.append(film)
+                    super().add(film)
         except IOError:
-            return  # in case of file error, the _films list will be empty
+            pass  # in case of file error, the repository will be empty
+
+        self.__signature = signature
+        self.__loaded = True
+        self.__load_count += 1
+
+    def __snapshot(self):
+        """
+        Saves the films and their values, so a nested unit of work can be rolled back without touching the file
+
+        :return: a list of tuples (film, title, description, genre)
+        """
+        return [(film, film.get_title(), film.get_description(), film.get_genre()) for film in self._films.values()]
+
+    def __restore(self, snapshot):
+        """
+        Brings the films back to the state saved by __snapshot
+
+        :param snapshot: a list of tuples (film, title, description, genre)
+        """
+        super().clear()
+        for film, title, description, genre in snapshot:
+            film.set_title(title)  # modify changes the stored objects in place
+            film.set_description(description)
+            film.set_genre(genre)
+            super().add(film)
+
+    def __load_if_changed(self):
+        """
+        Loads the films from the file only if the file changed since the last load or save
+        and no unit of work is in progress
+        """
+        if self.__batch_depth > 0 or (self.__loaded and get_file_signature(self.__filename) == self.__signature):
+            self.__avoided_load_count += 1  # a unit of work keeps its snapshot until the end
+            return
+
+        self.__load_from_file()
+
+    def __to_line(self, film):
+        """
+        Builds the line that stores the object in the file
+
+        :param film: Film object
+        :return: the line, a string
+        """
+        return f"{film.get_id()};{film.get_title()};{film.get_description()};{film.get_genre()}\n"
 
     def __save_to_file(self):
         """
-        Saves the _films list to the file
+        Saves the films from the repository to the file
         """
         with open(self.__filename, "w") as fh:
-            for film in self._films:
-                str_film = f"{film.get_id()};{film.get_title()};{film.get_description()};{film.get_genre()}\n"
-                fh.write(str_film)
+            for film in self._films.values():
+                fh.write(self.__to_line(film))
+            sync_file(fh, self.__fsync_policy)
+
+        self.__write_count += 1
+        self.__signature = get_file_signature(self.__filename)  # our own write must not trigger a reload
+        self.__loaded = True
+
+    def __append_to_file(self, films):
+        """
+        Appends the given objects at the end of the file
+
+        :param films: a list of Film objects
+        """
+        with open(self.__filename, "a") as fh:
+            for film in films:
+                fh.write(self.__to_line(film))
+            sync_file(fh, self.__fsync_policy)
+
+        self.__write_count += 1
+        self.__signature = get_file_signature(self.__filename)  # our own write must not trigger a reload
+
+    def __persist_added(self, film):
+        """
+        Writes a newly added object to the file, appending it or rewriting the whole file depending on the mode
+
+        :param film: Film object
+        """
+        self.__change_count += 1
+        if self.__batch_depth > 0:
+            if self.__append_mode and not self.__dirty:
+                self.__pending.append(film)
+            else:
+                self.__dirty = True
+        elif self.__append_mode:
+            self.__append_to_file([film])
+        else:
+            self.__save_to_file()
+
+    def __persist_all(self):
+        """
+        Rewrites the whole file, or marks it to be rewritten at the end of the unit of work
+        """
+        self.__change_count += 1
+        if self.__batch_depth > 0:
+            self.__dirty = True
+            self.__pending = []  # the rewrite includes them
+        else:
+            self.__save_to_file()
 
     def add(self, film):
         """
@@ -53,9 +160,9 @@ class FilmFileRepository(FilmRepository):
         :param film: Film object
         :raises RepoException: if there is another Film object with the same id in the repository
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         super().add(film)
-        self.__save_to_file()
+        self.__persist_added(film)
 
     def find(self, id):
         """
@@ -65,7 +172,7 @@ class FilmFileRepository(FilmRepository):
         :return: the found film
         :raises RepoException: if the id is invalid or the film with the given id doesn't exist
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         return super().find(id)
 
     def modify(self, film):
@@ -75,9 +182,9 @@ class FilmFileRepository(FilmRepository):
         :param film: a Film object containing the new values, but with the same id
         :raises RepoException: if the id is invalid or the film with the given id doesn't exist
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         super().modify(film)
-        self.__save_to_file()
+        self.__persist_all()
 
     def get_all(self):
         """
@@ -85,9 +192,40 @@ class FilmFileRepository(FilmRepository):
 
         :return: a list of all objects
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         return super().get_all()
 
+    def find_by_title(self, title):
+        """
+        Finds the films whose title contains the given string
+
+        :param title: string
+        :return: a list of films, in the order they were added
+        """
+        self.__load_if_changed()
+        return super().find_by_title(title)
+
+    def find_by_title_prefix(self, prefix):
+        """
+        Finds the films whose title starts with the given prefix
+
+        :param prefix: string
+        :return: a list of films, in the order they were added
+        """
+        self.__load_if_changed()
+        return super().find_by_title_prefix(prefix)
+
+    def find_by_title_fuzzy(self, title, max_distance):
+        """
+        Finds the films whose title is at most max_distance edits away from the given string, ignoring the case
+
+        :param title: string
+        :param max_distance: integer
+        :return: a list of films, the closest first and in the order they were added for the same distance
+        """
+        self.__load_if_changed()
+        return super().find_by_title_fuzzy(title, max_distance)
+
     def delete(self, id):
         """
         Deletes the film with the id provided from the repository
@@ -95,9 +233,9 @@ class FilmFileRepository(FilmRepository):
         :param id: an integer
         :raises RepoException: if the film identified by the id is not in the repository
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         super().delete(id)
-        self.__save_to_file()
+        self.__persist_all()
 
     def size(self):
         """
@@ -105,12 +243,111 @@ class FilmFileRepository(FilmRepository):
 
         :return: that number
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         return super().size()
 
+    def compact(self):
+        """
+        Rewrites the whole file from the films currently stored
+        """
+        self.__load_if_changed()
+        self.__persist_all()
+
+    def get_version(self):
+        """
+        Gets the version of the data, which changes every time the repository is changed (also from the file)
+
+        :return: version, integer
+        """
+        self.__load_if_changed()
+        return super().get_version()
+
+    def begin(self):
+        """
+        Starts a unit of work: until the matching commit, the file is neither reloaded nor written
+        """
+        if self.__batch_depth == 0:
+            self.__load_if_changed()
+            snapshot = None  # the outermost unit of work is rolled back by reloading the file
+        else:
+            snapshot = self.__snapshot()
+
+        self.__batch_depth += 1
+        self.__savepoints.append((self.__change_count, list(self.__pending), self.__dirty, snapshot))
+
+    def commit(self):
+        """
+        Ends a unit of work, writing the buffered changes to the file once when the outermost unit of work ends
+        """
+        self.__batch_depth -= 1
+        self.__savepoints.pop()
+        if self.__batch_depth > 0:
+            return
+
+        try:
+            if self.__dirty:
+                self.__save_to_file()
+            elif self.__pending:
+                self.__append_to_file(self.__pending)
+        except IOError:
+            self.__loaded = False  # the changes didn't reach the file, the next access reloads the films from it
+            raise
+        finally:
+            self.__pending = []
+            self.__dirty = False
+
+    def rollback(self):
+        """
+        Abandons a unit of work, discarding the changes made since its start: the outermost unit of work reloads
+        the films from the file, a nested one restores the state saved when it started (the outer changes are kept)
+        """
+        self.__batch_depth -= 1
+        change_count, pending, dirty, snapshot = self.__savepoints.pop()
+        if change_count == self.__change_count:  # nothing to discard
+            return
+
+        if snapshot is None:
+            self.__pending = []
+            self.__dirty = False
+            self.__load_from_file()
+        else:
+            self.__pending = pending
+            self.__dirty = dirty
+            self.__restore(snapshot)
+
+    def refresh(self):
+        """
+        Forces the repository to reload the films from the file
+        """
+        self.__load_from_file()
+
+    def get_load_count(self):
+        """
+        Getter for the number of times the file was loaded
+
+        :return: load_count, integer
+        """
+        return self.__load_count
+
+    def get_avoided_load_count(self):
+        """
+        Getter for the number of loads avoided because the file didn't change
+
+        :return: avoided_load_count, integer
+        """
+        return self.__avoided_load_count
+
+    def get_write_count(self):
+        """
+        Getter for the number of times the file was written (rewritten or appended to)
+
+        :return: write_count, integer
+        """
+        return self.__write_count
+
     def clear(self):
         """
         Clears the repository
         """
         super().clear()
-        self.__save_to_file()
+        self.__persist_all()
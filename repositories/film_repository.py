@@ -2,6 +2,9 @@
 Class definition of a Film repository
 """
 from domain.exceptions import RepoException
+from utils.edit_distance import bounded_levenshtein
+from utils.ngram_index import NgramIndex
+from utils.prefix_index import PrefixIndex
 
 
 class FilmRepository:
@@ -12,7 +15,11 @@ class FilmRepository:
         """
         Initializes a blank list of films in the repository
         """
-        self._films = []
+        self._films = {}  # id -> Film object, kept in insertion order
+        self.__all = []  # the films as a list, rebuilt lazily after a deletion
+        self.__version = 0  # incremented on every change of the repository
+        self.__title_index = None  # NgramIndex id -> case-folded title, for both title searches, built on the first search
+        self.__prefix_index = None  # PrefixIndex id -> title, for the searches by prefix, built on the first search
 
     def add(self, film):
         """
@@ -21,10 +28,17 @@ class FilmRepository:
         :param film: Film object
         :raises RepoException: if there is another Film object with the same id in the repository
         """
-        if film in self._films:
+        if film.get_id() in self._films:
             raise RepoException("Id existent")
 
-        self._films.append(film)
+        self._films[film.get_id()] = film
+        if self.__title_index is not None:
+            self.__title_index.add(film.get_id(), film.get_title().casefold())
+        if self.__prefix_index is not None:
+            self.__prefix_index.add(film.get_id(), film.get_title())
+        self.__version += 1
+        if self.__all is not None:
+            self.__all.append(film)
 
     def find(self, id):
         """
@@ -34,15 +48,11 @@ class FilmRepository:
         :return: the found film
         :raises RepoException: if the id is invalid or the film with the given id doesn't exist
         """
-        found = False
-        for film in self._films:
-            if film.get_id() == id:
-                found = True
-                return film
-
-        if not found:
+        if id not in self._films:
             raise RepoException("Id invalid")
 
+        return self._films[id]
+
     def modify(self, film):
         """
         Modifies a film from the repository using another instance
@@ -55,6 +65,11 @@ class FilmRepository:
         found_film.set_title(film.get_title())
         found_film.set_description(film.get_description())
         found_film.set_genre(film.get_genre())
+        if self.__title_index is not None:
+            self.__title_index.add(film.get_id(), film.get_title().casefold())
+        if self.__prefix_index is not None:
+            self.__prefix_index.add(film.get_id(), film.get_title())
+        self.__version += 1
 
     def get_all(self):
         """
@@ -62,7 +77,76 @@ class FilmRepository:
 
         :return: a list of all objects
         """
-        return self._films
+        if self.__all is None:
+            self.__all = list(self._films.values())
+
+        return self.__all
+
+    def __get_title_index(self):
+        """
+        Gets the index of the case-folded titles, building it on the first search, so loading the films doesn't pay
+        for it; it is padded, so even the short titles have enough trigrams for the searches by similar titles
+
+        :return: NgramIndex
+        """
+        if self.__title_index is None:
+            self.__title_index = NgramIndex(padded=True)
+            for film in self._films.values():
+                self.__title_index.add(film.get_id(), film.get_title().casefold())
+
+        return self.__title_index
+
+    def find_by_title(self, title):
+        """
+        Finds the films whose title contains the given string
+
+        :param title: string
+        :return: a list of films, in the order they were added
+        """
+        # a title which contains the string also contains it after case folding, so the index gives all the candidates
+        candidates = self.__get_title_index().search(title.casefold())
+
+        return [self._films[id] for id in candidates if title in self._films[id].get_title()]
+
+    def __get_prefix_index(self):
+        """
+        Gets the sorted index of the titles, building it with a single sort on the first search
+
+        :return: PrefixIndex
+        """
+        if self.__prefix_index is None:
+            self.__prefix_index = PrefixIndex()
+            self.__prefix_index.add_all((film.get_id(), film.get_title()) for film in self._films.values())
+
+        return self.__prefix_index
+
+    def find_by_title_prefix(self, prefix):
+        """
+        Finds the films whose title starts with the given prefix
+
+        :param prefix: string
+        :return: a list of films, in the order they were added
+        """
+        return [self._films[id] for id in self.__get_prefix_index().search(prefix)]
+
+    def find_by_title_fuzzy(self, title, max_distance):
+        """
+        Finds the films whose title is at most max_distance edits (insertions, deletions, substitutions) away from the
+        given string, ignoring the case; only the titles which share enough trigrams with it are compared
+
+        :param title: string
+        :param max_distance: integer
+        :return: a list of films, the closest first and in the order they were added for the same distance
+        """
+        query = title.casefold()
+        matches = []
+        for id in self.__get_title_index().search_similar(query, max_distance):
+            distance = bounded_levenshtein(query, self._films[id].get_title().casefold(), max_distance)
+            if distance <= max_distance:
+                matches.append((distance, id))
+        matches.sort(key=lambda match: match[0])  # stable, the candidates are in insertion order
+
+        return [self._films[id] for distance, id in matches]
 
     def delete(self, id):
         """
@@ -71,17 +155,17 @@ class FilmRepository:
         :param id: an integer
         :raises RepoException: if the film identified by the id is not in the repository
         """
-        found = False
-
-        for i in range(0, self.size()):  # search for the film identified by id
-            if self._films[i].get_id() == id:
-                found = True
-                del self._films[i]  # if found, delete it from the list
-                return  # no need to iterate further
-
-        if not found:
+        if id not in self._films:
             raise RepoException("Id invalid")
 
+        del self._films[id]
+        if self.__title_index is not None:
+            self.__title_index.remove(id)
+        if self.__prefix_index is not None:
+            self.__prefix_index.remove(id)
+        self.__version += 1
+        self.__all = None  # the list is rebuilt on the next get_all
+
     def size(self):
         """
         Computes the number of objects in the repository
@@ -95,3 +179,33 @@ class FilmRepository:
         Clears the repository
         """
         self._films.clear()
+        self.__title_index = None
+        self.__prefix_index = None
+        self.__all = []
+        self.__version += 1
+
+    def get_version(self):
+        """
+        Gets the version of the data, which changes every time the repository is changed
+
+        :return: version, integer
+        """
+        return self.__version
+
+    def begin(self):
+        """
+        Starts a unit of work (the in-memory repository has nothing to persist, so it does nothing)
+        """
+        pass
+
+    def commit(self):
+        """
+        Ends a unit of work (the in-memory repository has nothing to persist, so it does nothing)
+        """
+        pass
+
+    def rollback(self):
+        """
+        Abandons a unit of work (the in-memory repository doesn't keep the previous state, so it does nothing)
+        """
+        pass
@@ -0,0 +1,229 @@
+"""
+Class definition of a Client SQLite Repository
+"""
+import sqlite3
+
+from domain.entities import Client
+from domain.exceptions import RepoException
+from utils.token_index import TokenIndex
+
+
+class SQLiteClientRepository:
+    """
+    Manages the Client instances stored in a SQLite database and provides basic CRUD operations
+    """
+    def __init__(self, database):
+        """
+        Initializes the client repository using the given database
+
+        :param database: SQLiteDatabase object, shared with the other SQLite repositories
+        """
+        self.__database = database
+        self.__version = 0  # incremented on every change made through this repository
+        self.__name_index = None  # TokenIndex id -> name, for the searches by name
+        self.__name_index_version = None  # the version of the clients the index was built from, None if not built
+
+    @staticmethod
+    def __to_client(row):
+        """
+        Builds a Client object from a row of the clients table
+
+        :param row: a tuple (id, name, cnp)
+        :return: Client object
+        """
+        return Client(row[0], row[1], row[2])
+
+    def size(self):
+        """
+        Computes the size of the repository (number of clients stored)
+
+        :return: size, an integer
+        """
+        return self.__database.execute("SELECT COUNT(*) FROM clients").fetchone()[0]
+
+    def __is_index_current(self):
+        """
+        Checks if the index of the names was built and no client was changed since then
+
+        :return: True if the index can be used or updated, False otherwise
+        """
+        return self.__name_index_version is not None and self.__name_index_version == self.get_version()
+
+    def __get_name_index(self):
+        """
+        Gets the index of the names, building it again from the table with a single sort on the first search
+        and after the clients were changed elsewhere (through other connections or by a rollback)
+
+        :return: TokenIndex
+        """
+        if not self.__is_index_current():
+            self.__name_index = TokenIndex()
+            self.__name_index.add_all(self.__database.execute("SELECT id, name FROM clients ORDER BY seq"))
+            self.__name_index_version = self.get_version()
+
+        return self.__name_index
+
+    def add(self, client):
+        """
+        Adds a Client object to the repository
+
+        :param client: Client object
+        :raises RepoException: if an object with the same id or the same CNP is already stored in the repository
+        """
+        index_current = self.__is_index_current()
+        try:
+            self.__database.execute("INSERT INTO clients (id, name, cnp) VALUES (?, ?, ?)",
+                                    (client.get_id(), client.get_name(), client.get_cnp()))
+        except sqlite3.IntegrityError:
+            id_exists = self.__database.execute("SELECT 1 FROM clients WHERE id = ?", (client.get_id(),)).fetchone()
+            raise RepoException("Id existent" if id_exists else "CNP existent")  # the id is checked first, as in the other repositories
+
+        self.__version += 1
+        if index_current:
+            self.__name_index.add(client.get_id(), client.get_name())
+            self.__name_index_version = self.get_version()
+        self.__database.commit_if_needed()
+
+    def get_all(self):
+        """
+        Provides access to all the objects in the repository
+
+        :return: a list of all objects
+        """
+        rows = self.__database.execute("SELECT id, name, cnp FROM clients ORDER BY seq")
+
+        return [self.__to_client(row) for row in rows]
+
+    def find(self, id):
+        """
+        Finds a client by id from the repository
+
+        :param id: an integer
+        :return: the found client
+        :raises RepoException: if the id is invalid or the client with the given id doesn't exist
+        """
+        row = self.__database.execute("SELECT id, name, cnp FROM clients WHERE id = ?", (id,)).fetchone()
+        if row is None:
+            raise RepoException("Id invalid")
+
+        return self.__to_client(row)
+
+    def find_by_cnp(self, cnp):
+        """
+        Finds a client by CNP from the repository
+
+        :param cnp: integer
+        :return: the found client
+        :raises RepoException: if the client with the given CNP doesn't exist
+        """
+        row = self.__database.execute("SELECT id, name, cnp FROM clients WHERE cnp = ?", (cnp,)).fetchone()
+        if row is None:
+            raise RepoException("CNP invalid")
+
+        return self.__to_client(row)
+
+    def find_by_name(self, name):
+        """
+        Finds the clients in whose name every word of the given name starts a word, ignoring the case and the diacritics
+        (the normalization is not available in SQL, so the index of the names is kept in memory)
+
+        :param name: string
+        :return: a list of clients, in the order they were added
+        """
+        ids = self.__get_name_index().search(name)
+        clients = {}
+        for i in range(0, len(ids), 500):  # the matching rows are read in chunks, under the limit of the parameters
+            chunk = ids[i:i + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self.__database.execute(f"SELECT id, name, cnp FROM clients WHERE id IN ({placeholders})", chunk)
+            for row in rows:
+                clients[row[0]] = self.__to_client(row)
+
+        return [clients[id] for id in ids]
+
+    def modify(self, client):
+        """
+        Modifies a client from the repository using another instance
+
+        :param client: a Client object containing the new values, but with the same id
+        :raises RepoException: if the id is invalid or the client with the given id doesn't exist
+            or another client has the same CNP
+        """
+        index_current = self.__is_index_current()
+        try:
+            cursor = self.__database.execute("UPDATE clients SET name = ?, cnp = ? WHERE id = ?",
+                                             (client.get_name(), client.get_cnp(), client.get_id()))
+        except sqlite3.IntegrityError:
+            raise RepoException("CNP existent")
+        if cursor.rowcount == 0:
+            raise RepoException("Id invalid")
+
+        self.__version += 1
+        if index_current:
+            self.__name_index.add(client.get_id(), client.get_name())
+            self.__name_index_version = self.get_version()
+        self.__database.commit_if_needed()
+
+    def delete(self, id):
+        """
+        Deletes the client with the id provided from the repository
+
+        :param id: an integer
+        :raises RepoException: if the client identified by the id is not in the repository
+        """
+        index_current = self.__is_index_current()
+        cursor = self.__database.execute("DELETE FROM clients WHERE id = ?", (id,))
+        if cursor.rowcount == 0:
+            raise RepoException("Id invalid")
+
+        self.__version += 1
+        if index_current:
+            self.__name_index.remove(id)
+            self.__name_index_version = self.get_version()
+        self.__database.commit_if_needed()
+
+    def clear(self):
+        """
+        Clears the repository
+        """
+        self.__database.execute("DELETE FROM clients")
+        self.__version += 1
+        self.__name_index = None
+        self.__name_index_version = None
+        self.__database.commit_if_needed()
+
+    def get_version(self):
+        """
+        Gets the version of the data, which changes every time the clients are changed,
+        through this repository or through other connections to the database
+
+        :return: version, integer
+        """
+        data_version = self.__database.execute("PRAGMA data_version").fetchone()[0]  # changed by the other connections
+
+        return self.__version + data_version
+
+    def begin(self):
+        """
+        Starts a unit of work: the changes are committed to the database by the matching commit
+        """
+        self.__database.begin()
+
+    def commit(self):
+        """
+        Ends a unit of work, committing the changes when the outermost unit of work ends
+        """
+        self.__database.commit()
+
+    def rollback(self):
+        """
+        Abandons a unit of work, discarding its uncommitted changes (the changes of the outer units of work are kept)
+        """
+        self.__database.rollback()
+        self.__version += 1  # the discarded changes were already counted
+
+    def close(self):
+        """
+        Closes the connection to the database (shared with the other repositories using the same database)
+        """
+        self.__database.close()
@@ -0,0 +1,166 @@
+"""
+Schema of the SQLite database used by the SQLite repositories
+"""
+import sqlite3
+
+from domain.exceptions import RepoException
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS films (
+    seq INTEGER PRIMARY KEY,
+    id INTEGER NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    genre TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS clients (
+    seq INTEGER PRIMARY KEY,
+    id INTEGER NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    cnp INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS transactions (
+    seq INTEGER PRIMARY KEY,
+    id INTEGER NOT NULL,
+    film_id INTEGER NOT NULL,
+    client_id INTEGER NOT NULL,
+    returned INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    UNIQUE (id, film_id, client_id)
+);
+
+CREATE INDEX IF NOT EXISTS films_title ON films (title);
+
+CREATE INDEX IF NOT EXISTS transactions_film_id ON transactions (film_id, returned);
+CREATE INDEX IF NOT EXISTS transactions_client_id ON transactions (client_id);
+CREATE INDEX IF NOT EXISTS transactions_returned ON transactions (returned);
+CREATE INDEX IF NOT EXISTS transactions_open ON transactions (film_id, client_id, returned);
+"""
+
+# created separately, after checking that a database from before the index doesn't have duplicate CNPs
+CLIENTS_CNP_INDEX = "CREATE UNIQUE INDEX clients_cnp ON clients (cnp)"
+
+
+def find_duplicate_cnps(connection):
+    """
+    Finds the CNPs shared by several clients
+
+    :param connection: sqlite3.Connection object
+    :return: a dictionary cnp -> list of the ids of the clients with that CNP, in the order they were added
+    """
+    rows = connection.execute("SELECT cnp, id FROM clients WHERE cnp IN "
+                              "(SELECT cnp FROM clients GROUP BY cnp HAVING count(*) > 1) ORDER BY cnp, seq")
+    duplicates = {}
+    for cnp, id in rows:
+        duplicates.setdefault(cnp, []).append(id)
+
+    return duplicates
+
+
+def create_cnp_index(connection):
+    """
+    Creates the unique index of the clients by CNP, if it doesn't exist
+
+    :param connection: sqlite3.Connection object
+    :raises RepoException: if several clients have the same CNP, so the index can't be created
+    """
+    if connection.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'clients_cnp'").fetchone():
+        return
+
+    duplicates = find_duplicate_cnps(connection)
+    if duplicates:
+        details = "; ".join(f"{cnp} (clientii {', '.join(map(str, ids))})" for cnp, ids in duplicates.items())
+        raise RepoException(f"CNP-uri duplicate in baza de date: {details}")
+
+    connection.execute(CLIENTS_CNP_INDEX)
+    connection.commit()
+
+
+def connect(filename):
+    """
+    Opens a connection to the database stored in the given file, creating the tables if needed
+
+    :param filename: string
+    :return: sqlite3.Connection object
+    :raises RepoException: if several clients have the same CNP (in a database created before the CNPs were unique)
+    """
+    connection = sqlite3.connect(filename)
+    connection.executescript(SCHEMA)
+    try:
+        create_cnp_index(connection)
+    except RepoException:
+        connection.close()
+        raise
+
+    return connection
+
+
+class SQLiteDatabase:
+    """
+    A connection to the database, shared by the film, client and transaction repositories so a unit of work over
+    several of them runs in a single database transaction
+    """
+    def __init__(self, filename):
+        """
+        Opens the database stored in the given file, creating the tables if needed
+
+        :param filename: string
+        :raises RepoException: if several clients have the same CNP
+        """
+        self.__connection = connect(filename)
+        self.__batch_depth = 0  # number of nested units of work in progress, over all the repositories
+
+    def execute(self, sql, params=()):
+        """
+        Executes a SQL statement
+
+        :param sql: string
+        :param params: tuple, the parameters of the statement
+        :return: sqlite3.Cursor object
+        """
+        return self.__connection.execute(sql, params)
+
+    def commit_if_needed(self):
+        """
+        Commits the changes, unless a unit of work is in progress
+        """
+        if self.__batch_depth == 0:
+            self.__connection.commit()
+
+    def begin(self):
+        """
+        Starts a unit of work: the changes are committed to the database by the matching commit
+        """
+        self.__batch_depth += 1
+        if self.__batch_depth > 1:  # a nested unit of work is a savepoint, so it can be rolled back alone
+            self.__connection.execute(f"SAVEPOINT unit_of_work_{self.__batch_depth}")
+
+    def commit(self):
+        """
+        Ends a unit of work, committing the changes when the outermost unit of work ends
+        """
+        if self.__batch_depth > 1:
+            self.__connection.execute(f"RELEASE unit_of_work_{self.__batch_depth}")
+
+        self.__batch_depth -= 1
+        self.commit_if_needed()
+
+    def rollback(self):
+        """
+        Abandons a unit of work, discarding its uncommitted changes (the changes of the outer units of work are kept)
+        """
+        if self.__batch_depth > 1:
+            self.__connection.execute(f"ROLLBACK TO unit_of_work_{self.__batch_depth}")
+            self.__connection.execute(f"RELEASE unit_of_work_{self.__batch_depth}")
+        else:
+            self.__connection.rollback()
+
+        self.__batch_depth -= 1
+
+    def close(self):
+        """
+        Closes the connection to the database
+        """
+        self.__connection.close()
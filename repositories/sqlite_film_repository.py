@@ -0,0 +1,236 @@
+"""
+Class definition of a Film SQLite Repository
+"""
+import sqlite3
+
+from domain.entities import Film
+from domain.exceptions import RepoException
+from utils.edit_distance import bounded_levenshtein
+from utils.ngram_index import NgramIndex
+
+
+class SQLiteFilmRepository:
+    """
+    Manages the Film instances stored in a SQLite database and provides basic CRUD operations
+    """
+    def __init__(self, database):
+        """
+        Initializes the film repository using the given database
+
+        :param database: SQLiteDatabase object, shared with the other SQLite repositories
+        """
+        self.__database = database
+        self.__version = 0  # incremented on every change made through this repository
+        self.__title_index = None  # NgramIndex id -> case-folded title, for the searches by similar titles
+        self.__title_index_version = None  # the version of the films the index was built from, None if not built
+
+    @staticmethod
+    def __to_film(row):
+        """
+        Builds a Film object from a row of the films table
+
+        :param row: a tuple (id, title, description, genre)
+        :return: Film object
+        """
+        return Film(row[0], row[1], row[2], row[3])
+
+    def __is_index_current(self):
+        """
+        Checks if the index of the titles was built and no film was changed since then
+
+        :return: True if the index can be used or updated, False otherwise
+        """
+        return self.__title_index_version is not None and self.__title_index_version == self.get_version()
+
+    def __get_title_index(self):
+        """
+        Gets the index of the case-folded titles, building it again from the table on the first search
+        and after the films were changed elsewhere (through other connections or by a rollback)
+
+        :return: NgramIndex
+        """
+        if not self.__is_index_current():
+            self.__title_index = NgramIndex(padded=True)
+            for id, title in self.__database.execute("SELECT id, title FROM films ORDER BY seq"):
+                self.__title_index.add(id, title.casefold())
+            self.__title_index_version = self.get_version()
+
+        return self.__title_index
+
+    def add(self, film):
+        """
+        Adds a new film instance to the repository
+
+        :param film: Film object
+        :raises RepoException: if there is another Film object with the same id in the repository
+        """
+        index_current = self.__is_index_current()
+        try:
+            self.__database.execute("INSERT INTO films (id, title, description, genre) VALUES (?, ?, ?, ?)",
+                                    (film.get_id(), film.get_title(), film.get_description(), film.get_genre()))
+        except sqlite3.IntegrityError:
+            raise RepoException("Id existent")
+
+        self.__version += 1
+        if index_current:
+            self.__title_index.add(film.get_id(), film.get_title().casefold())
+            self.__title_index_version = self.get_version()
+        self.__database.commit_if_needed()
+
+    def find(self, id):
+        """
+        Finds a film by id from the repository
+
+        :param id: an integer
+        :return: the found film
+        :raises RepoException: if the id is invalid or the film with the given id doesn't exist
+        """
+        row = self.__database.execute("SELECT id, title, description, genre FROM films WHERE id = ?", (id,)).fetchone()
+        if row is None:
+            raise RepoException("Id invalid")
+
+        return self.__to_film(row)
+
+    def modify(self, film):
+        """
+        Modifies a film from the repository using another instance
+
+        :param film: a Film object containing the new values, but with the same id
+        :raises RepoException: if the id is invalid or the film with the given id doesn't exist
+        """
+        index_current = self.__is_index_current()
+        cursor = self.__database.execute("UPDATE films SET title = ?, description = ?, genre = ? WHERE id = ?",
+                                         (film.get_title(), film.get_description(), film.get_genre(), film.get_id()))
+        if cursor.rowcount == 0:
+            raise RepoException("Id invalid")
+
+        self.__version += 1
+        if index_current:
+            self.__title_index.add(film.get_id(), film.get_title().casefold())
+            self.__title_index_version = self.get_version()
+        self.__database.commit_if_needed()
+
+    def get_all(self):
+        """
+        Provides access to all the objects in the repository
+
+        :return: a list of all objects
+        """
+        rows = self.__database.execute("SELECT id, title, description, genre FROM films ORDER BY seq")
+
+        return [self.__to_film(row) for row in rows]
+
+    def find_by_title(self, title):
+        """
+        Finds the films whose title contains the given string
+
+        :param title: string
+        :return: a list of films, in the order they were added
+        """
+        rows = self.__database.execute("SELECT id, title, description, genre FROM films WHERE instr(title, ?) > 0 ORDER BY seq", (title,))
+
+        return [self.__to_film(row) for row in rows]
+
+    def find_by_title_prefix(self, prefix):
+        """
+        Finds the films whose title starts with the given prefix (a range of the index on the titles)
+
+        :param prefix: string
+        :return: a list of films, in the order they were added
+        """
+        rows = self.__database.execute("SELECT id, title, description, genre FROM films WHERE title >= ? AND title < ? ORDER BY seq",
+                                       (prefix, prefix + "\U0010ffff"))  # the greatest character, after every title with the prefix
+
+        return [self.__to_film(row) for row in rows]
+
+    def find_by_title_fuzzy(self, title, max_distance):
+        """
+        Finds the films whose title is at most max_distance edits away from the given string, ignoring the case;
+        only the titles which share enough trigrams with it are compared (the index is kept in memory)
+
+        :param title: string
+        :param max_distance: integer
+        :return: a list of films, the closest first and in the order they were added for the same distance
+        """
+        query = title.casefold()
+        matches = []
+        for id in self.__get_title_index().search_similar(query, max_distance):
+            film = self.find(id)
+            distance = bounded_levenshtein(query, film.get_title().casefold(), max_distance)
+            if distance <= max_distance:
+                matches.append((distance, film))
+        matches.sort(key=lambda match: match[0])  # stable, the candidates are in insertion order
+
+        return [film for distance, film in matches]
+
+    def delete(self, id):
+        """
+        Deletes the film with the id provided from the repository
+
+        :param id: an integer
+        :raises RepoException: if the film identified by the id is not in the repository
+        """
+        index_current = self.__is_index_current()
+        cursor = self.__database.execute("DELETE FROM films WHERE id = ?", (id,))
+        if cursor.rowcount == 0:
+            raise RepoException("Id invalid")
+
+        self.__version += 1
+        if index_current:
+            self.__title_index.remove(id)
+            self.__title_index_version = self.get_version()
+        self.__database.commit_if_needed()
+
+    def size(self):
+        """
+        Computes the number of objects in the repository
+
+        :return: that number
+        """
+        return self.__database.execute("SELECT COUNT(*) FROM films").fetchone()[0]
+
+    def clear(self):
+        """
+        Clears the repository
+        """
+        self.__database.execute("DELETE FROM films")
+        self.__version += 1
+        self.__title_index = None
+        self.__title_index_version = None
+        self.__database.commit_if_needed()
+
+    def get_version(self):
+        """
+        Gets the version of the data, which changes every time the films are changed,
+        through this repository or through other connections to the database
+
+        :return: version, integer
+        """
+        data_version = self.__database.execute("PRAGMA data_version").fetchone()[0]  # changed by the other connections
+
+        return self.__version + data_version
+
+    def begin(self):
+        """
+        Starts a unit of work: the changes are committed to the database by the matching commit
+        """
+        self.__database.begin()
+
+    def commit(self):
+        """
+        Ends a unit of work, committing the changes when the outermost unit of work ends
+        """
+        self.__database.commit()
+
+    def rollback(self):
+        """
+        Abandons a unit of work, discarding its uncommitted changes (the changes of the outer units of work are kept)
+        """
+        self.__database.rollback()
+        self.__version += 1  # the discarded changes were already counted
+
+    def close(self):
+        """
+        Closes the connection to the database (shared with the other repositories using the same database)
+        """
+        self.__database.close()
@@ -0,0 +1,200 @@
+"""
+Class definition of a Transaction SQLite Repository
+"""
+import datetime
+import sqlite3
+
+from domain.entities import Film, Client, Transaction
+from domain.exceptions import RepoException
+
+# the films and the clients are joined from the same database, so every row carries its Film and Client;
+# like in the other repositories, the transactions of a deleted film or client are kept (with empty values for it)
+SELECT_TRANSACTIONS = """
+SELECT t.id, t.returned, t.date, t.film_id, COALESCE(f.title, ''), COALESCE(f.description, ''), COALESCE(f.genre, ''),
+       t.client_id, COALESCE(c.name, ''), COALESCE(c.cnp, 0)
+FROM transactions t
+LEFT JOIN films f ON f.id = t.film_id
+LEFT JOIN clients c ON c.id = t.client_id
+"""
+
+
+class SQLiteTransactionRepository:
+    """
+    Manages the Transaction instances stored in a SQLite database and provides basic CRUD operations
+    """
+    def __init__(self, database):
+        """
+        Initializes the transaction repository using the given database
+
+        :param database: SQLiteDatabase object, shared with the other SQLite repositories
+        """
+        self.__database = database
+        self.__version = 0  # incremented on every change made through this repository
+
+    @staticmethod
+    def __to_transaction(row):
+        """
+        Builds a Transaction object from a row of the SELECT_TRANSACTIONS query
+
+        :param row: a tuple
+        :return: Transaction object
+        """
+        film = Film(row[3], row[4], row[5], row[6])
+        client = Client(row[7], row[8], row[9])
+
+        tr = Transaction(row[0], film, client)
+        tr.set_returned(bool(row[1]))
+        tr.set_date(datetime.datetime.fromisoformat(row[2]))
+
+        return tr
+
+    def __select(self, condition, params):
+        """
+        Selects the transactions which satisfy the condition, in the order they were added
+
+        :param condition: string, the WHERE clause
+        :param params: tuple, the parameters of the condition
+        :return: the list of Transaction objects
+        """
+        rows = self.__database.execute(f"{SELECT_TRANSACTIONS} WHERE {condition} ORDER BY t.seq", params)
+
+        return [self.__to_transaction(row) for row in rows]
+
+    def size(self):
+        """
+        Computes the size of the repository (number of transactions stored)
+
+        :return: size, an integer
+        """
+        return self.__database.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+
+    def add(self, transaction):
+        """
+        Adds a Transaction object to the repository
+
+        :param transaction: Transaction object
+        :raises RepoException: if an object with the same id is already stored in the repository
+        """
+        try:
+            self.__database.execute("INSERT INTO transactions (id, film_id, client_id, returned, date) VALUES (?, ?, ?, ?, ?)",
+                                    (transaction.get_id(), transaction.get_film().get_id(), transaction.get_client().get_id(),
+                                     int(transaction.is_returned()), transaction.get_date().isoformat()))
+        except sqlite3.IntegrityError:
+            raise RepoException("Id existent pentru inchiriere")
+
+        self.__version += 1
+        self.__database.commit_if_needed()
+
+    def get_all(self):
+        """
+        Provides access to all the objects in the repository
+
+        :return: a list of all objects
+        """
+        return self.__select("1", ())
+
+    def return_transaction(self, film, client):
+        """
+        Returns a Transaction object based on the film and client objects provided
+
+        :param film: Film Object
+        :param client: Client Object
+        :raises RepoException: if the transaction doesn't exist
+        """
+        cursor = self.__database.execute("UPDATE transactions SET returned = 1 WHERE seq = "
+                                         "(SELECT seq FROM transactions WHERE film_id = ? AND client_id = ? AND returned = 0 "
+                                         "ORDER BY seq LIMIT 1)", (film.get_id(), client.get_id()))
+        if cursor.rowcount == 0:
+            raise RepoException("Inchiriere inexistenta")
+
+        self.__version += 1
+        self.__database.commit_if_needed()
+
+    def find_by_film_client(self, film, client):
+        """
+        Finds a transaction with the given film and client object, which has not been returned
+
+        :param film: Film object
+        :param client: Client Object
+        :return: the found transaction
+        :raises RepoException: if no transactions were found
+        """
+        trs = self.__select("t.film_id = ? AND t.client_id = ? AND t.returned = 0", (film.get_id(), client.get_id()))
+        if not trs:
+            raise RepoException("Inchiriere inexistenta")
+
+        return trs[0]
+
+    def is_film_rented(self, film):
+        """
+        Checks if there is a transaction with the given film, which has not been returned
+
+        :param film: Film object
+        :return: True if found, False otherwise
+        """
+        row = self.__database.execute("SELECT 1 FROM transactions WHERE film_id = ? AND returned = 0 LIMIT 1",
+                                      (film.get_id(),)).fetchone()
+
+        return row is not None
+
+    def get_all_for_client(self, client):
+        """
+        Gets all the transactions that the client made
+
+        :param client: Client object
+        :return: the list of Transaction objects
+        """
+        return self.__select("t.client_id = ?", (client.get_id(),))
+
+    def get_all_for_film(self, film):
+        """
+        Gets all the transactions for the given film
+
+        :param film: Film object
+        :return: the list of Transaction objects
+        """
+        return self.__select("t.film_id = ?", (film.get_id(),))
+
+    def clear(self):
+        """
+        Clears the repository
+        """
+        self.__database.execute("DELETE FROM transactions")
+        self.__version += 1
+        self.__database.commit_if_needed()
+
+    def get_version(self):
+        """
+        Gets the version of the data, which changes every time the transactions are changed,
+        through this repository or through other connections to the database
+
+        :return: version, integer
+        """
+        data_version = self.__database.execute("PRAGMA data_version").fetchone()[0]  # changed by the other connections
+
+        return self.__version + data_version
+
+    def begin(self):
+        """
+        Starts a unit of work: the changes are committed to the database by the matching commit
+        """
+        self.__database.begin()
+
+    def commit(self):
+        """
+        Ends a unit of work, committing the changes when the outermost unit of work ends
+        """
+        self.__database.commit()
+
+    def rollback(self):
+        """
+        Abandons a unit of work, discarding its uncommitted changes (the changes of the outer units of work are kept)
+        """
+        self.__database.rollback()
+        self.__version += 1  # the discarded changes were already counted
+
+    def close(self):
+        """
+        Closes the connection to the database (shared with the other repositories using the same database)
+        """
+        self.__database.close()
@@ -1,53 +1,120 @@
 """
 Class definition of a Transaction File Repository
 """
-import datetime
-
 from domain.entities import Transaction
+from domain.exceptions import RepoException
 from repositories.transaction_repository import TransactionRepository
+from utils.date_format import parse_date, format_date
+from utils.file_utils import get_file_signature, sync_file, FsyncPolicy
 
 
 class TransactionFileRepository(TransactionRepository):
     """
     Manages a list of Transaction instances and provides basic CRUD operations (with file I/O)
     """
-    def __init__(self, filename, film_repo, client_repo):
+    def __init__(self, filename, film_repo, client_repo, append_mode=False, fsync_policy=FsyncPolicy.NEVER):
         """
         Initializes a blank transaction file repository using the given file path
 
         :param filename: string
         :param film_repo: FilmRepository object
         :param client_repo: ClientRepository object
+        :param append_mode: boolean, if True add() appends only the new line instead of rewriting the file
+        :param fsync_policy: FsyncPolicy, when the written data is forced to the disk
         """
         super().__init__()
         self.__filename = filename
+        self.__append_mode = append_mode
+        self.__fsync_policy = fsync_policy
+        self.__loaded = False
+        self.__signature = None  # signature of the file at the last load/save
+        self.__load_count = 0
+        self.__avoided_load_count = 0
+        self.__write_count = 0
+        self.__batch_depth = 0  # number of nested units of work in progress
+        self.__pending = []  # objects added during the unit of work which still have to be appended
+        self.__dirty = False  # True if the whole file has to be rewritten at the end of the unit of work
+        self.__change_count = 0  # number of changes made to the objects
+        self.__savepoints = []  # (change_count, pending, dirty, snapshot) at the start of every unit of work in progress
         self.__fl_repo = film_repo
         self.__cl_repo = client_repo
 
     def __load_from_file(self):
         """
-        Loads the transactions from the file into the _transactions list
+        Loads the transactions from the file into the repository
         """
-        self._transactions = []
+        signature = get_file_signature(self.__filename)  # taken before reading, so a concurrent write triggers a reload
+        super().clear()
+
+        # resolve the ids of every line against lookups built once per load (hash join)
+        films = {film.get_id(): film for film in self.__fl_repo.get_all()}
+        clients = {client.get_id(): client for client in self.__cl_repo.get_all()}
         try:
             with open(self.__filename, "r") as fh:
                 for line in fh:
                     elements = line.strip().split(";")
                     id = int(elements[0])
                     id_film = int(elements[1])
-                    film = self.__fl_repo.find(id_film)
                     id_client = int(elements[2])
-                    client = self.__cl_repo.find(id_client)
+                    if id_film not in films or id_client not in clients:
+                        raise RepoException("Id invalid")
+
+                    film = films[id_film]
+                    client = clients[id_client]
                     returned = (elements[3] == "True")
-                    date = datetime.datetime.strptime(elements[4], "%d.%m.%Y %H:%M")
+                    date = parse_date(elements[4])
 
                     tr = Transaction(id, film, client)
                     tr.set_returned(returned)
                     tr.set_date(date)
 
-                    self._transactions.append(tr)
+                    super().add(tr)
         except IOError:
-            return  # in case of file error, the _transactions list will be empty
+            pass  # in case of file error, the repository will be empty
+
+        self.__signature = signature
+        self.__loaded = True
+        self.__load_count += 1
+
+    def __snapshot(self):
+        """
+        Saves the transactions and their state, so a nested unit of work can be rolled back without touching the file
+
+        :return: a list of tuples (transaction, returned, date)
+        """
+        return [(tr, tr.is_returned(), tr.get_date()) for tr in self._transactions]
+
+    def __restore(self, snapshot):
+        """
+        Brings the transactions back to the state saved by __snapshot
+
+        :param snapshot: a list of tuples (transaction, returned, date)
+        """
+        super().clear()
+        for tr, returned, date in snapshot:
+            tr.set_returned(returned)  # return_transaction changes the stored objects in place
+            tr.set_date(date)
+            super().add(tr)
+
+    def __load_if_changed(self):
+        """
+        Loads the transactions from the file only if the file changed since the last load or save
+        and no unit of work is in progress
+        """
+        if self.__batch_depth > 0 or (self.__loaded and get_file_signature(self.__filename) == self.__signature):
+            self.__avoided_load_count += 1  # a unit of work keeps its snapshot until the end
+            return
+
+        self.__load_from_file()
+
+    def __to_line(self, tr):
+        """
+        Builds the line that stores the object in the file
+
+        :param tr: Transaction object
+        :return: the line, a string
+        """
+        return f"{tr.get_id()};{tr.get_film().get_id()};{tr.get_client().get_id()};{tr.is_returned()};{format_date(tr.get_date())}\n"
 
     def __save_to_file(self):
         """
@@ -55,8 +122,54 @@ class TransactionFileRepository(TransactionRepository):
         """
         with open(self.__filename, "w") as fh:
             for tr in self._transactions:
-                str_tr = f"{tr.get_id()};{tr.get_film().get_id()};{tr.get_client().get_id()};{tr.is_returned()};{tr.get_date().strftime('%d.%m.%Y %H:%M')}\n"
-                fh.write(str_tr)
+                fh.write(self.__to_line(tr))
+            sync_file(fh, self.__fsync_policy)
+
+        self.__write_count += 1
+        self.__signature = get_file_signature(self.__filename)  # our own write must not trigger a reload
+        self.__loaded = True
+
+    def __append_to_file(self, trs):
+        """
+        Appends the given objects at the end of the file
+
+        :param trs: a list of Transaction objects
+        """
+        with open(self.__filename, "a") as fh:
+            for tr in trs:
+                fh.write(self.__to_line(tr))
+            sync_file(fh, self.__fsync_policy)
+
+        self.__write_count += 1
+        self.__signature = get_file_signature(self.__filename)  # our own write must not trigger a reload
+
+    def __persist_added(self, tr):
+        """
+        Writes a newly added object to the file, appending it or rewriting the whole file depending on the mode
+
+        :param tr: Transaction object
+        """
+        self.__change_count += 1
+        if self.__batch_depth > 0:
+            if self.__append_mode and not self.__dirty:
+                self.__pending.append(tr)
+            else:
+                self.__dirty = True
+        elif self.__append_mode:
+            self.__append_to_file([tr])
+        else:
+            self.__save_to_file()
+
+    def __persist_all(self):
+        """
+        Rewrites the whole file, or marks it to be rewritten at the end of the unit of work
+        """
+        self.__change_count += 1
+        if self.__batch_depth > 0:
+            self.__dirty = True
+            self.__pending = []  # the rewrite includes them
+        else:
+            self.__save_to_file()
 
     def size(self):
         """
@@ -64,7 +177,7 @@ class TransactionFileRepository(TransactionRepository):
 
         :return: size, an integer
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         return super().size()
 
     def add(self, transaction):
@@ -74,9 +187,18 @@ class TransactionFileRepository(TransactionRepository):
         :param transaction: Transaction object
         :raises RepoException: if an object with the same id is already stored in the repository
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         super().add(transaction)
-        self.__save_to_file()
+        self.__persist_added(transaction)
+
+    def get_all(self):
+        """
+        Provides access to all the objects in the repository
+
+        :return: a list of all objects
+        """
+        self.__load_if_changed()
+        return super().get_all()
 
     def return_transaction(self, film, client):
         """
@@ -86,9 +208,9 @@ class TransactionFileRepository(TransactionRepository):
         :param client: Client Object
         :raises RepoException: if the transaction doesn't exist
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         super().return_transaction(film, client)
-        self.__save_to_file()
+        self.__persist_all()
 
     def find_by_film_client(self, film, client):
         """
@@ -99,7 +221,7 @@ class TransactionFileRepository(TransactionRepository):
         :return: the found transaction
         :raises RepoException: if no transactions were found
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         return super().find_by_film_client(film, client)
 
     def is_film_rented(self, film):
@@ -109,7 +231,7 @@ class TransactionFileRepository(TransactionRepository):
         :param film: Film object
         :return: True if found, False otherwise
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         return super().is_film_rented(film)
 
     def get_all_for_client(self, client):
@@ -119,7 +241,7 @@ class TransactionFileRepository(TransactionRepository):
         :param client: Client object
         :return: the list of Transaction objects
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         return super().get_all_for_client(client)
 
     def get_all_for_film(self, film):
@@ -129,12 +251,111 @@ class TransactionFileRepository(TransactionRepository):
         :param film: Film object
         :return: the list of Transaction objects
         """
-        self.__load_from_file()
+        self.__load_if_changed()
         return super().get_all_for_film(film)
 
+    def compact(self):
+        """
+        Rewrites the whole file from the transactions currently stored
+        """
+        self.__load_if_changed()
+        self.__persist_all()
+
+    def get_version(self):
+        """
+        Gets the version of the data, which changes every time the repository is changed (also from the file)
+
+        :return: version, integer
+        """
+        self.__load_if_changed()
+        return super().get_version()
+
+    def begin(self):
+        """
+        Starts a unit of work: until the matching commit, the file is neither reloaded nor written
+        """
+        if self.__batch_depth == 0:
+            self.__load_if_changed()
+            snapshot = None  # the outermost unit of work is rolled back by reloading the file
+        else:
+            snapshot = self.__snapshot()
+
+        self.__batch_depth += 1
+        self.__savepoints.append((self.__change_count, list(self.__pending), self.__dirty, snapshot))
+
+    def commit(self):
+        """
+        Ends a unit of work, writing the buffered changes to the file once when the outermost unit of work ends
+        """
+        self.__batch_depth -= 1
+        self.__savepoints.pop()
+        if self.__batch_depth > 0:
+            return
+
+        try:
+            if self.__dirty:
+                self.__save_to_file()
+            elif self.__pending:
+                self.__append_to_file(self.__pending)
+        except IOError:
+            self.__loaded = False  # the changes didn't reach the file, the next access reloads the transactions from it
+            raise
+        finally:
+            self.__pending = []
+            self.__dirty = False
+
+    def rollback(self):
+        """
+        Abandons a unit of work, discarding the changes made since its start: the outermost unit of work reloads
+        the transactions from the file, a nested one restores the state saved when it started (the outer changes are kept)
+        """
+        self.__batch_depth -= 1
+        change_count, pending, dirty, snapshot = self.__savepoints.pop()
+        if change_count == self.__change_count:  # nothing to discard
+            return
+
+        if snapshot is None:
+            self.__pending = []
+            self.__dirty = False
+            self.__load_from_file()
+        else:
+            self.__pending = pending
+            self.__dirty = dirty
+            self.__restore(snapshot)
+
+    def refresh(self):
+        """
+        Forces the repository to reload the transactions from the file
+        """
+        self.__load_from_file()
+
+    def get_load_count(self):
+        """
+        Getter for the number of times the file was loaded
+
+        :return: load_count, integer
+        """
+        return self.__load_count
+
+    def get_avoided_load_count(self):
+        """
+        Getter for the number of loads avoided because the file didn't change
+
+        :return: avoided_load_count, integer
+        """
+        return self.__avoided_load_count
+
+    def get_write_count(self):
+        """
+        Getter for the number of times the file was written (rewritten or appended to)
+
+        :return: write_count, integer
+        """
+        return self.__write_count
+
     def clear(self):
         """
         Clears the repository
         """
         super().clear()
-        self.__save_to_file()
+        self.__persist_all()
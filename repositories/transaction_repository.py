@@ -13,6 +13,12 @@ class TransactionRepository:
         Initializes a blank list of transactions in the repository
         """
         self._transactions = []
+        self.__transaction_set = set()  # the same transactions as in _transactions, for the duplicate check
+        self.__by_film = {}  # film id -> list of transactions with that film
+        self.__by_client = {}  # client id -> list of transactions of that client
+        self.__open = {}  # (film id, client id) -> list of the transactions not returned yet, in the order they were added
+        self.__num_open = {}  # film id -> number of transactions with that film which have not been returned
+        self.__version = 0  # incremented on every change of the repository
 
     def size(self):
         """
@@ -29,10 +35,27 @@ class TransactionRepository:
         :param transaction: Transaction object
         :raises RepoException: if an object with the same id is already stored in the repository
         """
-        if transaction in self._transactions:
+        if transaction in self.__transaction_set:
             raise RepoException("Id existent pentru inchiriere")
 
         self._transactions.append(transaction)
+        self.__transaction_set.add(transaction)
+        self.__version += 1
+
+        id_film = transaction.get_film().get_id()
+        self.__by_film.setdefault(id_film, []).append(transaction)
+        self.__by_client.setdefault(transaction.get_client().get_id(), []).append(transaction)
+        if not transaction.is_returned():
+            self.__open.setdefault((id_film, transaction.get_client().get_id()), []).append(transaction)
+            self.__num_open[id_film] = self.__num_open.get(id_film, 0) + 1
+
+    def get_all(self):
+        """
+        Provides access to all the objects in the repository
+
+        :return: a list of all objects
+        """
+        return self._transactions
 
     def return_transaction(self, film, client):
         """
@@ -42,8 +65,20 @@ class TransactionRepository:
         :param client: Client Object
         :raises RepoException: if the transaction doesn't exist
         """
-        tr = self.find_by_film_client(film, client)
+        key = (film.get_id(), client.get_id())
+        open_trs = self.__open.get(key)
+        if not open_trs:
+            raise RepoException("Inchiriere inexistenta")
+
+        tr = open_trs.pop(0)  # the oldest rent is returned first
         tr.return_transaction()
+        self.__version += 1
+
+        if not open_trs:
+            del self.__open[key]
+        self.__num_open[film.get_id()] -= 1
+        if self.__num_open[film.get_id()] == 0:
+            del self.__num_open[film.get_id()]
 
     def find_by_film_client(self, film, client):
         """
@@ -54,16 +89,12 @@ class TransactionRepository:
         :return: the found transaction
         :raises RepoException: if no transactions were found
         """
-        found = False
-
-        for tr in self._transactions:
-            if tr.get_film() == film and tr.get_client() == client and not tr.is_returned():
-                found = True
-                return tr
-
-        if not found:
+        open_trs = self.__open.get((film.get_id(), client.get_id()))
+        if not open_trs:
             raise RepoException("Inchiriere inexistenta")
 
+        return open_trs[0]
+
     def is_film_rented(self, film):
         """
         Checks if there is a transaction with the given film, which has not been returned
@@ -71,13 +102,7 @@ class TransactionRepository:
         :param film: Film object
         :return: True if found, False otherwise
         """
-        found = False
-
-        for tr in self._transactions:
-            if tr.get_film() == film and not tr.is_returned():
-                found = True
-
-        return found
+        return film.get_id() in self.__num_open
 
     def get_all_for_client(self, client):
         """
@@ -86,13 +111,7 @@ class TransactionRepository:
         :param client: Client object
         :return: the list of Transaction objects
         """
-        trs = []
-
-        for tr in self._transactions:
-            if tr.get_client() == client:
-                trs.append(tr)
-
-        return trs
+        return self.__by_client.get(client.get_id(), [])[:]
 
     def get_all_for_film(self, film):
         """
@@ -101,15 +120,42 @@ class TransactionRepository:
         :param film: Film object
         :return: the list of Transaction objects
         """
-        trs = []
-
-        for tr in self._transactions:
-            if tr.get_film() == film:
-                trs.append(tr)
-        return trs
+        return self.__by_film.get(film.get_id(), [])[:]
 
     def clear(self):
         """
         Clears the repository
         """
         self._transactions.clear()
+        self.__version += 1
+        self.__transaction_set.clear()
+        self.__by_film.clear()
+        self.__by_client.clear()
+        self.__open.clear()
+        self.__num_open.clear()
+
+    def get_version(self):
+        """
+        Gets the version of the data, which changes every time the repository is changed
+
+        :return: version, integer
+        """
+        return self.__version
+
+    def begin(self):
+        """
+        Starts a unit of work (the in-memory repository has nothing to persist, so it does nothing)
+        """
+        pass
+
+    def commit(self):
+        """
+        Ends a unit of work (the in-memory repository has nothing to persist, so it does nothing)
+        """
+        pass
+
+    def rollback(self):
+        """
+        Abandons a unit of work (the in-memory repository doesn't keep the previous state, so it does nothing)
+        """
+        pass
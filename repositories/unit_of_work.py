@@ -0,0 +1,67 @@
+"""
+Class definition of a Unit of Work over one or more repositories
+"""
+
+
+class UnitOfWork:
+    """
+    Context manager that buffers the mutations of the given repositories and persists them once at the end,
+    or abandons them if an exception is raised
+    """
+    def __init__(self, *repos):
+        """
+        Initializes the unit of work
+
+        :param repos: the repositories taking part in the unit of work
+        """
+        self.__repos = repos
+
+    def __enter__(self):
+        """
+        Starts the unit of work in every repository
+
+        :return: the unit of work
+        """
+        for repo in self.__repos:
+            repo.begin()
+
+        return self
+
+    @staticmethod
+    def __rollback_all(repos):
+        """
+        Rolls back the unit of work in every given repository, even if some of them fail to roll back
+
+        :param repos: a sequence of repositories
+        :raises: the first exception raised by a rollback, after all the repositories were rolled back
+        """
+        error = None
+        for repo in repos:
+            try:
+                repo.rollback()
+            except Exception as ex:
+                if error is None:
+                    error = ex
+
+        if error is not None:
+            raise error
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Commits the unit of work if no exception was raised, otherwise rolls it back; if a repository fails to commit,
+        the repositories after it are rolled back, so none of them is left inside the unit of work
+
+        :return: False, the exception (if any) is propagated
+        """
+        if exc_type is not None:
+            self.__rollback_all(self.__repos)
+            return False
+
+        for i, repo in enumerate(self.__repos):
+            try:
+                repo.commit()
+            except BaseException:
+                self.__rollback_all(self.__repos[i + 1:])
+                raise
+
+        return False
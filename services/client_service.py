@@ -5,6 +5,7 @@ import random
 
 from domain.entities import Client
 from domain.exceptions import ValidatorException, RepoException
+from repositories.unit_of_work import UnitOfWork
 from utils.random_generation import generate_random_string, generate_random_cnp
 
 
@@ -82,39 +83,25 @@ class ClientService:
         """
         self.__repo.delete(id)
 
-    def find_client_by_cnp(self, cnp, i=0):
+    def find_client_by_cnp(self, cnp):
         """
         Implements the use case of finding a client by cnp from the repository
 
         :param cnp: integer
-        :param i: integer, current iterating position
         :return: the found client
         :raises RepoException: if the cnp is invalid or the client with the given cnp doesn't exist
         """
-        if i >= self.__repo.size():  # client not found
-            raise RepoException("CNP invalid")
-
-        clients = self.__repo.get_all()
-        if clients[i].get_cnp() == cnp:
-            return clients[i]
-
-        return self.find_client_by_cnp(cnp, i + 1)
+        return self.__repo.find_by_cnp(cnp)
 
     def find_client_by_name(self, name):
         """
         Implements the use case of finding one or more clients by name from the repository
+        (every word of the name given has to start a word of the client name, ignoring the case and the diacritics)
 
         :param name: string
         :return: a list of clients
         """
-        clients = self.__repo.get_all()
-        result = []
-
-        for client in clients:
-            if name in client.get_name():
-                result.append(client)
-
-        return result
+        return self.__repo.find_by_name(name)
 
     def generate_clients_random(self, x):
         """
@@ -122,15 +109,17 @@ class ClientService:
         :param x: integer
         """
         no_of_gen_items = 0
-        self.__repo.clear()
-
-        while no_of_gen_items < x:
-            id = random.randint(1, x)
-            name = generate_random_string(random.randint(1, 10))
-            cnp = generate_random_cnp()
-
-            try:
-                self.add_client(id, name, cnp)
-                no_of_gen_items += 1
-            except (ValidatorException, RepoException):
-                pass
+
+        with UnitOfWork(self.__repo):  # all the generated clients are written at once
+            self.__repo.clear()
+
+            while no_of_gen_items < x:
+                id = random.randint(1, x)
+                name = generate_random_string(random.randint(1, 10))
+                cnp = generate_random_cnp()
+
+                try:
+                    self.add_client(id, name, cnp)
+                    no_of_gen_items += 1
+                except (ValidatorException, RepoException):
+                    pass
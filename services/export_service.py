@@ -0,0 +1,112 @@
+"""
+Class definition of the Export Service
+"""
+import csv
+import json
+from enum import Enum
+
+BUFFER_SIZE = 1 << 16  # size of the write buffer of the exported files, in bytes
+
+CLIENT_FIELDS = ("id", "name", "num_films", "films")
+FILM_FIELDS = ("id", "title", "num_rent")
+
+
+class ExportFormat(Enum):
+    """
+    Enum for the possible formats of the exported reports
+    """
+    CSV = 1  # a header and a row for every DTO, the films of a client are given by their ids separated by spaces
+    JSONL = 2  # a JSON object for every DTO, on separate lines
+
+
+class ExportService:
+    """
+    Manages use cases for exporting the reports of the Transaction Service
+    """
+    def __init__(self, transaction_service):
+        """
+        Initializes the Export Service
+
+        :param transaction_service: TransactionService object
+        """
+        self.__reports = {  # report name -> (function of the prefix that generates the DTOs, fields of the DTOs)
+            "clients_by_name": (lambda prefix: transaction_service.iter_clients_by_name(), CLIENT_FIELDS),
+            "clients_by_number": (lambda prefix: transaction_service.iter_clients_by_number(), CLIENT_FIELDS),
+            "first_clients": (lambda prefix: transaction_service.iter_first_clients(), CLIENT_FIELDS),
+            "films": (lambda prefix: transaction_service.iter_films(), FILM_FIELDS),
+            "last_films": (lambda prefix: transaction_service.iter_last_films(prefix), FILM_FIELDS),
+        }
+
+    def get_report_names(self):
+        """
+        Gets the names of the reports that can be exported
+
+        :return: a list of strings
+        """
+        return list(self.__reports)
+
+    @staticmethod
+    def __to_csv_row(row, fields):
+        """
+        Builds a CSV row from the fields of a DTO
+
+        :param row: dictionary, the fields of the DTO
+        :param fields: tuple, the names of the columns
+        :return: a list of values
+        """
+        values = []
+        for field in fields:
+            value = row[field]
+            if isinstance(value, list):  # the films of a client
+                value = " ".join(str(item["id"]) for item in value)
+            values.append(value)
+
+        return values
+
+    def export_report(self, report, export_format, fh, prefix=""):
+        """
+        Writes a report to a text file handle, one row at a time
+
+        :param report: string, one of the names from get_report_names
+        :param export_format: ExportFormat
+        :param fh: a text file handle
+        :param prefix: string, the prefix of the titles for the last_films report - optional, by default empty
+        :return: the number of rows exported, integer
+        :raises ValueError: if the report is unknown
+        """
+        if report not in self.__reports:
+            raise ValueError(f"Raport necunoscut: {report}")
+
+        generate, fields = self.__reports[report]
+
+        count = 0
+        if export_format == ExportFormat.CSV:
+            writer = csv.writer(fh)
+            writer.writerow(fields)
+            for dto in generate(prefix):
+                writer.writerow(self.__to_csv_row(dto.to_dict(), fields))
+                count += 1
+        elif export_format == ExportFormat.JSONL:
+            for dto in generate(prefix):
+                fh.write(json.dumps(dto.to_dict(), ensure_ascii=False) + "\n")
+                count += 1
+
+        return count
+
+    def export_report_to_file(self, report, export_format, filename, prefix=""):
+        """
+        Writes a report to a file, one row at a time through a write buffer
+
+        :param report: string, one of the names from get_report_names
+        :param export_format: ExportFormat
+        :param filename: string
+        :param prefix: string, the prefix of the titles for the last_films report - optional, by default empty
+        :return: the number of rows exported, integer
+        :raises ValueError: if the report is unknown
+        :raises IOError: if the file can't be written
+        """
+        if report not in self.__reports:  # checked before the file is created
+            raise ValueError(f"Raport necunoscut: {report}")
+
+        with open(filename, "w", newline="", encoding="utf-8", buffering=BUFFER_SIZE) as fh:
+            return self.export_report(report, export_format, fh, prefix)
@@ -5,6 +5,7 @@ import random
 
 from domain.entities import Film
 from domain.exceptions import ValidatorException, RepoException
+from repositories.unit_of_work import UnitOfWork
 from utils.random_generation import generate_random_string
 
 
@@ -83,12 +84,9 @@ class FilmService:
         :param prefix: a string
         :return: a list of string representations for the filtered repository
         """
-        films = self.__repo.get_all()
+        films = self.__repo.find_by_title_prefix(prefix)
 
-        str_films_filtered = []
-        for film in films:
-            if film.get_title().startswith(prefix):
-                str_films_filtered.append(str(film))
+        str_films_filtered = list(map(lambda film: str(film), films))
 
         return str_films_filtered
 
@@ -100,22 +98,25 @@ class FilmService:
         """
         self.__repo.delete(id)
 
-    def find_film_by_title(self, title, i=0):
+    def find_film_by_title(self, title):
         """
         Implements the use case of finding one or more films by title from the repository
 
         :param title: string
-        :param i: integer, current iterating position
         :return: a list of films
         """
-        if i >= self.__repo.size():
-            return []
+        return self.__repo.find_by_title(title)
 
-        films = self.__repo.get_all()
-        if title in films[i].get_title():
-            return [films[i]] + self.find_film_by_title(title, i + 1)
+    def find_film_by_title_fuzzy(self, title, max_distance=2):
+        """
+        Implements the use case of finding the films whose title is close to a possibly misspelled title
 
-        return self.find_film_by_title(title, i + 1)
+        :param title: string
+        :param max_distance: integer, the maximum number of edits (insertions, deletions, substitutions) between the
+        given title and the title of a film, ignoring the case - optional, by default 2
+        :return: a list of films, the closest first
+        """
+        return self.__repo.find_by_title_fuzzy(title, max_distance)
 
     def generate_films_random(self, x):
         """
@@ -123,16 +124,18 @@ class FilmService:
         :param x: integer
         """
         no_of_gen_items = 0
-        self.__repo.clear()
-
-        while no_of_gen_items < x:
-            id = random.randint(1, x)
-            title = generate_random_string(random.randint(1, 10))
-            description = generate_random_string(random.randint(1, 20))
-            genre = generate_random_string(random.randint(1, 5))
-
-            try:
-                self.add_film(id, title, description, genre)
-                no_of_gen_items += 1
-            except (ValidatorException, RepoException):
-                pass
+
+        with UnitOfWork(self.__repo):  # all the generated films are written at once
+            self.__repo.clear()
+
+            while no_of_gen_items < x:
+                id = random.randint(1, x)
+                title = generate_random_string(random.randint(1, 10))
+                description = generate_random_string(random.randint(1, 20))
+                genre = generate_random_string(random.randint(1, 5))
+
+                try:
+                    self.add_film(id, title, description, genre)
+                    no_of_gen_items += 1
+                except (ValidatorException, RepoException):
+                    pass
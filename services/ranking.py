@@ -0,0 +1,62 @@
+"""
+Class definition of a ranking of objects kept sorted while their keys change, used by the reports
+"""
+from bisect import bisect_left, insort
+
+from utils.sorting_algs import Sorting, SortingMethod
+
+
+class Ranking:
+    """
+    Keeps objects sorted by a key which can change (e.g. a number of rents), so they can be read in order
+    without sorting them again
+    """
+    def __init__(self, objects, key):
+        """
+        Sorts the objects by their keys
+
+        :param objects: an iterable of objects with a get_id method (Film, Client)
+        :param key: a function with one argument that returns the key of an object; the keys must be distinct,
+        for example by ending with the id of the object
+        """
+        self.__key = key
+        self.__keys = {}  # object id -> the current key of the object
+        entries = []
+        for obj in objects:
+            self.__keys[obj.get_id()] = key(obj)
+            entries.append((self.__keys[obj.get_id()], obj))
+
+        # tuples (key, object) in ascending order, the keys are distinct so the objects are never compared
+        self.__sorted = Sorting.sorted(entries, key=lambda entry: entry[0], method=SortingMethod.MERGE_SORT)
+
+    def update(self, obj):
+        """
+        Moves an object to its place after its key changed (or adds it), with O(log n) comparisons
+
+        :param obj: an object with a get_id method
+        """
+        old_key = self.__keys.get(obj.get_id())
+        if old_key is not None:
+            del self.__sorted[bisect_left(self.__sorted, (old_key,))]  # (key,) comes right before (key, object)
+
+        self.__keys[obj.get_id()] = self.__key(obj)
+        insort(self.__sorted, (self.__keys[obj.get_id()], obj))
+
+    def descending(self, k=None):
+        """
+        Gets the objects in descending order by key, in O(k)
+
+        :param k: integer, the number of objects - optional, by default all of them
+        :return: a list of objects
+        """
+        n = len(self.__sorted) if k is None else min(k, len(self.__sorted))
+
+        return [self.__sorted[i][1] for i in range(len(self.__sorted) - 1, len(self.__sorted) - 1 - n, -1)]
+
+    def size(self):
+        """
+        Computes the number of objects in the ranking
+
+        :return: integer
+        """
+        return len(self.__sorted)
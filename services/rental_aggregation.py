@@ -0,0 +1,138 @@
+"""
+Class definition of the aggregation of transactions used by the reports
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+PARALLEL_THRESHOLD = 200000  # below this number of transactions the aggregation is always computed serially
+
+
+def aggregate_chunk(pairs):
+    """
+    Computes the partial aggregates of a chunk of transactions (runs in a worker process)
+
+    :param pairs: a list of tuples (film id, client id), in the order of the transactions
+    :return: a tuple (client id -> list of distinct film ids in the order of the first rent,
+             client id -> number of rents, film id -> number of rents)
+    """
+    client_films = {}
+    client_num_films = {}
+    film_num_rent = {}
+
+    for id_film, id_client in pairs:
+        client_films.setdefault(id_client, {})[id_film] = None
+        client_num_films[id_client] = client_num_films.get(id_client, 0) + 1
+        film_num_rent[id_film] = film_num_rent.get(id_film, 0) + 1
+
+    return {id_client: list(films) for id_client, films in client_films.items()}, client_num_films, film_num_rent
+
+
+class RentalAggregation:
+    """
+    Per-client and per-film aggregates of a list of transactions, computed in a single pass
+    """
+    def __init__(self, transactions=()):
+        """
+        Initializes the aggregates and adds the given transactions to them
+
+        :param transactions: an iterable of Transaction objects - optional, by default empty
+        """
+        self.__films = {}  # film id -> Film object (the first one found in the transactions)
+        self.__client_films = {}  # client id -> dict of the ids of the films rented by the client (used as an ordered set)
+        self.__client_num_films = {}  # client id -> number of rents made by the client
+        self.__film_num_rent = {}  # film id -> number of rents of the film
+
+        for tr in transactions:
+            self.add(tr)
+
+    @staticmethod
+    def build(transactions, workers=1, parallel_threshold=PARALLEL_THRESHOLD):
+        """
+        Computes the aggregates of a list of transactions, splitting the list in chunks aggregated
+        by worker processes when there are enough transactions to be worth it
+
+        :param transactions: a list of Transaction objects
+        :param workers: integer, the number of worker processes - optional, by default 1 (serial)
+        :param parallel_threshold: integer, the minimum number of transactions aggregated in parallel
+        :return: RentalAggregation object
+        """
+        if workers <= 1 or len(transactions) < parallel_threshold:
+            return RentalAggregation(transactions)
+
+        aggregation = RentalAggregation()
+
+        pairs = []
+        for tr in transactions:  # the workers get only the ids, which are much cheaper to send than the objects
+            film = tr.get_film()
+            aggregation.__films.setdefault(film.get_id(), film)
+            pairs.append((film.get_id(), tr.get_client().get_id()))
+
+        size = -(-len(pairs) // workers)  # rounded up, so there are at most workers chunks
+        chunks = [pairs[i:i + size] for i in range(0, len(pairs), size)]
+
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                partials = list(executor.map(aggregate_chunk, chunks))
+        except (OSError, NotImplementedError):  # worker processes are not available on this platform
+            partials = [aggregate_chunk(pairs)]
+
+        for partial in partials:  # merged in the order of the chunks, so the order of the first rents is kept
+            aggregation.__merge(partial)
+
+        return aggregation
+
+    def __merge(self, partial):
+        """
+        Adds the partial aggregates of a chunk of transactions to the aggregates
+
+        :param partial: a tuple, as returned by aggregate_chunk
+        """
+        client_films, client_num_films, film_num_rent = partial
+
+        for id_client, films in client_films.items():
+            self.__client_films.setdefault(id_client, {}).update(dict.fromkeys(films))
+        for id_client, count in client_num_films.items():
+            self.__client_num_films[id_client] = self.__client_num_films.get(id_client, 0) + count
+        for id_film, count in film_num_rent.items():
+            self.__film_num_rent[id_film] = self.__film_num_rent.get(id_film, 0) + count
+
+    def add(self, transaction):
+        """
+        Adds a transaction to the aggregates
+
+        :param transaction: Transaction object
+        """
+        film = transaction.get_film()
+        id_film = film.get_id()
+        id_client = transaction.get_client().get_id()
+
+        self.__films.setdefault(id_film, film)
+        self.__client_films.setdefault(id_client, {})[id_film] = None
+        self.__client_num_films[id_client] = self.__client_num_films.get(id_client, 0) + 1
+        self.__film_num_rent[id_film] = self.__film_num_rent.get(id_film, 0) + 1
+
+    def get_client_films(self, id_client):
+        """
+        Gets the distinct films rented by a client, in the order of the first rent
+
+        :param id_client: integer
+        :return: a list of Film objects
+        """
+        return [self.__films[id_film] for id_film in self.__client_films.get(id_client, {})]
+
+    def get_client_num_films(self, id_client):
+        """
+        Gets the number of rents made by a client
+
+        :param id_client: integer
+        :return: integer
+        """
+        return self.__client_num_films.get(id_client, 0)
+
+    def get_film_num_rent(self, id_film):
+        """
+        Gets the number of rents of a film
+
+        :param id_film: integer
+        :return: integer
+        """
+        return self.__film_num_rent.get(id_film, 0)
@@ -0,0 +1,119 @@
+"""
+Class definition of the cache of the generated reports
+"""
+from collections import OrderedDict
+
+
+class ReportCache:
+    """
+    Least recently used cache of reports, where every report is tagged with the versions of the data it was generated from;
+    only the reports of at most max_rows rows are kept, so the memory used by the cache stays bounded
+    """
+    def __init__(self, max_size=64, max_rows=1000):
+        """
+        Initializes an empty cache
+
+        :param max_size: integer, the maximum number of reports kept - optional, by default 64
+        :param max_rows: integer, the maximum number of rows of a report kept - optional, by default 1000
+        """
+        self.__max_size = max_size
+        self.__max_rows = max_rows
+        self.__entries = OrderedDict()  # (name, args) -> (versions, report), from the least to the most recently used
+        self.__hits = 0
+        self.__misses = 0
+
+    def lookup(self, name, args, versions):
+        """
+        Gets a report from the cache, if it was generated from the same versions of the data
+
+        :param name: string, the name of the report
+        :param args: tuple, the arguments of the report
+        :param versions: tuple, the versions of the repositories the report is generated from
+        :return: a copy of the report, list, or None if it is missing or the data changed since it was generated
+        """
+        key = (name, args)
+        entry = self.__entries.get(key)
+
+        if entry is None or entry[0] != versions:
+            self.__misses += 1
+            return None
+
+        self.__hits += 1
+        self.__entries.move_to_end(key)
+
+        return entry[1][:]
+
+    def put(self, name, args, versions, report):
+        """
+        Adds a report to the cache, replacing the previous version of it; a report longer than max_rows is not kept
+
+        :param name: string, the name of the report
+        :param args: tuple, the arguments of the report
+        :param versions: tuple, the versions of the repositories the report was generated from
+        :param report: list
+        """
+        key = (name, args)
+        if len(report) > self.__max_rows:
+            self.__entries.pop(key, None)  # the previous version is out of date
+            return
+
+        self.__entries[key] = (versions, report)
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)  # evict the least recently used report
+
+    def get(self, name, args, versions, generate):
+        """
+        Gets a report from the cache, generating it again if it is missing or the data changed since it was generated
+
+        :param name: string, the name of the report
+        :param args: tuple, the arguments of the report
+        :param versions: tuple, the versions of the repositories the report is generated from
+        :param generate: function without parameters which generates the report (a list)
+        :return: a copy of the report, list
+        """
+        report = self.lookup(name, args, versions)
+        if report is None:
+            report = generate()
+            self.put(name, args, versions, report)
+            report = report[:]
+
+        return report
+
+    def clear(self):
+        """
+        Removes all the reports from the cache
+        """
+        self.__entries.clear()
+
+    def size(self):
+        """
+        Computes the number of reports in the cache
+
+        :return: size, integer
+        """
+        return len(self.__entries)
+
+    def get_max_rows(self):
+        """
+        Getter for the maximum number of rows of a report kept in the cache
+
+        :return: max_rows, integer
+        """
+        return self.__max_rows
+
+    def get_hit_count(self):
+        """
+        Getter for the number of reports returned from the cache
+
+        :return: hits, integer
+        """
+        return self.__hits
+
+    def get_miss_count(self):
+        """
+        Getter for the number of reports that had to be generated
+
+        :return: misses, integer
+        """
+        return self.__misses
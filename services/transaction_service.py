@@ -2,12 +2,15 @@
 Class definition of the Transaction Service
 """
 import random
-from functools import cmp_to_key
 from math import ceil
 
 from domain.datatransfer import ClientDTO, FilmDTO
 from domain.entities import Transaction
 from domain.exceptions import RepoException, ValidatorException
+from repositories.unit_of_work import UnitOfWork
+from services.ranking import Ranking
+from services.rental_aggregation import RentalAggregation
+from services.report_cache import ReportCache
 from utils.sorting_algs import Sorting, SortingMethod
 
 
@@ -15,7 +18,7 @@ class TransactionService:
     """
     Manages use cases for CRUD operations on a lists of transactions
     """
-    def __init__(self, transaction_repo, transaction_validator, film_repo, client_repo):
+    def __init__(self, transaction_repo, transaction_validator, film_repo, client_repo, report_cache=None, aggregation_workers=1):
         """
         Initializes the Transaction Service
 
@@ -23,15 +26,25 @@ class TransactionService:
         :param transaction_validator: TransactionValidator object
         :param film_repo: FilmRepository object
         :param client_repo: ClientRepository object
+        :param report_cache: ReportCache object - optional, by default a new cache
+        :param aggregation_workers: integer, the number of processes that aggregate large lists of transactions - optional, by default 1
         """
         self.__repo = transaction_repo
         self.__validator = transaction_validator
         self.__film_repo = film_repo
         self.__client_repo = client_repo
-
-    def rent_film_to_client(self, id_transaction, id_film, id_client):
+        self.__aggregation = None  # aggregates of all the transactions, kept up to date by rent/return
+        self.__aggregation_version = None  # version of the transaction repository the aggregates correspond to
+        self.__client_ranking = None  # Ranking of the clients by (number of rents, name, id), kept up to date by rent
+        self.__client_ranking_versions = None  # versions of the transaction and client repositories it corresponds to
+        self.__film_ranking = None  # Ranking of the films by (number of rents, -id), kept up to date by rent
+        self.__film_ranking_versions = None  # versions of the transaction and film repositories it corresponds to
+        self.__report_cache = ReportCache() if report_cache is None else report_cache
+        self.__aggregation_workers = aggregation_workers
+
+    def __rent(self, id_transaction, id_film, id_client):
         """
-        Implements the use case of renting a film to a client
+        Rents a film to a client, inside the unit of work of the caller
 
         :param id_transaction: integer
         :param id_film: integer
@@ -50,161 +63,400 @@ class TransactionService:
 
         self.__validator.validate(tr)
 
+        version = self.__repo.get_version()
         self.__repo.add(tr)
 
-    def return_film_from_client(self, id_film, id_client):
+        if self.__aggregation_version == version:  # the aggregates were up to date, update them with the new rent
+            self.__aggregation.add(tr)
+            self.__aggregation_version = self.__repo.get_version()
+
+            if self.__client_ranking_versions == (version, self.__client_repo.get_version()):
+                self.__client_ranking.update(client)  # only the client of the rent moves
+                self.__client_ranking_versions = (self.__aggregation_version, self.__client_repo.get_version())
+            if self.__film_ranking_versions == (version, self.__film_repo.get_version()):
+                self.__film_ranking.update(film)
+                self.__film_ranking_versions = (self.__aggregation_version, self.__film_repo.get_version())
+
+    def __return(self, id_film, id_client, id_transaction=None):
         """
-        Implements the use case of returning a film from a client
+        Returns a film from a client, inside the unit of work of the caller
 
         :param id_film: integer
         :param id_client: integer
+        :param id_transaction: integer, the id of the rent which is returned - optional, by default any
         :raises RepoException: if the ids provided are invalid, the transaction was already returned or it didn't exist
         """
         film = self.__film_repo.find(id_film)
 
-        client = self.__film_repo.find(id_client)
+        client = self.__client_repo.find(id_client)
+
+        if id_transaction is not None and self.__repo.find_by_film_client(film, client).get_id() != id_transaction:
+            raise RepoException("Inchiriere inexistenta")
 
+        version = self.__repo.get_version()
         self.__repo.return_transaction(film, client)
 
-    def report_clients_by_name(self):
+        if self.__aggregation_version == version:  # a return doesn't change the number of rents, the aggregates stay valid
+            self.__aggregation_version = self.__repo.get_version()
+
+            if self.__client_ranking_versions == (version, self.__client_repo.get_version()):  # and so do the rankings
+                self.__client_ranking_versions = (self.__aggregation_version, self.__client_repo.get_version())
+            if self.__film_ranking_versions == (version, self.__film_repo.get_version()):
+                self.__film_ranking_versions = (self.__aggregation_version, self.__film_repo.get_version())
+
+    def rent_film_to_client(self, id_transaction, id_film, id_client):
         """
-        Generates a list of ClientDTO objects sorted by the client name
+        Implements the use case of renting a film to a client
 
-        :return: the list (with the string representation of the objects)
+        :param id_transaction: integer
+        :param id_film: integer
+        :param id_client: integer
+        :raises RepoException: if the id_film or id_client are invalid, a transaction with the same id already exists or the film is already rented
+        :raises ValidatorException: if id_transaction is invalid
         """
-        clients = self.__client_repo.get_all()
+        with UnitOfWork(self.__film_repo, self.__client_repo, self.__repo):  # one snapshot of the data and at most one write
+            self.__rent(id_transaction, id_film, id_client)
 
-        report = []
-        for client in clients:
-            trs = self.__repo.get_all_for_client(client)
+    def return_film_from_client(self, id_film, id_client):
+        """
+        Implements the use case of returning a film from a client
 
-            client_dto = ClientDTO(client.get_id(), client.get_name())
-            for tr in trs:
-                client_dto.add_film(tr.get_film())
+        :param id_film: integer
+        :param id_client: integer
+        :raises RepoException: if the ids provided are invalid, the transaction was already returned or it didn't exist
+        """
+        with UnitOfWork(self.__film_repo, self.__client_repo, self.__repo):  # one snapshot of the data and at most one write
+            self.__return(id_film, id_client)
 
-            report.append(client_dto)
+    @staticmethod
+    def __unpack(item, lengths):
+        """
+        Checks the shape of an item of a batch
 
-        report = Sorting.sorted(report, key=lambda clt_dto: clt_dto.get_name(), method=SortingMethod.MERGE_SORT)
+        :param item: the item, a tuple of ids
+        :param lengths: tuple, the accepted numbers of ids
+        :return: the ids of the item, tuple
+        :raises ValidatorException: if the item is not a tuple (or list) with an accepted number of ids
+        """
+        if not isinstance(item, (tuple, list)) or len(item) not in lengths:
+            raise ValidatorException("Inchiriere invalida\n")
 
-        str_report = list(map(lambda cl_dto: str(cl_dto), report))  # convert all the objects to their string version
+        return tuple(item)
 
-        return str_report
+    def rent_many(self, items):
+        """
+        Implements the use case of renting a batch of films, in order, with a single write for the whole batch
 
-    def report_clients_by_number(self):
+        :param items: a list of tuples (id_film, id_client, id_transaction)
+        :return: the list of the items that failed, as tuples (item, exception), the other items are rented
+        (a malformed item fails with a ValidatorException)
         """
-        Generates a list of ClientDTO objects sorted descending by the number of rented films for each client
+        failures = []
 
-        :return: the list (with the string representation of the objects)
+        with UnitOfWork(self.__film_repo, self.__client_repo, self.__repo):
+            for item in items:
+                try:
+                    id_film, id_client, id_transaction = self.__unpack(item, (3,))
+                    self.__rent(id_transaction, id_film, id_client)
+                except (RepoException, ValidatorException) as ex:
+                    failures.append((item, ex))
+
+        return failures
+
+    def return_many(self, items):
         """
-        clients = self.__client_repo.get_all()
+        Implements the use case of returning a batch of films, in order, with a single write for the whole batch
 
-        report = []
-        for client in clients:
-            trs = self.__repo.get_all_for_client(client)
+        :param items: a list of tuples (id_film, id_client) or (id_film, id_client, id_transaction)
+        :return: the list of the items that failed, as tuples (item, exception), the other items are returned
+        (a malformed item fails with a ValidatorException)
+        """
+        failures = []
+
+        with UnitOfWork(self.__film_repo, self.__client_repo, self.__repo):
+            for item in items:
+                try:
+                    self.__return(*self.__unpack(item, (2, 3)))
+                except (RepoException, ValidatorException) as ex:
+                    failures.append((item, ex))
+
+        return failures
+
+    def __aggregate(self):
+        """
+        Gets the aggregates of all the transactions per client and per film,
+        rebuilding them in a single pass only if the transactions were changed outside this service
+
+        :return: RentalAggregation object
+        """
+        version = self.__repo.get_version()
+        if self.__aggregation_version != version:
+            self.__aggregation = RentalAggregation.build(self.__repo.get_all(), self.__aggregation_workers)
+            self.__aggregation_version = version
 
-            client_dto = ClientDTO(client.get_id(), client.get_name())
-            for tr in trs:
-                client_dto.add_film(tr.get_film())
+        return self.__aggregation
+
+    def __rank_clients(self, aggregation):
+        """
+        Gets the clients sorted by the number of rents, then by name and then by id,
+        sorting them again only if the clients or the transactions were changed outside this service
 
-            report.append(client_dto)
+        :param aggregation: RentalAggregation object, up to date
+        :return: Ranking object
+        """
+        versions = (self.__aggregation_version, self.__client_repo.get_version())
+        if self.__client_ranking_versions != versions:
+            self.__client_ranking = Ranking(self.__client_repo.get_all(),
+                                            key=lambda clt: (aggregation.get_client_num_films(clt.get_id()), clt.get_name(), clt.get_id()))
+            self.__client_ranking_versions = versions
+
+        return self.__client_ranking
+
+    def __rank_films(self, aggregation):
+        """
+        Gets the films sorted by the number of rents (the films with the same number in ascending order by id),
+        sorting them again only if the films or the transactions were changed outside this service
 
-        def cmp_client_dto(clt_dto1, clt_dto2):
+        :param aggregation: RentalAggregation object, up to date
+        :return: Ranking object
+        """
+        versions = (self.__aggregation_version, self.__film_repo.get_version())
+        if self.__film_ranking_versions != versions:
+            self.__film_ranking = Ranking(self.__film_repo.get_all(),
+                                          key=lambda flm: (aggregation.get_film_num_rent(flm.get_id()), -flm.get_id()))
+            self.__film_ranking_versions = versions
+
+        return self.__film_ranking
+
+    def __iter_client_dtos(self, aggregation, clients):
+        """
+        Builds a ClientDTO object for every client given, one at a time, using the aggregated transactions
+
+        :param aggregation: RentalAggregation object
+        :param clients: a list of Client objects
+        :return: a generator of ClientDTO objects
+        """
+        films = {film.get_id(): film for film in self.__film_repo.get_all()}
+
+        def current(film):
             """
-            Compares two ClientDTO objects on num_films and then on name
+            Gets the current version of a film from the repository (the aggregates may hold an older copy)
 
-            :param clt_dto1: ClientDTO
-            :param clt_dto2: ClientDTO
-            :return: -1 if less, 0 if equal or +1 if greater
+            :param film: Film object
+            :return: Film object
             """
-            if clt_dto1.get_num_films() < clt_dto2.get_num_films():
-                return -1
-            elif clt_dto1.get_num_films() > clt_dto2.get_num_films():
-                return 1
-            else:
-                if clt_dto1.get_name() < clt_dto2.get_name():
-                    return -1
-                elif clt_dto1.get_name() > clt_dto2.get_name():
-                    return 1
-                else:
-                    return 0
+            return films.get(film.get_id(), film)
 
-        report = Sorting.sorted(report, key=cmp_to_key(cmp_client_dto), reverse=True, method=SortingMethod.BINGO_SORT)
+        for client in clients:
+            yield ClientDTO(client.get_id(), client.get_name(),
+                            map(current, aggregation.get_client_films(client.get_id())), aggregation.get_client_num_films(client.get_id()))
 
-        str_report = list(map(lambda cl_dto: str(cl_dto), report))  # convert all the objects to their string version
+    @staticmethod
+    def __iter_film_dtos(aggregation, films):
+        """
+        Builds a FilmDTO object for every film given, one at a time, using the aggregated transactions
 
-        return str_report
+        :param aggregation: RentalAggregation object
+        :param films: a list of Film objects
+        :return: a generator of FilmDTO objects
+        """
+        for film in films:
+            yield FilmDTO(film.get_id(), film.get_title(), aggregation.get_film_num_rent(film.get_id()))
 
-    def report_first_clients(self):
+    def iter_clients_by_name(self):
         """
-        Generates a list of the first 30% ClientDTO objects from the sorted in descending order by
-        the number of rented films for each client
+        Generates the ClientDTO objects sorted by the client name, one at a time
 
-        :return: the list (with the string representation of the objects)
+        :return: a generator of ClientDTO objects
         """
-        str_report = self.report_clients_by_number()
+        clients = Sorting.sorted(self.__client_repo.get_all(), key=lambda clt: clt.get_name(), method=SortingMethod.MERGE_SORT)
 
-        limit = ceil(0.3 * len(str_report))  # 30% of the clients rounded up (so we can use it as an index limit)
+        return self.__iter_client_dtos(self.__aggregate(), clients)
 
-        return str_report[:limit]
+    def iter_clients_by_number(self):
+        """
+        Generates the ClientDTO objects sorted descending by the number of rented films for each client, one at a time
+        (the clients with the same number are sorted descending by name and then by id)
 
-    def report_films(self):
+        :return: a generator of ClientDTO objects
         """
-        Generates a list of FilmDTO objects sorted descending by the number of clients that rented each film
+        aggregation = self.__aggregate()
 
-        :return: the list (with the string representation of the objects)
+        return self.__iter_client_dtos(aggregation, self.__rank_clients(aggregation).descending())
+
+    def iter_first_clients(self):
         """
-        films = self.__film_repo.get_all()
+        Generates the first 30% ClientDTO objects from the sorted in descending order by
+        the number of rented films for each client, one at a time
 
-        report = []
-        for film in films:
-            trs = self.__repo.get_all_for_film(film)
+        :return: a generator of ClientDTO objects
+        """
+        aggregation = self.__aggregate()
+        clients = self.__client_repo.get_all()
 
-            film_dto = FilmDTO(film.get_id(), film.get_title())
-            for _ in trs:
-                film_dto.inc_num_rent()
+        limit = ceil(0.3 * len(clients))  # 30% of the clients rounded up (so we can use it as an index limit)
 
-            report.append(film_dto)
+        if self.__client_ranking_versions == (self.__aggregation_version, self.__client_repo.get_version()):
+            clients = self.__client_ranking.descending(limit)  # already ranked
+        else:
+            # select the first clients without sorting all of them, with the same key as the ranking of
+            # iter_clients_by_number (the key ends with the id, so the ties are broken the same way)
+            clients = Sorting.first_k(clients, limit, key=lambda clt: (aggregation.get_client_num_films(clt.get_id()), clt.get_name(), clt.get_id()),
+                                      reverse=True)
 
-        report = Sorting.sorted(report, key=lambda fl_dto: fl_dto.get_num_rent(), reverse=True, method=SortingMethod.MERGE_SORT)
+        return self.__iter_client_dtos(aggregation, clients)  # only the selected clients are built
 
-        str_report = list(map(lambda fl_dto: str(fl_dto), report))  # convert all the objects to their string version
+    def iter_films(self):
+        """
+        Generates the FilmDTO objects sorted descending by the number of clients that rented each film, one at a time
+        (the films with the same number are sorted ascending by id)
 
-        return str_report
+        :return: a generator of FilmDTO objects
+        """
+        aggregation = self.__aggregate()
 
-    def report_last_films(self, prefix):
+        return self.__iter_film_dtos(aggregation, self.__rank_films(aggregation).descending())
+
+    def iter_last_films(self, prefix):
         """
-        Generates a list of FilmDTO objects with titles that start with a given prefix, limits to last 50% films (ordered by num_rent)
-        and then sorts it by title
+        Generates the FilmDTO objects with titles that start with a given prefix, limited to last 50% films (ordered by num_rent)
+        and then sorted by title, one at a time
 
         :param prefix: string
-        :return: the list (with the string representation of the objects)
+        :return: a generator of FilmDTO objects
+        """
+        aggregation = self.__aggregate()
+
+        films = self.__film_repo.find_by_title_prefix(prefix)  # only the films with the prefix are aggregated
+
+        # the last 50% of rented films are the first 50% in ascending order by num_rent (ties broken by title)
+        limit = ceil(0.5 * len(films))  # first 50% of the films rounded up (so we can use it as an index limit)
+
+        films = Sorting.first_k(films, limit, key=lambda flm: (aggregation.get_film_num_rent(flm.get_id()), flm.get_title()))
+
+        films = Sorting.sorted(films, key=lambda flm: flm.get_title(), method=SortingMethod.MERGE_SORT)  # sorted in ascending order by title
+
+        return self.__iter_film_dtos(aggregation, films)
+
+    def __stream_report(self, name, args, repos, generate):
+        """
+        Generates the rows of a report one at a time: from the cache if the data it depends on didn't change since
+        it was cached, otherwise as the DTO objects are generated; the rows are kept only while there are at most
+        max_rows of them, and cached once all of them were generated, so a longer report is streamed without being kept
+
+        :param name: string, the name of the report
+        :param args: tuple, the arguments of the report
+        :param repos: tuple, the repositories the report depends on
+        :param generate: function without parameters which generates the DTO objects of the report
+        :return: a generator of strings
+        """
+        versions = tuple(repo.get_version() for repo in repos)
+
+        report = self.__report_cache.lookup(name, args, versions)
+        if report is not None:
+            yield from report
+            return
+
+        report = []  # None once the report is too long to be cached
+        for dto in generate():
+            row = str(dto)
+            if report is not None:
+                report.append(row)
+                if len(report) > self.__report_cache.get_max_rows():
+                    report = None
+            yield row
+
+        if report is not None:
+            self.__report_cache.put(name, args, versions, report)
+
+    def stream_clients_by_name(self):
+        """
+        Generates the rows of the report of clients sorted by the client name, one at a time
+        (served from the cache while the data doesn't change)
+
+        :return: a generator of strings (the string representation of the ClientDTO objects)
+        """
+        return self.__stream_report("clients_by_name", (), (self.__repo, self.__film_repo, self.__client_repo), self.iter_clients_by_name)
+
+    def stream_clients_by_number(self):
+        """
+        Generates the rows of the report of clients sorted descending by the number of rented films, one at a time
+        (served from the cache while the data doesn't change)
+
+        :return: a generator of strings (the string representation of the ClientDTO objects)
+        """
+        return self.__stream_report("clients_by_number", (), (self.__repo, self.__film_repo, self.__client_repo), self.iter_clients_by_number)
+
+    def stream_first_clients(self):
+        """
+        Generates the rows of the report of the first 30% clients by the number of rented films, one at a time
+        (served from the cache while the data doesn't change)
+
+        :return: a generator of strings (the string representation of the ClientDTO objects)
+        """
+        return self.__stream_report("first_clients", (), (self.__repo, self.__film_repo, self.__client_repo), self.iter_first_clients)
+
+    def stream_films(self):
+        """
+        Generates the rows of the report of films sorted descending by the number of rents, one at a time
+        (served from the cache while the data doesn't change)
+
+        :return: a generator of strings (the string representation of the FilmDTO objects)
         """
-        films = self.__film_repo.get_all()
+        return self.__stream_report("films", (), (self.__repo, self.__film_repo), self.iter_films)
 
-        filtered_films = list(filter(lambda flm: flm.get_title().startswith(prefix), films))  # filter the films with prefix
+    def stream_last_films(self, prefix):
+        """
+        Generates the rows of the report of the last 50% films by the number of rents with titles that start with
+        a given prefix, sorted by title, one at a time (served from the cache while the data doesn't change)
 
-        report = []
-        for film in filtered_films:
-            trs = self.__repo.get_all_for_film(film)
+        :param prefix: string
+        :return: a generator of strings (the string representation of the FilmDTO objects)
+        """
+        return self.__stream_report("last_films", (prefix,), (self.__repo, self.__film_repo), lambda: self.iter_last_films(prefix))
 
-            film_dto = FilmDTO(film.get_id(), film.get_title())
-            for _ in trs:
-                film_dto.inc_num_rent()
+    def report_clients_by_name(self):
+        """
+        Generates a list of ClientDTO objects sorted by the client name
 
-            report.append(film_dto)
+        :return: the list (with the string representation of the objects)
+        """
+        return list(self.stream_clients_by_name())
 
-        report = Sorting.sorted(report, key=lambda flm_dto: flm_dto.get_num_rent(), method=SortingMethod.BINGO_SORT)  # sorted in ascending order by num_rent
+    def report_clients_by_number(self):
+        """
+        Generates a list of ClientDTO objects sorted descending by the number of rented films for each client
 
-        # now the last 50% of rented films is the same with the first 50% here
-        limit = ceil(0.5 * len(report))  # first 50% of the films rounded up (so we can use it as an index limit)
+        :return: the list (with the string representation of the objects)
+        """
+        return list(self.stream_clients_by_number())
 
-        report = report[:limit]
+    def report_first_clients(self):
+        """
+        Generates a list of the first 30% ClientDTO objects from the sorted in descending order by
+        the number of rented films for each client
 
-        report = Sorting.sorted(report, key=lambda flm_dto: flm_dto.get_title(), method=SortingMethod.MERGE_SORT)  # sorted in ascending order by title
+        :return: the list (with the string representation of the objects)
+        """
+        return list(self.stream_first_clients())
 
-        str_report = list(map(lambda flm_dto: str(flm_dto), report))
+    def report_films(self):
+        """
+        Generates a list of FilmDTO objects sorted descending by the number of clients that rented each film
 
-        return str_report
+        :return: the list (with the string representation of the objects)
+        """
+        return list(self.stream_films())
+
+    def report_last_films(self, prefix):
+        """
+        Generates a list of FilmDTO objects with titles that start with a given prefix, limits to last 50% films (ordered by num_rent)
+        and then sorts it by title
+
+        :param prefix: string
+        :return: the list (with the string representation of the objects)
+        """
+        return list(self.stream_last_films(prefix))
 
     def generate_transactions_random(self, x, tweak=False):
         """
@@ -213,21 +465,23 @@ class TransactionService:
         :param tweak: boolean, if True makes the generation more diverse
         """
         no_of_gen_items = 0
-        self.__repo.clear()
 
-        while no_of_gen_items < x:
-            id_transaction = random.randint(1, x)
-            id_film = random.randint(1, self.__film_repo.size())
-            id_client = random.randint(1, self.__client_repo.size())
+        with UnitOfWork(self.__film_repo, self.__client_repo, self.__repo):  # all the generated transactions are written at once
+            self.__repo.clear()
+
+            while no_of_gen_items < x:
+                id_transaction = random.randint(1, x)
+                id_film = random.randint(1, self.__film_repo.size())
+                id_client = random.randint(1, self.__client_repo.size())
 
-            try:
-                self.rent_film_to_client(id_transaction, id_film, id_client)
+                try:
+                    self.__rent(id_transaction, id_film, id_client)
 
-                if tweak:
-                    chance = random.random()
-                    if chance < 0.4:
-                        self.return_film_from_client(id_film, id_client)
+                    if tweak:
+                        chance = random.random()
+                        if chance < 0.4:
+                            self.__return(id_film, id_client)
 
-                no_of_gen_items += 1
-            except (ValidatorException, RepoException):
-                pass
+                    no_of_gen_items += 1
+                except (ValidatorException, RepoException):
+                    pass
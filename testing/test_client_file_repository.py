@@ -7,6 +7,7 @@ import unittest
 from domain.entities import Client
 from domain.exceptions import RepoException
 from repositories.client_file_repository import ClientFileRepository
+from utils.file_utils import FsyncPolicy
 
 
 class TestCaseClientFileRepository(unittest.TestCase):
@@ -89,6 +90,44 @@ class TestCaseClientFileRepository(unittest.TestCase):
             self.__cl_repo.delete(10)
         self.assertEqual(str(cm.exception), "Id invalid")
 
+    def test_cache(self):
+        """
+        Test function for the in-memory cache of the repository
+        """
+        self.__cl_repo.add(self.__cl1)
+        self.assertEqual(self.__cl_repo.get_load_count(), 1)
+
+        self.assertEqual(self.__cl_repo.size(), 1)
+        self.__cl_repo.find(1)
+        self.assertEqual(self.__cl_repo.get_load_count(), 1)  # the file didn't change, nothing to reload
+        self.assertEqual(self.__cl_repo.get_avoided_load_count(), 2)
+
+        with open("test_clients.txt", "a") as fh:  # the file is changed by someone else
+            fh.write("2;Jane Doe;6211110068801\n")
+
+        self.assertEqual(self.__cl_repo.size(), 2)
+        self.assertEqual(self.__cl_repo.get_load_count(), 2)
+
+        self.__cl_repo.refresh()
+        self.assertEqual(self.__cl_repo.get_load_count(), 3)
+        self.assertEqual(self.__cl_repo.find(2).get_name(), "Jane Doe")
+
+    def test_append_mode(self):
+        """
+        Test function for adding clients in append mode
+        """
+        cl_repo = ClientFileRepository("test_clients.txt", append_mode=True, fsync_policy=FsyncPolicy.ALWAYS)
+        cl_repo.add(self.__cl1)
+        cl_repo.add(self.__cl2)
+
+        with open("test_clients.txt", "r") as fh:
+            self.assertEqual(fh.readlines(), ["1;Joe Doe;5211110068801\n", "2;Jane Doe;6211110068801\n"])
+        self.assertEqual(cl_repo.get_load_count(), 1)  # the appended lines don't trigger a reload
+
+        cl_repo.delete(1)
+        cl_repo.compact()
+        self.assertEqual(ClientFileRepository("test_clients.txt").get_all(), [self.__cl2])
+
     def test_clear(self):
         """
         Test function for clear
@@ -100,6 +139,24 @@ class TestCaseClientFileRepository(unittest.TestCase):
         self.__cl_repo.clear()
         self.assertEqual(self.__cl_repo.size(), 0)
 
+    def test_duplicate_cnps(self):
+        """
+        Test function for loading a file written before the CNPs were unique
+        """
+        with open("test_clients.txt", "w") as fh:
+            fh.write("3;a;5211110068801\n1;b;5211110068801\n2;c;6211110068801\n")
+
+        with self.assertRaises(RepoException) as cm:
+            self.__cl_repo.size()
+        self.assertEqual(str(cm.exception),
+                         "CNP-uri duplicate in fisierul test_clients.txt: 5211110068801 (clientii 3, 1)")
+        self.assertRaises(RepoException, self.__cl_repo.get_all)  # every access reports them until the file is fixed
+
+        with open("test_clients.txt", "w") as fh:
+            fh.write("3;a;5211110068801\n1;b;1211110068801\n2;c;6211110068801\n")
+        self.assertEqual(self.__cl_repo.size(), 3)
+        self.assertEqual(self.__cl_repo.find_by_cnp(1211110068801).get_id(), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
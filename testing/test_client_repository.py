@@ -49,6 +49,56 @@ class TestCaseClientRepository(unittest.TestCase):
             self.__cl_repo.find(3)
         self.assertEqual(str(cm.exception), "Id invalid")
 
+    def test_find_by_cnp(self):
+        """
+        Test function for finding a client by CNP, which is unique
+        """
+        self.__cl_repo.add(self.__cl1)
+        self.__cl_repo.add(self.__cl2)
+
+        self.assertIs(self.__cl_repo.find_by_cnp(6211110068801), self.__cl2)
+        self.assertIs(self.__cl_repo.find_by_cnp("6211110068801"), self.__cl2)
+
+        with self.assertRaises(RepoException) as cm:
+            self.__cl_repo.add(Client(3, "Jane Smith", 6211110068801))
+        self.assertEqual(str(cm.exception), "CNP existent")
+
+        with self.assertRaises(RepoException) as cm:
+            self.__cl_repo.modify(Client(1, "Joe Doe", 6211110068801))
+        self.assertEqual(str(cm.exception), "CNP existent")
+
+        self.__cl_repo.modify(Client(1, "Joe Doe", 5211110068809))
+        self.assertIs(self.__cl_repo.find_by_cnp(5211110068809), self.__cl1)
+        self.__cl_repo.delete(2)
+        self.__cl_repo.add(Client(3, "Jane Smith", 6211110068801))  # the CNP is free again
+
+        for cnp in [5211110068801, 5211110068803]:
+            with self.assertRaises(RepoException) as cm:
+                self.__cl_repo.find_by_cnp(cnp)
+            self.assertEqual(str(cm.exception), "CNP invalid")
+
+    def test_find_by_name(self):
+        """
+        Test function for finding clients by the beginnings of the words of their names
+        """
+        self.__cl_repo.add(self.__cl1)
+        self.__cl_repo.add(self.__cl2)
+        cl3 = Client(3, "Ștefan Doeanu", 5211110068803)
+        self.__cl_repo.add(cl3)
+
+        self.assertEqual(self.__cl_repo.find_by_name("doe"), [self.__cl1, self.__cl2, cl3])
+        self.assertEqual(self.__cl_repo.find_by_name("stefan d"), [cl3])
+
+        self.__cl_repo.modify(Client(1, "Joe Smith", 5211110068801))
+        self.assertEqual(self.__cl_repo.find_by_name("Doe"), [self.__cl2, cl3])
+        self.__cl_repo.delete(2)
+        self.assertEqual(self.__cl_repo.find_by_name("Doe"), [cl3])
+
+        self.__cl_repo.clear()  # the index is built again on the next search
+        self.__cl_repo.add(self.__cl2)
+        self.assertEqual(self.__cl_repo.find_by_name("Doe"), [self.__cl2])
+        self.assertEqual(self.__cl_repo.find_by_name("stefan"), [])
+
     def test_modify(self):
         """
         Test function for modifying a client
@@ -82,6 +132,40 @@ class TestCaseClientRepository(unittest.TestCase):
             self.__cl_repo.delete(10)
         self.assertEqual(str(cm.exception), "Id invalid")
 
+    def test_insertion_order(self):
+        """
+        Test function for the order of the objects after deletions
+        """
+        items = [Client(1, "nume1", 5211110068801), Client(2, "nume2", 5211110068802), Client(3, "nume3", 5211110068803), Client(4, "nume4", 5211110068804)]
+        for item in items:
+            self.__cl_repo.add(item)
+
+        self.__cl_repo.delete(2)
+        self.assertEqual(self.__cl_repo.get_all(), [items[0], items[2], items[3]])
+
+        self.__cl_repo.add(items[1])
+        self.assertEqual(self.__cl_repo.get_all(), [items[0], items[2], items[3], items[1]])
+        self.assertIs(self.__cl_repo.find(2), items[1])
+
+    def test_version(self):
+        """
+        Test function for the version of the data
+        """
+        versions = [self.__cl_repo.get_version()]
+        self.__cl_repo.add(self.__cl)
+        versions.append(self.__cl_repo.get_version())
+        self.__cl_repo.modify(self.__cl1)
+        versions.append(self.__cl_repo.get_version())
+        self.__cl_repo.delete(1)
+        versions.append(self.__cl_repo.get_version())
+        self.__cl_repo.clear()
+        versions.append(self.__cl_repo.get_version())
+        self.assertEqual(len(set(versions)), 5)
+
+        with self.assertRaises(RepoException):
+            self.__cl_repo.delete(1)
+        self.assertEqual(self.__cl_repo.get_version(), versions[-1])  # a failed change doesn't change the version
+
     def test_clear(self):
         """
         Test function for clear
@@ -31,6 +31,12 @@ class TestCaseClientDTO(unittest.TestCase):
         self.__cldto.add_film(self.__flm2)
         self.assertEqual(self.__cldto.get_num_films(), 3)
 
+        cldto = ClientDTO(2, "Jane Doe", [self.__flm, self.__flm2], 3)
+        self.assertEqual(cldto.get_films(), [self.__flm, self.__flm2])
+        self.assertEqual(cldto.get_num_films(), 3)
+        cldto.add_film(self.__flm2)
+        self.assertEqual(cldto.get_films(), [self.__flm, self.__flm2])
+
     def test_string(self):
         """
         Test function for string representation of ClientDTO
@@ -40,6 +46,15 @@ class TestCaseClientDTO(unittest.TestCase):
         self.__cldto.add_film(self.__flm)
         self.assertEqual(str(self.__cldto), "Id: 1, Nume: John Doe - 1:\n\tId: 1, Titlu: Film1\n")
 
+    def test_to_dict(self):
+        """
+        Test function for the dictionary representation of ClientDTO
+        """
+        self.assertEqual(self.__cldto.to_dict(), {"id": 1, "name": "John Doe", "num_films": 0, "films": []})
+
+        self.__cldto.add_film(self.__flm)
+        self.assertEqual(self.__cldto.to_dict()["films"], [{"id": 1, "title": "Film1"}])
+
 
 class TestCaseFilmDTO(unittest.TestCase):
     def setUp(self):
@@ -56,6 +71,8 @@ class TestCaseFilmDTO(unittest.TestCase):
         self.__flmdto.inc_num_rent()
         self.assertEqual(self.__flmdto.get_num_rent(), 1)
 
+        self.assertEqual(FilmDTO(2, "Film2", 5).get_num_rent(), 5)
+
     def test_string(self):
         """
         Test function for string representation fo FilmDTO
@@ -65,6 +82,12 @@ class TestCaseFilmDTO(unittest.TestCase):
         self.__flmdto.inc_num_rent()
         self.assertEqual(str(self.__flmdto), "Id: 1, Titlu: Film1 - 1\n")
 
+    def test_to_dict(self):
+        """
+        Test function for the dictionary representation of FilmDTO
+        """
+        self.assertEqual(self.__flmdto.to_dict(), {"id": 1, "title": "Film1", "num_rent": 0})
+
 
 if __name__ == '__main__':
     unittest.main()
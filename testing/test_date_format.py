@@ -0,0 +1,38 @@
+"""
+Test cases for date_format module
+"""
+import datetime
+import unittest
+
+from utils.date_format import parse_date, format_date
+
+
+class TestCaseDateFormat(unittest.TestCase):
+    def test_parse_date(self):
+        """
+        Test function for parse_date
+        """
+        self.assertEqual(parse_date("16.12.2021 21:06"), datetime.datetime(2021, 12, 16, 21, 6))
+        self.assertEqual(parse_date("01.02.0999 00:00"), datetime.datetime(999, 2, 1, 0, 0))
+        self.assertEqual(parse_date("1.2.2021 3:04"), datetime.datetime(2021, 2, 1, 3, 4))  # not zero padded
+        self.assertIs(parse_date("16.12.2021 21:06"), parse_date("16.12.2021 21:06"))  # cached
+
+        self.assertRaises(ValueError, parse_date, "31.02.2021 21:06")
+        self.assertRaises(ValueError, parse_date, "aa.bb.cccc dd:ee")
+        self.assertRaises(ValueError, parse_date, "16.12.2021")
+        self.assertRaises(ValueError, parse_date, "+1.12.2021 21:06")  # rejected by strptime, int() would accept them
+        self.assertRaises(ValueError, parse_date, "16.-1.2021 21:06")
+        self.assertRaises(ValueError, parse_date, "16.12.2_21 21:06")
+        self.assertEqual(parse_date(" 1.12.2021 21:06"), datetime.datetime(2021, 12, 1, 21, 6))  # as strptime
+
+    def test_format_date(self):
+        """
+        Test function for format_date
+        """
+        date = datetime.datetime(2021, 2, 1, 3, 4, 59)
+        self.assertEqual(format_date(date), date.strftime("%d.%m.%Y %H:%M"))
+        self.assertEqual(format_date(datetime.datetime(999, 12, 16, 21, 6)), "16.12.0999 21:06")
+
+
+if __name__ == '__main__':
+    unittest.main()
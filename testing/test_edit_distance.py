@@ -0,0 +1,33 @@
+"""
+Test cases for edit_distance module
+"""
+import unittest
+
+from utils.edit_distance import bounded_levenshtein
+
+
+class TestCaseEditDistance(unittest.TestCase):
+    def test_bounded_levenshtein(self):
+        """
+        Test function for bounded_levenshtein
+        """
+        self.assertEqual(bounded_levenshtein("Hacksaw Ridge", "Hacksaw Ridge", 2), 0)
+        self.assertEqual(bounded_levenshtein("Hacksw Ridge", "Hacksaw Ridge", 2), 1)  # insertion
+        self.assertEqual(bounded_levenshtein("Hacksaw Ridge", "Hacksw Ridge", 2), 1)  # deletion
+        self.assertEqual(bounded_levenshtein("Hackzaw Ridje", "Hacksaw Ridge", 2), 2)  # substitutions
+        self.assertEqual(bounded_levenshtein("kitten", "sitting", 3), 3)
+        self.assertEqual(bounded_levenshtein("", "abc", 3), 3)
+        self.assertEqual(bounded_levenshtein("", "", 0), 0)
+
+    def test_bound(self):
+        """
+        Test function for the distances greater than the bound
+        """
+        self.assertEqual(bounded_levenshtein("kitten", "sitting", 2), 3)
+        self.assertEqual(bounded_levenshtein("Home Alone", "Hacksaw Ridge", 2), 3)  # stops early
+        self.assertEqual(bounded_levenshtein("a", "abcdef", 4), 5)  # the lengths are too different
+        self.assertEqual(bounded_levenshtein("abc", "abd", 0), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -35,6 +35,13 @@ class TestCaseFilm(unittest.TestCase):
         self.assertEqual(self.__film, self.__film2)
         self.assertNotEqual(self.__film, self.__film3)
 
+    def test_hash(self):
+        """
+        Test function for the hash of a film
+        """
+        self.assertEqual(hash(self.__film), hash(self.__film2))
+        self.assertEqual(len({self.__film, self.__film2, self.__film3}), 2)
+
     def test_string(self):
         """
         Test for the string representation of a film
@@ -68,6 +75,13 @@ class TestCaseClient(unittest.TestCase):
         self.assertEqual(self.__cl1, self.__cl2)
         self.assertNotEqual(self.__cl1, self.__cl3)
 
+    def test_hash(self):
+        """
+        Test function for the hash of a client
+        """
+        self.assertEqual(hash(self.__cl1), hash(self.__cl2))
+        self.assertEqual(len({self.__cl1, self.__cl2, self.__cl3}), 2)
+
     def test_string(self):
         """
         Test function for the string representation of a client
@@ -124,6 +138,15 @@ class TestCaseTransaction(unittest.TestCase):
         self.assertNotEqual(self.__tr, self.__tr2)
         self.assertNotEqual(self.__tr, self.__tr3)
 
+    def test_hash(self):
+        """
+        Test function for the hash of a transaction
+        """
+        self.assertEqual(hash(self.__tr), hash(self.__tr4))
+        self.__tr4.return_transaction()
+        self.assertEqual(hash(self.__tr), hash(self.__tr4))  # the returned flag doesn't change the hash
+        self.assertEqual(len({self.__tr, self.__tr2, self.__tr3, self.__tr4}), 3)
+
     def test_string(self):
         """
         Test function for string representation of a transaction
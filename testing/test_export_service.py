@@ -0,0 +1,76 @@
+"""
+Test cases for export_service module
+"""
+import io
+import json
+import os
+import unittest
+
+from domain.entities import Film, Client
+from domain.validators import TransactionValidator
+from repositories.client_repository import ClientRepository
+from repositories.film_repository import FilmRepository
+from repositories.transaction_repository import TransactionRepository
+from services.export_service import ExportService, ExportFormat
+from services.transaction_service import TransactionService
+
+
+class TestCaseExportService(unittest.TestCase):
+    def setUp(self):
+        if os.path.exists("test_export.csv"):
+            os.remove("test_export.csv")
+
+        film_repo = FilmRepository()
+        client_repo = ClientRepository()
+        tr_srv = TransactionService(TransactionRepository(), TransactionValidator(), film_repo, client_repo)
+        self.__export_srv = ExportService(tr_srv)
+
+        film_repo.add(Film(1, "film, unu", "desc1", "gen1"))
+        film_repo.add(Film(2, "film2", "desc2", "gen2"))
+        client_repo.add(Client(1, "nume1", 5211110068801))
+        tr_srv.rent_film_to_client(1, 1, 1)
+        tr_srv.return_film_from_client(1, 1)
+        tr_srv.rent_film_to_client(2, 2, 1)
+
+    def tearDown(self):
+        if os.path.exists("test_export.csv"):
+            os.remove("test_export.csv")
+
+    def test_export_csv(self):
+        """
+        Test function for exporting a report to CSV
+        """
+        fh = io.StringIO()
+        self.assertEqual(self.__export_srv.export_report("clients_by_name", ExportFormat.CSV, fh), 1)
+        self.assertEqual(fh.getvalue().splitlines(), ["id,name,num_films,films", "1,nume1,2,1 2"])
+
+        self.assertEqual(self.__export_srv.export_report_to_file("last_films", ExportFormat.CSV, "test_export.csv", "film,"), 1)
+        with open("test_export.csv", "r", newline="") as fh:
+            self.assertEqual(fh.read().splitlines(), ["id,title,num_rent", '1,"film, unu",1'])
+
+    def test_export_jsonl(self):
+        """
+        Test function for exporting a report to JSON Lines
+        """
+        fh = io.StringIO()
+        self.assertEqual(self.__export_srv.export_report("films", ExportFormat.JSONL, fh), 2)
+        rows = sorted((json.loads(line) for line in fh.getvalue().splitlines()), key=lambda row: row["id"])  # both rented once
+        self.assertEqual(rows, [{"id": 1, "title": "film, unu", "num_rent": 1}, {"id": 2, "title": "film2", "num_rent": 1}])
+
+        fh = io.StringIO()
+        self.__export_srv.export_report("first_clients", ExportFormat.JSONL, fh)
+        self.assertEqual(json.loads(fh.getvalue())["films"], [{"id": 1, "title": "film, unu"}, {"id": 2, "title": "film2"}])
+
+    def test_unknown_report(self):
+        """
+        Test function for exporting an unknown report
+        """
+        self.assertEqual(self.__export_srv.get_report_names(), ["clients_by_name", "clients_by_number", "first_clients", "films", "last_films"])
+
+        with self.assertRaises(ValueError):
+            self.__export_srv.export_report_to_file("clients", ExportFormat.CSV, "test_export.csv")
+        self.assertFalse(os.path.exists("test_export.csv"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ import unittest
 from domain.entities import Film
 from domain.exceptions import RepoException
 from repositories.film_file_repository import FilmFileRepository
+from utils.file_utils import FsyncPolicy
 
 
 class TestCaseFilmFileRepository(unittest.TestCase):
@@ -89,6 +90,58 @@ class TestCaseFilmFileRepository(unittest.TestCase):
             self.__film_repo.modify(film3)
         self.assertEqual(str(cm.exception), "Id invalid")
 
+    def test_cache(self):
+        """
+        Test function for the in-memory cache of the repository
+        """
+        self.__film_repo.add(self.__film1)
+        self.assertEqual(self.__film_repo.get_load_count(), 1)
+
+        self.assertEqual(self.__film_repo.size(), 1)
+        self.__film_repo.find(1)
+        self.assertEqual(self.__film_repo.get_load_count(), 1)  # the file didn't change, nothing to reload
+        self.assertEqual(self.__film_repo.get_avoided_load_count(), 2)
+
+        with open("test_films.txt", "a") as fh:  # the file is changed by someone else
+            fh.write("2;film2;desc2;gen2\n")
+
+        self.assertEqual(self.__film_repo.size(), 2)
+        self.assertEqual(self.__film_repo.get_load_count(), 2)
+
+        self.__film_repo.refresh()
+        self.assertEqual(self.__film_repo.get_load_count(), 3)
+        self.assertEqual(self.__film_repo.find(2).get_title(), "film2")
+
+    def test_version(self):
+        """
+        Test function for the version of the data, which changes also when the file is changed
+        """
+        version = self.__film_repo.get_version()
+        self.__film_repo.add(self.__film1)
+        self.assertNotEqual(self.__film_repo.get_version(), version)
+
+        version = self.__film_repo.get_version()
+        self.assertEqual(self.__film_repo.get_version(), version)
+        with open("test_films.txt", "a") as fh:  # the file is changed by someone else
+            fh.write("2;film2;desc2;gen2\n")
+        self.assertNotEqual(self.__film_repo.get_version(), version)
+
+    def test_append_mode(self):
+        """
+        Test function for adding films in append mode
+        """
+        film_repo = FilmFileRepository("test_films.txt", append_mode=True, fsync_policy=FsyncPolicy.ALWAYS)
+        film_repo.add(self.__film1)
+        film_repo.add(self.__film2)
+
+        with open("test_films.txt", "r") as fh:
+            self.assertEqual(len(fh.readlines()), 2)
+        self.assertEqual(film_repo.get_load_count(), 1)  # the appended lines don't trigger a reload
+
+        film_repo.delete(1)
+        film_repo.compact()
+        self.assertEqual(FilmFileRepository("test_films.txt").get_all(), [self.__film2])
+
     def test_clear(self):
         """
         Test function for clear
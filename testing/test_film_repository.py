@@ -80,6 +80,104 @@ class TestCaseFilmRepository(unittest.TestCase):
             self.__film_repo.modify(film3)
         self.assertEqual(str(cm.exception), "Id invalid")
 
+    def test_insertion_order(self):
+        """
+        Test function for the order of the objects after deletions
+        """
+        items = [Film(1, "film1", "desc1", "gen1"), Film(2, "film2", "desc2", "gen2"), Film(3, "film3", "desc3", "gen3"), Film(4, "film4", "desc4", "gen4")]
+        for item in items:
+            self.__film_repo.add(item)
+
+        self.__film_repo.delete(2)
+        self.assertEqual(self.__film_repo.get_all(), [items[0], items[2], items[3]])
+
+        self.__film_repo.add(items[1])
+        self.assertEqual(self.__film_repo.get_all(), [items[0], items[2], items[3], items[1]])
+        self.assertIs(self.__film_repo.find(2), items[1])
+
+    def test_find_by_title(self):
+        """
+        Test function for finding films by a part of the title
+        """
+        self.__film_repo.add(self.__film2)
+        self.__film_repo.add(self.__film)
+
+        self.assertEqual(self.__film_repo.find_by_title("e"), [self.__film2, self.__film])
+        self.assertEqual(self.__film_repo.find_by_title("Ridge"), [self.__film])
+        self.assertEqual(self.__film_repo.find_by_title("ridge"), [])  # the case matters
+
+        self.__film_repo.modify(Film(1, "Home Alone", "", ""))
+        self.assertEqual(self.__film_repo.find_by_title("Ridge"), [])
+        self.assertEqual(self.__film_repo.find_by_title("Home"), [self.__film])
+
+        self.__film_repo.delete(3)
+        self.assertEqual(self.__film_repo.find_by_title("Redemption"), [])
+
+        self.__film_repo.clear()  # the index is built again on the next search
+        self.__film_repo.add(self.__film2)
+        self.assertEqual(self.__film_repo.find_by_title("Home"), [])
+        self.assertEqual(self.__film_repo.find_by_title("Redemption"), [self.__film2])
+
+    def test_find_by_title_prefix(self):
+        """
+        Test function for finding films by the beginning of the title
+        """
+        self.__film_repo.add(self.__film2)
+        self.__film_repo.add(self.__film)
+        film4 = Film(4, "The Shining", "desc4", "gen4")
+        self.__film_repo.add(film4)
+
+        self.assertEqual(self.__film_repo.find_by_title_prefix("The "), [self.__film2, film4])
+        self.assertEqual(self.__film_repo.find_by_title_prefix(""), [self.__film2, self.__film, film4])
+
+        self.__film_repo.modify(Film(1, "The Hateful Eight", "", ""))
+        self.assertEqual(self.__film_repo.find_by_title_prefix("The "), [self.__film2, self.__film, film4])
+        self.__film_repo.delete(3)
+        self.assertEqual(self.__film_repo.find_by_title_prefix("The S"), [film4])
+
+        self.__film_repo.clear()  # the index is built again on the next search
+        self.__film_repo.add(self.__film2)
+        self.assertEqual(self.__film_repo.find_by_title_prefix("The "), [self.__film2])
+
+    def test_find_by_title_fuzzy(self):
+        """
+        Test function for finding films by a misspelled title
+        """
+        self.__film_repo.add(self.__film2)
+        self.__film_repo.add(self.__film)
+        film4 = Film(4, "Hacksaw Ridges", "desc4", "gen4")
+        self.__film_repo.add(film4)
+
+        self.assertEqual(self.__film_repo.find_by_title_fuzzy("hacksw ridge", 2), [self.__film, film4])  # the closest first
+        self.assertEqual(self.__film_repo.find_by_title_fuzzy("hacksw ridge", 1), [self.__film])
+        self.assertEqual(self.__film_repo.find_by_title_fuzzy("The Shawshenk Redemtion", 2), [self.__film2])
+        self.assertEqual(self.__film_repo.find_by_title_fuzzy("Shawshank", 2), [])
+
+        self.__film_repo.modify(Film(4, "The Shawshank Redemptions", "", ""))
+        self.assertEqual(self.__film_repo.find_by_title_fuzzy("The Shawshenk Redemtion", 2), [self.__film2])
+        self.assertEqual(self.__film_repo.find_by_title_fuzzy("The Shawshenk Redemtion", 3), [self.__film2, film4])
+        self.__film_repo.delete(3)
+        self.assertEqual(self.__film_repo.find_by_title_fuzzy("The Shawshenk Redemtion", 3), [film4])
+
+    def test_version(self):
+        """
+        Test function for the version of the data
+        """
+        versions = [self.__film_repo.get_version()]
+        self.__film_repo.add(self.__film_)
+        versions.append(self.__film_repo.get_version())
+        self.__film_repo.modify(self.__film2)
+        versions.append(self.__film_repo.get_version())
+        self.__film_repo.delete(3)
+        versions.append(self.__film_repo.get_version())
+        self.__film_repo.clear()
+        versions.append(self.__film_repo.get_version())
+        self.assertEqual(len(set(versions)), 5)
+
+        with self.assertRaises(RepoException):
+            self.__film_repo.delete(3)
+        self.assertEqual(self.__film_repo.get_version(), versions[-1])  # a failed change doesn't change the version
+
     def test_clear(self):
         """
         Test function for clear
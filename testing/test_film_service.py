@@ -109,6 +109,18 @@ class TestCaseFilmService(unittest.TestCase):
         films = self.__film_srv.find_film_by_title("Hacksaw Ridge")
         self.assertEqual(films, [film1])
 
+    def test_find_film_by_title_fuzzy(self):
+        """
+        Test function for find_film_by_title_fuzzy
+        """
+        film1 = self.__film_srv.add_film(1, "Hacksaw Ridge", "Hacksaw Ridge is a 2016 biographical war film directed by Mel Gibson", "Biographical war")
+        film2 = self.__film_srv.add_film(3, "The Shawshank Redemption", "The Shawshank Redemption is a 1994 American drama film written and directed by Frank Darabont", "Drama film ")
+
+        self.assertEqual(self.__film_srv.find_film_by_title_fuzzy("Hacksaw Rigde"), [film1])
+        self.assertEqual(self.__film_srv.find_film_by_title_fuzzy("the shawshank redemption"), [film2])
+        self.assertEqual(self.__film_srv.find_film_by_title_fuzzy("Hacksaw Rigde", max_distance=1), [])
+        self.assertEqual(self.__film_srv.find_film_by_title_fuzzy("Home alone"), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,77 @@
+"""
+Test cases for ngram_index module
+"""
+import unittest
+
+from utils.ngram_index import NgramIndex
+
+
+class TestCaseNgramIndex(unittest.TestCase):
+    def setUp(self):
+        self.__index = NgramIndex()
+        self.__index.add(1, "Hacksaw Ridge")
+        self.__index.add(2, "Home Alone")
+        self.__index.add(3, "Home Alone 2")
+
+    def test_search(self):
+        """
+        Test function for searching a substring
+        """
+        self.assertEqual(self.__index.search("Home Alone"), [2, 3])
+        self.assertEqual(self.__index.search("saw"), [1])
+        self.assertEqual(self.__index.search("e A"), [2, 3])
+        self.assertEqual(self.__index.search("me"), [2, 3])  # shorter than a trigram
+        self.assertEqual(self.__index.search(""), [1, 2, 3])
+        self.assertEqual(self.__index.search("home"), [])
+        self.assertEqual(self.__index.search("RidgeHome"), [])
+        self.assertEqual(self.__index.search("lonlon"), [])  # the trigrams exist, but not in this order
+
+    def test_search_similar(self):
+        """
+        Test function for finding the candidates for the texts at a bounded edit distance
+        """
+        self.assertEqual(self.__index.search_similar("Home Alone", 0), [2, 3])  # every trigram must be found
+        self.assertEqual(self.__index.search_similar("Home Alone", 1), [2, 3])
+        self.assertEqual(self.__index.search_similar("Hacksw Ridge", 1), [1])
+        self.assertEqual(self.__index.search_similar("Home Alne", 2), [2, 3])  # a superset, "Home Alone 2" is 3 edits away
+        self.assertEqual(self.__index.search_similar("Home Ridge", 1), [])
+        self.assertEqual(self.__index.search_similar("Hme", 1), [1, 2, 3])  # too short to rule out any text
+
+    def test_padded(self):
+        """
+        Test function for an index of padded texts
+        """
+        index = NgramIndex(padded=True)
+        index.add(1, "up")
+        index.add(2, "cars")
+        index.add(3, "her")
+
+        self.assertEqual(index.search("ar"), [2])  # the padding isn't part of the texts
+        self.assertEqual(index.search("up"), [1])
+        self.assertEqual(index.search_similar("cats", 1), [2])  # short, but the padding gives it enough trigrams
+        self.assertEqual(index.search_similar("ups", 1), [1])
+        index.remove(2)
+        self.assertEqual(index.search_similar("cats", 1), [])
+
+    def test_add_remove(self):
+        """
+        Test function for replacing and removing texts
+        """
+        self.__index.add(1, "Home Sweet Home")  # keeps its position
+        self.assertEqual(self.__index.search("Home"), [1, 2, 3])
+        self.assertEqual(self.__index.search("saw"), [])
+
+        self.__index.remove(2)
+        self.__index.remove(7)
+        self.assertEqual(self.__index.search("Home"), [1, 3])
+
+        self.__index.add(2, "Home Alone")  # added again, at the end
+        self.assertEqual(self.__index.search("Home"), [1, 3, 2])
+
+        self.__index.clear()
+        self.assertEqual(self.__index.search("Home"), [])
+        self.assertEqual(self.__index.search(""), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Test cases for prefix_index module
+"""
+import unittest
+
+from utils.prefix_index import PrefixIndex
+
+
+class TestCasePrefixIndex(unittest.TestCase):
+    def setUp(self):
+        self.__index = PrefixIndex()
+        self.__index.add(1, "Home Alone 2")
+        self.__index.add(2, "Hacksaw Ridge")
+        self.__index.add(3, "Home Alone")
+        self.__index.add(4, "Home")
+
+    def test_search(self):
+        """
+        Test function for searching by prefix
+        """
+        self.assertEqual(self.__index.search("Home"), [1, 3, 4])  # in the order they were added
+        self.assertEqual(self.__index.search("Home A"), [1, 3])
+        self.assertEqual(self.__index.search("H"), [1, 2, 3, 4])
+        self.assertEqual(self.__index.search(""), [1, 2, 3, 4])
+        self.assertEqual(self.__index.search("home"), [])
+        self.assertEqual(self.__index.search("Ridge"), [])
+        self.assertEqual(self.__index.search("Home Alone 23"), [])
+
+    def test_add_remove(self):
+        """
+        Test function for replacing and removing texts
+        """
+        self.__index.add(2, "Home Sweet Home")  # keeps its position
+        self.assertEqual(self.__index.search("Home"), [1, 2, 3, 4])
+        self.assertEqual(self.__index.search("Ha"), [])
+
+        self.__index.add(5, "Home")  # the same text as another key
+        self.__index.remove(4)
+        self.__index.remove(7)
+        self.assertEqual(self.__index.search("Home"), [1, 2, 3, 5])
+
+        self.__index.add(4, "Home")  # added again, at the end
+        self.assertEqual(self.__index.search("Home"), [1, 2, 3, 5, 4])
+
+        self.__index.clear()
+        self.assertEqual(self.__index.search(""), [])
+
+    def test_add_all(self):
+        """
+        Test function for adding several texts at once
+        """
+        self.__index.add_all([(5, "Home Sweet Home"), (2, "Home Run"), (6, "Up")])
+        self.assertEqual(self.__index.search("Home"), [1, 2, 3, 4, 5])  # the replaced text keeps its position
+        self.assertEqual(self.__index.search("Ha"), [])
+        self.assertEqual(self.__index.search("U"), [6])
+
+        self.__index.remove(1)
+        self.__index.add(7, "Home Alone 3")
+        self.assertEqual(self.__index.search("Home Alone"), [3, 7])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""
+Test cases for ranking module
+"""
+import unittest
+
+from domain.entities import Client
+from services.ranking import Ranking
+
+
+class TestCaseRanking(unittest.TestCase):
+    def setUp(self):
+        self.__counts = {1: 2, 2: 0, 3: 2, 4: 1}
+        self.__clients = [Client(1, "b", 5211110068801), Client(2, "a", 6211110068801),
+                          Client(3, "a", 1960101223344), Client(4, "c", 2960101223344)]
+        self.__ranking = Ranking(self.__clients, key=lambda clt: (self.__counts[clt.get_id()], clt.get_name(), clt.get_id()))
+
+    def __ids(self, clients):
+        return [clt.get_id() for clt in clients]
+
+    def test_descending(self):
+        """
+        Test function for reading the objects in descending order by key
+        """
+        self.assertEqual(self.__ids(self.__ranking.descending()), [1, 3, 4, 2])
+        self.assertEqual(self.__ids(self.__ranking.descending(2)), [1, 3])
+        self.assertEqual(self.__ids(self.__ranking.descending(10)), [1, 3, 4, 2])
+        self.assertEqual(self.__ranking.descending(0), [])
+        self.assertEqual(self.__ranking.size(), 4)
+
+    def test_update(self):
+        """
+        Test function for moving the objects whose keys changed
+        """
+        self.__counts[2] = 2
+        self.__ranking.update(self.__clients[1])
+        self.assertEqual(self.__ids(self.__ranking.descending()), [1, 3, 2, 4])
+
+        self.__counts[4] = 5
+        self.__ranking.update(self.__clients[3])
+        self.assertEqual(self.__ids(self.__ranking.descending()), [4, 1, 3, 2])
+
+        self.__counts[5] = 3
+        self.__ranking.update(Client(5, "d", 1960101223345))  # a new object is added
+        self.assertEqual(self.__ids(self.__ranking.descending()), [4, 5, 1, 3, 2])
+        self.assertEqual(self.__ranking.size(), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Test cases for rental_aggregation module
+"""
+import unittest
+
+from domain.entities import Film, Client, Transaction
+from services.rental_aggregation import RentalAggregation
+
+
+class TestCaseRentalAggregation(unittest.TestCase):
+    def setUp(self):
+        self.__film1 = Film(1, "film1", "desc1", "gen1")
+        self.__film2 = Film(2, "film2", "desc2", "gen2")
+        self.__cl1 = Client(1, "nume1", 5211110068801)
+        self.__cl2 = Client(2, "nume2", 5211110068823)
+
+    def test_aggregate(self):
+        """
+        Test function for the per-client and per-film aggregates
+        """
+        aggregation = RentalAggregation([Transaction(1, self.__film2, self.__cl1), Transaction(2, self.__film1, self.__cl1),
+                                         Transaction(3, self.__film2, self.__cl1), Transaction(4, self.__film2, self.__cl2)])
+
+        self.assertEqual(aggregation.get_client_films(1), [self.__film2, self.__film1])
+        self.assertEqual(aggregation.get_client_num_films(1), 3)
+        self.assertEqual(aggregation.get_client_films(2), [self.__film2])
+        self.assertEqual(aggregation.get_film_num_rent(2), 3)
+        self.assertEqual(aggregation.get_film_num_rent(1), 1)
+
+        self.assertEqual(aggregation.get_client_films(3), [])
+        self.assertEqual(aggregation.get_client_num_films(3), 0)
+        self.assertEqual(aggregation.get_film_num_rent(3), 0)
+
+        aggregation.add(Transaction(5, self.__film1, self.__cl2))
+        self.assertEqual(aggregation.get_client_films(2), [self.__film2, self.__film1])
+        self.assertEqual(aggregation.get_film_num_rent(1), 2)
+
+    def test_build_parallel(self):
+        """
+        Test function for the aggregates computed by worker processes
+        """
+        films = [Film(id, f"film{id}", "desc", "gen") for id in range(1, 6)]
+        clients = [self.__cl1, self.__cl2]
+        transactions = [Transaction(i, films[(i * 7) % 5], clients[i % 3 % 2]) for i in range(100)]
+
+        serial = RentalAggregation(transactions)
+        parallel = RentalAggregation.build(transactions, workers=3, parallel_threshold=10)
+        small = RentalAggregation.build(transactions, workers=3)  # below the default threshold, computed serially
+
+        for aggregation in [parallel, small]:
+            for client in clients:
+                self.assertEqual(aggregation.get_client_films(client.get_id()), serial.get_client_films(client.get_id()))
+                self.assertEqual(aggregation.get_client_num_films(client.get_id()), serial.get_client_num_films(client.get_id()))
+            for film in films:
+                self.assertEqual(aggregation.get_film_num_rent(film.get_id()), serial.get_film_num_rent(film.get_id()))
+
+
+if __name__ == '__main__':
+    unittest.main()
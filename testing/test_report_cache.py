@@ -0,0 +1,85 @@
+"""
+Test cases for report_cache module
+"""
+import unittest
+
+from services.report_cache import ReportCache
+
+
+class TestCaseReportCache(unittest.TestCase):
+    def setUp(self):
+        self.__cache = ReportCache(max_size=2)
+        self.__calls = 0
+
+    def __generate(self):
+        self.__calls += 1
+        return [f"raport {self.__calls}"]
+
+    def test_get(self):
+        """
+        Test function for getting the reports from the cache
+        """
+        self.assertEqual(self.__cache.get("films", (), (1, 1), self.__generate), ["raport 1"])
+        self.assertEqual(self.__cache.get("films", (), (1, 1), self.__generate), ["raport 1"])
+        self.assertEqual(self.__calls, 1)
+        self.assertEqual(self.__cache.get_hit_count(), 1)
+        self.assertEqual(self.__cache.get_miss_count(), 1)
+
+        report = self.__cache.get("films", (), (1, 1), self.__generate)
+        report.append("modificat")  # the cached report is not changed through the returned copy
+        self.assertEqual(self.__cache.get("films", (), (1, 1), self.__generate), ["raport 1"])
+
+        self.assertEqual(self.__cache.get("films", (), (1, 2), self.__generate), ["raport 2"])  # the data changed
+        self.assertEqual(self.__cache.get("last_films", ("a",), (1, 2), self.__generate), ["raport 3"])
+        self.assertEqual(self.__cache.size(), 2)
+
+    def test_lookup_put(self):
+        """
+        Test function for looking up and adding the reports
+        """
+        self.assertIsNone(self.__cache.lookup("films", (), (1, 1)))
+        self.__cache.put("films", (), (1, 1), ["rand 1", "rand 2"])
+
+        report = self.__cache.lookup("films", (), (1, 1))
+        self.assertEqual(report, ["rand 1", "rand 2"])
+        report.append("modificat")
+        self.assertEqual(self.__cache.lookup("films", (), (1, 1)), ["rand 1", "rand 2"])
+        self.assertIsNone(self.__cache.lookup("films", (), (1, 2)))  # the data changed
+
+        self.assertEqual(self.__cache.get_hit_count(), 2)
+        self.assertEqual(self.__cache.get_miss_count(), 2)
+
+    def test_max_rows(self):
+        """
+        Test function for the reports too long to be kept
+        """
+        cache = ReportCache(max_rows=2)
+        cache.put("films", (), (1,), ["rand 1", "rand 2"])
+        self.assertEqual(cache.lookup("films", (), (1,)), ["rand 1", "rand 2"])
+
+        report = ["rand 1", "rand 2", "rand 3"]
+        cache.put("films", (), (2,), report)
+        self.assertEqual(cache.size(), 0)  # the previous version is removed too
+        self.assertEqual(cache.get("films", (), (2,), lambda: report), report)
+        self.assertEqual(cache.size(), 0)
+
+    def test_lru(self):
+        """
+        Test function for the eviction of the least recently used reports
+        """
+        self.__cache.get("last_films", ("a",), (1,), self.__generate)
+        self.__cache.get("last_films", ("b",), (1,), self.__generate)
+        self.__cache.get("last_films", ("a",), (1,), self.__generate)  # "b" becomes the least recently used
+        self.__cache.get("last_films", ("c",), (1,), self.__generate)
+        self.assertEqual(self.__cache.size(), 2)
+        self.assertEqual(self.__calls, 3)
+
+        self.assertEqual(self.__cache.get("last_films", ("a",), (1,), self.__generate), ["raport 1"])
+        self.assertEqual(self.__cache.get("last_films", ("b",), (1,), self.__generate), ["raport 4"])
+
+        self.__cache.clear()
+        self.assertEqual(self.__cache.size(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
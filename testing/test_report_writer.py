@@ -0,0 +1,28 @@
+"""
+Test cases for report_writer module
+"""
+import io
+import unittest
+
+from domain.datatransfer import FilmDTO
+from ui.report_writer import ReportWriter
+
+
+class TestCaseReportWriter(unittest.TestCase):
+    def test_write(self):
+        """
+        Test function for writing the rows of a report
+        """
+        fh = io.StringIO()
+        writer = ReportWriter(fh)
+
+        self.assertEqual(writer.write(iter([])), 0)
+        self.assertEqual(fh.getvalue(), "")
+
+        rows = (FilmDTO(id, f"film{id}", id) for id in range(1, 3))
+        self.assertEqual(writer.write(rows), 2)
+        self.assertEqual(fh.getvalue(), "Id: 1, Titlu: film1 - 1\n\nId: 2, Titlu: film2 - 2\n\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -41,6 +41,13 @@ class TestCaseSorting(unittest.TestCase):
             self.assertEqual(Sorting.sorted(self.l5, key=self.key1, method=_method), sorted(self.l5, key=self.key1))
             self.assertEqual(Sorting.sorted(self.l6, key=self.key2, method=_method), sorted(self.l6, key=self.key2))
 
+    def test_first_k(self):
+        for k in range(0, 10):
+            self.assertEqual(Sorting.first_k(self.l5, k), sorted(self.l5)[:k])
+            self.assertEqual(Sorting.first_k(self.l5, k, reverse=True), sorted(self.l5, reverse=True)[:k])
+            self.assertEqual(Sorting.first_k(self.l5, k, key=self.key1), sorted(self.l5, key=self.key1)[:k])
+            self.assertEqual(Sorting.first_k(self.l6, k, key=self.key2, reverse=True), sorted(self.l6, key=self.key2, reverse=True)[:k])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,195 @@
+"""
+Test cases for sqlite_client_repository module
+"""
+import os
+import sqlite3
+import unittest
+
+from domain.entities import Client
+from domain.exceptions import RepoException
+from repositories.sqlite_client_repository import SQLiteClientRepository
+from repositories.sqlite_database import SQLiteDatabase
+from repositories.unit_of_work import UnitOfWork
+
+
+class TestCaseSQLiteClientRepository(unittest.TestCase):
+    def setUp(self):
+        if os.path.exists("test_filme.db"):
+            os.remove("test_filme.db")
+        self.__cl_repo = SQLiteClientRepository(SQLiteDatabase("test_filme.db"))
+        self.__cl1 = Client(1, "Joe Doe", 5211110068801)
+        self.__cl2 = Client(2, "Jane Doe", 6211110068801)
+
+    def tearDown(self):
+        self.__cl_repo.close()
+        if os.path.exists("test_filme.db"):
+            os.remove("test_filme.db")
+
+    def test_add(self):
+        """
+        Test function for adding a client to the repository
+        """
+        self.assertEqual(self.__cl_repo.size(), 0)
+        self.__cl_repo.add(self.__cl1)
+        self.assertEqual(self.__cl_repo.size(), 1)
+
+        with self.assertRaises(RepoException) as cm:
+            self.__cl_repo.add(self.__cl1)
+        self.assertEqual(str(cm.exception), "Id existent")
+
+    def test_get_all(self):
+        """
+        Test function for get_all
+        """
+        self.__cl_repo.add(self.__cl1)
+        self.__cl_repo.add(self.__cl2)
+
+        self.assertEqual(self.__cl_repo.get_all(), [self.__cl1, self.__cl2])
+
+    def test_find(self):
+        """
+        Test function for finding a client
+        """
+        self.__cl_repo.add(self.__cl1)
+
+        client = self.__cl_repo.find(1)
+        self.assertEqual(client, self.__cl1)
+        self.assertEqual(client.get_cnp(), 5211110068801)
+
+        with self.assertRaises(RepoException) as cm:
+            self.__cl_repo.find(3)
+        self.assertEqual(str(cm.exception), "Id invalid")
+
+    def test_find_by_cnp(self):
+        """
+        Test function for finding a client by CNP, which is unique
+        """
+        self.__cl_repo.add(self.__cl1)
+        self.__cl_repo.add(self.__cl2)
+
+        self.assertEqual(self.__cl_repo.find_by_cnp(6211110068801), self.__cl2)
+
+        with self.assertRaises(RepoException) as cm:
+            self.__cl_repo.add(Client(3, "Jane Smith", 6211110068801))
+        self.assertEqual(str(cm.exception), "CNP existent")
+
+        with self.assertRaises(RepoException) as cm:
+            self.__cl_repo.modify(Client(1, "Joe Doe", 6211110068801))
+        self.assertEqual(str(cm.exception), "CNP existent")
+
+        with self.assertRaises(RepoException) as cm:
+            self.__cl_repo.find_by_cnp(5211110068803)
+        self.assertEqual(str(cm.exception), "CNP invalid")
+
+    def test_find_by_name(self):
+        """
+        Test function for finding clients by the beginnings of the words of their names
+        """
+        self.__cl_repo.add(self.__cl1)
+        self.__cl_repo.add(self.__cl2)
+
+        self.assertEqual(self.__cl_repo.find_by_name("doe"), [self.__cl1, self.__cl2])
+        self.assertEqual(self.__cl_repo.find_by_name("ja do"), [self.__cl2])
+        self.assertEqual(self.__cl_repo.find_by_name("oe"), [])
+
+        cl3 = Client(3, "Ștefan Doeanu", 5211110068803)  # changed after the index was built
+        self.__cl_repo.add(cl3)
+        self.assertEqual(self.__cl_repo.find_by_name("doe"), [self.__cl1, self.__cl2, cl3])
+        self.__cl_repo.modify(Client(1, "Joe Smith", 5211110068801))
+        self.assertEqual(self.__cl_repo.find_by_name("doe"), [self.__cl2, cl3])
+        self.__cl_repo.delete(2)
+        self.assertEqual(self.__cl_repo.find_by_name("doe"), [cl3])
+
+        other_repo = SQLiteClientRepository(SQLiteDatabase("test_filme.db"))
+        other_repo.add(Client(4, "Ana Doe", 6211110068804))  # changed through another connection
+        other_repo.close()
+        self.assertEqual([client.get_id() for client in self.__cl_repo.find_by_name("doe")], [3, 4])
+
+        with self.assertRaises(ValueError):
+            with UnitOfWork(self.__cl_repo):
+                self.__cl_repo.delete(4)
+                self.assertEqual(self.__cl_repo.find_by_name("ana"), [])
+                raise ValueError()
+        self.assertEqual([client.get_id() for client in self.__cl_repo.find_by_name("ana")], [4])
+
+    def test_modify(self):
+        """
+        Test function for modifying a client
+        """
+        self.__cl_repo.add(self.__cl1)
+
+        self.__cl_repo.modify(Client(1, "John Doe", 5211110068801))
+        self.assertEqual(self.__cl_repo.find(1).get_name(), "John Doe")
+
+        with self.assertRaises(RepoException) as cm:
+            self.__cl_repo.modify(Client(3, "John Doe", 5211110068801))
+        self.assertEqual(str(cm.exception), "Id invalid")
+
+    def test_delete(self):
+        """
+        Test function for deleting a client
+        """
+        self.__cl_repo.add(self.__cl1)
+        self.__cl_repo.add(self.__cl2)
+
+        self.__cl_repo.delete(1)
+        self.assertEqual(self.__cl_repo.get_all(), [self.__cl2])
+
+        with self.assertRaises(RepoException) as cm:
+            self.__cl_repo.delete(10)
+        self.assertEqual(str(cm.exception), "Id invalid")
+
+    def test_clear(self):
+        """
+        Test function for clear
+        """
+        self.__cl_repo.add(self.__cl1)
+        self.__cl_repo.add(self.__cl2)
+
+        self.__cl_repo.clear()
+        self.assertEqual(self.__cl_repo.size(), 0)
+
+    def test_version(self):
+        """
+        Test function for the version of the data
+        """
+        version = self.__cl_repo.get_version()
+        self.__cl_repo.add(self.__cl1)
+        self.assertNotEqual(self.__cl_repo.get_version(), version)
+
+        version = self.__cl_repo.get_version()
+        other_repo = SQLiteClientRepository(SQLiteDatabase("test_filme.db"))
+        other_repo.add(self.__cl2)  # changed through another connection
+        other_repo.close()
+        self.assertNotEqual(self.__cl_repo.get_version(), version)
+
+    def test_duplicate_cnps(self):
+        """
+        Test function for opening a database created before the CNPs were unique
+        """
+        self.__cl_repo.close()
+        os.remove("test_filme.db")
+        connection = sqlite3.connect("test_filme.db")
+        connection.execute("CREATE TABLE clients (seq INTEGER PRIMARY KEY, id INTEGER NOT NULL UNIQUE, "
+                           "name TEXT NOT NULL, cnp INTEGER NOT NULL)")
+        connection.executemany("INSERT INTO clients (id, name, cnp) VALUES (?, ?, ?)",
+                               [(3, "a", 5211110068801), (1, "b", 5211110068801), (2, "c", 6211110068801)])
+        connection.commit()
+
+        with self.assertRaises(RepoException) as cm:
+            SQLiteDatabase("test_filme.db")
+        self.assertEqual(str(cm.exception), "CNP-uri duplicate in baza de date: 5211110068801 (clientii 3, 1)")
+
+        connection.execute("UPDATE clients SET cnp = 1211110068801 WHERE id = 1")
+        connection.commit()
+        connection.close()
+
+        self.__cl_repo = SQLiteClientRepository(SQLiteDatabase("test_filme.db"))
+        self.assertEqual(self.__cl_repo.size(), 3)
+        with self.assertRaises(RepoException) as cm:
+            self.__cl_repo.add(Client(4, "d", 6211110068801))
+        self.assertEqual(str(cm.exception), "CNP existent")
+
+
+if __name__ == '__main__':
+    unittest.main()
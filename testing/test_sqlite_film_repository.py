@@ -0,0 +1,193 @@
+"""
+Test cases for sqlite_film_repository module
+"""
+import os
+import unittest
+
+from domain.entities import Film
+from domain.exceptions import RepoException
+from repositories.sqlite_database import SQLiteDatabase
+from repositories.sqlite_film_repository import SQLiteFilmRepository
+from repositories.unit_of_work import UnitOfWork
+
+
+class TestCaseSQLiteFilmRepository(unittest.TestCase):
+    def setUp(self):
+        if os.path.exists("test_filme.db"):
+            os.remove("test_filme.db")
+        self.__film_repo = SQLiteFilmRepository(SQLiteDatabase("test_filme.db"))
+        self.__film1 = Film(1, "Hacksaw Ridge", "Hacksaw Ridge is a 2016 biographical war film directed by Mel Gibson", "Biographical war")
+        self.__film2 = Film(3, "The Shawshank Redemption", "The Shawshank Redemption is a 1994 American drama film written and directed by Frank Darabont", "Drama film ")
+
+    def tearDown(self):
+        self.__film_repo.close()
+        if os.path.exists("test_filme.db"):
+            os.remove("test_filme.db")
+
+    def test_add(self):
+        """
+        Test function for adding a film to the repository
+        """
+        self.assertEqual(self.__film_repo.size(), 0)
+        self.__film_repo.add(self.__film1)
+        self.assertEqual(self.__film_repo.size(), 1)
+
+        with self.assertRaises(RepoException) as cm:
+            self.__film_repo.add(Film(1, "", "", ""))
+        self.assertEqual(str(cm.exception), "Id existent")
+
+    def test_get_all(self):
+        """
+        Test function for get_all
+        """
+        self.assertEqual(self.__film_repo.get_all(), [])
+
+        self.__film_repo.add(self.__film2)
+        self.__film_repo.add(self.__film1)
+
+        self.assertEqual(self.__film_repo.get_all(), [self.__film2, self.__film1])  # in insertion order
+
+    def test_find(self):
+        """
+        Test function for finding a film
+        """
+        self.__film_repo.add(self.__film1)
+
+        film = self.__film_repo.find(1)
+        self.assertEqual(film, self.__film1)
+        self.assertEqual(film.get_title(), self.__film1.get_title())
+
+        with self.assertRaises(RepoException) as cm:
+            self.__film_repo.find(2)
+        self.assertEqual(str(cm.exception), "Id invalid")
+
+    def test_modify(self):
+        """
+        Test function for modifying a film
+        """
+        self.__film_repo.add(self.__film1)
+
+        self.__film_repo.modify(Film(1, "aa", "bb", "cc"))
+        self.assertEqual(self.__film_repo.find(1).get_title(), "aa")
+
+        with self.assertRaises(RepoException) as cm:
+            self.__film_repo.modify(Film(6, "ss", "sdd", "ddd"))
+        self.assertEqual(str(cm.exception), "Id invalid")
+
+    def test_delete(self):
+        """
+        Test function for deleting a film from the repository
+        """
+        self.__film_repo.add(self.__film1)
+
+        self.__film_repo.delete(1)
+        self.assertEqual(self.__film_repo.size(), 0)
+
+        with self.assertRaises(RepoException) as cm:
+            self.__film_repo.delete(20)
+        self.assertEqual(str(cm.exception), "Id invalid")
+
+    def test_clear(self):
+        """
+        Test function for clear
+        """
+        self.__film_repo.add(self.__film1)
+        self.__film_repo.add(self.__film2)
+
+        self.__film_repo.clear()
+        self.assertEqual(self.__film_repo.size(), 0)
+
+    def test_find_by_title(self):
+        """
+        Test function for finding films by a part of the title
+        """
+        self.__film_repo.add(self.__film2)
+        self.__film_repo.add(self.__film1)
+
+        self.assertEqual(self.__film_repo.find_by_title("e"), [self.__film2, self.__film1])
+        self.assertEqual(self.__film_repo.find_by_title("redemption"), [])
+        self.assertEqual(self.__film_repo.find_by_title(""), [self.__film2, self.__film1])
+
+    def test_find_by_title_prefix(self):
+        """
+        Test function for finding films by the beginning of the title
+        """
+        self.__film_repo.add(self.__film2)
+        self.__film_repo.add(self.__film1)
+
+        self.assertEqual(self.__film_repo.find_by_title_prefix("The "), [self.__film2])
+        self.assertEqual(self.__film_repo.find_by_title_prefix(""), [self.__film2, self.__film1])
+        self.assertEqual(self.__film_repo.find_by_title_prefix("Ridge"), [])
+
+    def test_find_by_title_fuzzy(self):
+        """
+        Test function for finding films by a misspelled title
+        """
+        self.__film_repo.add(self.__film2)
+        self.__film_repo.add(self.__film1)
+
+        self.assertEqual(self.__film_repo.find_by_title_fuzzy("hacksw ridge", 1), [self.__film1])
+        self.assertEqual(self.__film_repo.find_by_title_fuzzy("The Shawshenk Redemtion", 2), [self.__film2])
+        self.assertEqual(self.__film_repo.find_by_title_fuzzy("Shawshank", 2), [])
+
+        film4 = Film(4, "Hacksaw Ridges", "desc4", "gen4")  # changed after the index was built
+        self.__film_repo.add(film4)
+        self.assertEqual(self.__film_repo.find_by_title_fuzzy("hacksw ridge", 2), [self.__film1, film4])
+        self.__film_repo.modify(Film(1, "Home Alone", "", ""))
+        self.assertEqual(self.__film_repo.find_by_title_fuzzy("hacksw ridge", 2), [film4])
+        self.__film_repo.delete(4)
+        self.assertEqual(self.__film_repo.find_by_title_fuzzy("hacksw ridge", 2), [])
+
+        other_repo = SQLiteFilmRepository(SQLiteDatabase("test_filme.db"))
+        other_repo.add(Film(5, "Hacksaw Ridge", "desc5", "gen5"))  # changed through another connection
+        other_repo.close()
+        self.assertEqual([film.get_id() for film in self.__film_repo.find_by_title_fuzzy("hacksw ridge", 1)], [5])
+
+        with self.assertRaises(ValueError):
+            with UnitOfWork(self.__film_repo):
+                self.__film_repo.delete(5)
+                self.assertEqual(self.__film_repo.find_by_title_fuzzy("hacksw ridge", 1), [])
+                raise ValueError()
+        self.assertEqual([film.get_id() for film in self.__film_repo.find_by_title_fuzzy("hacksw ridge", 1)], [5])
+
+    def test_version(self):
+        """
+        Test function for the version of the data
+        """
+        version = self.__film_repo.get_version()
+        self.__film_repo.add(self.__film1)
+        self.assertNotEqual(self.__film_repo.get_version(), version)
+
+        version = self.__film_repo.get_version()
+        other_repo = SQLiteFilmRepository(SQLiteDatabase("test_filme.db"))
+        other_repo.add(self.__film2)  # changed through another connection
+        other_repo.close()
+        self.assertNotEqual(self.__film_repo.get_version(), version)
+
+    def test_unit_of_work(self):
+        """
+        Test function for committing and rolling back a unit of work
+        """
+        with UnitOfWork(self.__film_repo):
+            self.__film_repo.add(self.__film1)
+
+        with self.assertRaises(ValueError):
+            with UnitOfWork(self.__film_repo):
+                self.__film_repo.add(self.__film2)
+                raise ValueError()
+
+        with UnitOfWork(self.__film_repo):
+            self.__film_repo.delete(self.__film1.get_id())
+            with self.assertRaises(ValueError):
+                with UnitOfWork(self.__film_repo):  # only the nested unit of work is rolled back
+                    self.__film_repo.add(self.__film2)
+                    raise ValueError()
+            self.__film_repo.add(self.__film1)
+
+        other_repo = SQLiteFilmRepository(SQLiteDatabase("test_filme.db"))
+        self.assertEqual(other_repo.get_all(), [self.__film1])
+        other_repo.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
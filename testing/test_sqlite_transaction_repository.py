@@ -0,0 +1,155 @@
+"""
+Test cases for sqlite_transaction_repository module
+"""
+import os
+import unittest
+
+from domain.entities import Film, Client, Transaction
+from domain.exceptions import RepoException
+from repositories.sqlite_client_repository import SQLiteClientRepository
+from repositories.sqlite_database import SQLiteDatabase
+from repositories.sqlite_film_repository import SQLiteFilmRepository
+from repositories.sqlite_transaction_repository import SQLiteTransactionRepository
+from repositories.unit_of_work import UnitOfWork
+
+
+class TestCaseSQLiteTransactionRepository(unittest.TestCase):
+    def setUp(self):
+        if os.path.exists("test_filme.db"):
+            os.remove("test_filme.db")
+        self.__database = SQLiteDatabase("test_filme.db")
+        self.__film_repo = SQLiteFilmRepository(self.__database)
+        self.__cl_repo = SQLiteClientRepository(self.__database)
+        self.__tr_repo = SQLiteTransactionRepository(self.__database)
+
+        self.__film = Film(1, "film1", "desc1", "gen1")
+        self.__film_repo.add(self.__film)
+        self.__cl = Client(1, "nume", 5211110068801)
+        self.__cl_repo.add(self.__cl)
+        self.__tr = Transaction(1, self.__film, self.__cl)
+
+    def tearDown(self):
+        self.__database.close()
+        if os.path.exists("test_filme.db"):
+            os.remove("test_filme.db")
+
+    def test_add(self):
+        """
+        Test function for adding a transaction to the repository
+        """
+        self.assertEqual(self.__tr_repo.size(), 0)
+
+        self.__tr_repo.add(self.__tr)
+
+        self.assertEqual(self.__tr_repo.size(), 1)
+
+        with self.assertRaises(RepoException) as cm:
+            self.__tr_repo.add(self.__tr)
+        self.assertEqual(str(cm.exception), "Id existent pentru inchiriere")
+
+    def test_return_transaction(self):
+        """
+        Test function for returning transactions in the repository
+        """
+        self.__tr_repo.add(self.__tr)
+
+        self.__tr_repo.return_transaction(self.__film, self.__cl)
+        self.assertRaises(RepoException, self.__tr_repo.find_by_film_client, self.__film, self.__cl)
+
+        with self.assertRaises(RepoException) as cm:
+            self.__tr_repo.return_transaction(self.__film, self.__cl)
+        self.assertEqual(str(cm.exception), "Inchiriere inexistenta")
+
+    def test_find_by_film_client(self):
+        """
+        Test function for find_by_film_client
+        """
+        self.__tr.return_transaction()
+        self.__tr_repo.add(self.__tr)
+        tr2 = Transaction(2, self.__film, self.__cl)
+        self.__tr_repo.add(tr2)
+
+        found = self.__tr_repo.find_by_film_client(self.__film, self.__cl)
+        self.assertEqual(found, tr2)
+        self.assertEqual(found.get_date(), tr2.get_date())
+        self.assertFalse(found.is_returned())
+
+        with self.assertRaises(RepoException) as cm:
+            self.__tr_repo.find_by_film_client(Film(2, "film2", "desc2", "gen2"), self.__cl)
+        self.assertEqual(str(cm.exception), "Inchiriere inexistenta")
+
+    def test_is_film_rented(self):
+        """
+        Test function for is_film_rented
+        """
+        self.assertFalse(self.__tr_repo.is_film_rented(self.__film))
+
+        self.__tr_repo.add(self.__tr)
+        self.assertTrue(self.__tr_repo.is_film_rented(self.__film))
+
+        self.__tr_repo.return_transaction(self.__film, self.__cl)
+        self.assertFalse(self.__tr_repo.is_film_rented(self.__film))
+
+    def test_get_all_for_client_film(self):
+        """
+        Test function for get_all_for_client and get_all_for_film
+        """
+        film2 = Film(2, "film2", "desc2", "gen2")
+        self.__film_repo.add(film2)
+        cl2 = Client(2, "nume2", 6211110068801)
+        self.__cl_repo.add(cl2)
+
+        self.__tr_repo.add(self.__tr)
+        tr2 = Transaction(2, film2, self.__cl)
+        self.__tr_repo.add(tr2)
+
+        self.assertEqual(self.__tr_repo.get_all_for_client(self.__cl), [self.__tr, tr2])
+        self.assertEqual(self.__tr_repo.get_all_for_client(cl2), [])
+        self.assertEqual(self.__tr_repo.get_all_for_film(film2), [tr2])
+
+    def test_clear(self):
+        """
+        Test function for clear
+        """
+        self.__tr_repo.add(self.__tr)
+
+        self.__tr_repo.clear()
+        self.assertEqual(self.__tr_repo.size(), 0)
+
+    def test_unit_of_work(self):
+        """
+        Test function for a unit of work over the films, the clients and the transactions of the same database
+        """
+        film2 = Film(2, "film2", "desc2", "gen2")
+        with UnitOfWork(self.__film_repo, self.__cl_repo, self.__tr_repo):
+            self.__film_repo.add(film2)
+            self.__tr_repo.add(Transaction(2, film2, self.__cl))
+
+        self.assertEqual(self.__tr_repo.size(), 1)
+        self.assertTrue(self.__tr_repo.is_film_rented(film2))
+
+        with self.assertRaises(ValueError):
+            with UnitOfWork(self.__film_repo, self.__cl_repo, self.__tr_repo):
+                self.__film_repo.add(Film(3, "film3", "desc3", "gen3"))
+                self.__tr_repo.return_transaction(film2, self.__cl)
+                raise ValueError()
+
+        self.assertEqual(self.__film_repo.size(), 2)
+        self.assertTrue(self.__tr_repo.is_film_rented(film2))
+
+    def test_deleted_film_client(self):
+        """
+        Test function for the transactions of a deleted film or client, which are kept
+        """
+        self.__tr_repo.add(self.__tr)
+        self.__film_repo.delete(1)
+        self.__cl_repo.delete(1)
+
+        self.assertEqual(self.__tr_repo.size(), 1)
+        self.assertEqual(len(self.__tr_repo.get_all()), 1)
+        self.assertEqual(self.__tr_repo.get_all()[0].get_film().get_id(), 1)
+        self.assertEqual(self.__tr_repo.get_all()[0].get_client().get_id(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
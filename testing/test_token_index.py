@@ -0,0 +1,76 @@
+"""
+Test cases for token_index module
+"""
+import unittest
+
+from utils.token_index import TokenIndex, tokenize
+
+
+class TestCaseTokenIndex(unittest.TestCase):
+    def setUp(self):
+        self.__index = TokenIndex()
+        self.__index.add(1, "Ștefan Popescu")
+        self.__index.add(2, "Ana-Maria Ţăran")
+        self.__index.add(3, "Stelian Pop")
+
+    def test_tokenize(self):
+        """
+        Test function for the normalization of the texts
+        """
+        self.assertEqual(tokenize("Ana-Maria ŢĂRAN"), ["ana", "maria", "taran"])
+        self.assertEqual(tokenize("  Ștefan  Işa "), ["stefan", "isa"])
+        self.assertEqual(tokenize(""), [])
+
+    def test_search(self):
+        """
+        Test function for searching by prefixes of words
+        """
+        self.assertEqual(self.__index.search("pop"), [1, 3])
+        self.assertEqual(self.__index.search("POPESCU"), [1])
+        self.assertEqual(self.__index.search("ste"), [1, 3])
+        self.assertEqual(self.__index.search("ste pope"), [1])
+        self.assertEqual(self.__index.search("maria taran"), [2])
+        self.assertEqual(self.__index.search("țăr ana"), [2])
+        self.assertEqual(self.__index.search("escu"), [])  # only prefixes of words
+        self.assertEqual(self.__index.search("ste ana"), [])
+        self.assertEqual(self.__index.search(""), [1, 2, 3])
+
+        self.assertTrue(TokenIndex.matches("ste pope", "Ștefan Popescu"))
+        self.assertFalse(TokenIndex.matches("escu", "Ștefan Popescu"))
+
+    def test_add_remove(self):
+        """
+        Test function for replacing and removing texts
+        """
+        self.__index.add(3, "Ion Popa")  # keeps its position
+        self.assertEqual(self.__index.search("ste"), [1])
+        self.assertEqual(self.__index.search("pop"), [1, 3])
+
+        self.__index.remove(1)
+        self.__index.remove(7)
+        self.assertEqual(self.__index.search("pop"), [3])
+        self.assertEqual(self.__index.search("stefan"), [])
+
+        self.__index.add(1, "Ștefan Popescu")  # added again, at the end
+        self.assertEqual(self.__index.search("pop"), [3, 1])
+
+        self.__index.clear()
+        self.assertEqual(self.__index.search(""), [])
+
+    def test_add_all(self):
+        """
+        Test function for adding several texts at once
+        """
+        self.__index.add_all([(4, "Ion Popa"), (3, "Stelian Ionescu"), (5, "Popa Stelian")])
+        self.assertEqual(self.__index.search("pop"), [1, 4, 5])
+        self.assertEqual(self.__index.search("stel"), [3, 5])  # the replaced text keeps its position
+        self.assertEqual(self.__index.search("ion"), [3, 4])
+
+        self.__index.remove(4)
+        self.__index.add(6, "Ionel Pop")
+        self.assertEqual(self.__index.search("ion"), [3, 6])
+        self.assertEqual(self.__index.search("popa"), [5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -96,6 +96,77 @@ class TestCaseTransactionFileRepository(unittest.TestCase):
         self.__tr_repo.return_transaction(tr2.get_film(), tr2.get_client())
         self.assertFalse(self.__tr_repo.is_film_rented(self.__film))
 
+    def test_cache(self):
+        """
+        Test function for the in-memory cache of the repository
+        """
+        self.__tr_repo.add(self.__tr)
+        self.assertEqual(self.__tr_repo.get_load_count(), 1)
+
+        self.assertTrue(self.__tr_repo.is_film_rented(self.__film))
+        self.assertEqual(self.__tr_repo.size(), 1)
+        self.assertEqual(self.__tr_repo.get_load_count(), 1)  # the file didn't change, nothing to reload
+        self.assertEqual(self.__tr_repo.get_avoided_load_count(), 2)
+
+        with open("test_transactions.txt", "a") as fh:  # the file is changed by someone else
+            fh.write("2;1;1;True;16.12.2021 21:06\n")
+
+        self.assertEqual(self.__tr_repo.size(), 2)
+        self.assertEqual(self.__tr_repo.get_load_count(), 2)
+
+        self.__tr_repo.refresh()
+        self.assertEqual(self.__tr_repo.get_load_count(), 3)
+
+    def test_append_mode(self):
+        """
+        Test function for adding transactions in append mode
+        """
+        tr_repo = TransactionFileRepository("test_transactions.txt", self.__film_repo, self.__cl_repo, append_mode=True)
+        tr_repo.add(self.__tr)
+        tr2 = Transaction(2, self.__film, self.__cl)
+        tr_repo.add(tr2)
+
+        with open("test_transactions.txt", "r") as fh:
+            self.assertEqual(len(fh.readlines()), 2)
+        self.assertEqual(tr_repo.get_load_count(), 1)  # the appended lines don't trigger a reload
+
+        tr_repo.return_transaction(self.__film, self.__cl)  # modifications rewrite the whole file
+        tr_repo2 = TransactionFileRepository("test_transactions.txt", self.__film_repo, self.__cl_repo)
+        self.assertEqual(tr_repo2.size(), 2)
+        self.assertEqual(tr_repo2.find_by_film_client(self.__film, self.__cl), tr2)  # the first one was returned
+
+    def test_load_join(self):
+        """
+        Test function for loading the transactions with a single lookup of the films and clients
+        """
+        class CountingFilmRepository(FilmRepository):
+            def __init__(self):
+                super().__init__()
+                self.calls = 0
+
+            def find(self, id):
+                self.calls += 1
+                return super().find(id)
+
+            def get_all(self):
+                self.calls += 1
+                return super().get_all()
+
+        film_repo = CountingFilmRepository()
+        film_repo.add(self.__film)
+        for i in range(1, 11):
+            self.__tr_repo.add(Transaction(i, self.__film, self.__cl))
+
+        tr_repo = TransactionFileRepository("test_transactions.txt", film_repo, self.__cl_repo)
+        self.assertEqual(tr_repo.size(), 10)
+        self.assertEqual(film_repo.calls, 1)
+
+        with open("test_transactions.txt", "a") as fh:
+            fh.write("11;7;1;False;16.12.2021 21:06\n")  # the film doesn't exist
+        with self.assertRaises(RepoException) as cm:
+            tr_repo.refresh()
+        self.assertEqual(str(cm.exception), "Id invalid")
+
     def test_clear(self):
         """
         Test function for clear
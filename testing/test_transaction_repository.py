@@ -24,6 +24,7 @@ class TestCaseTransactionRepository(unittest.TestCase):
         self.__tr_repo.add(self.__tr)
 
         self.assertEqual(self.__tr_repo.size(), 1)
+        self.assertEqual(self.__tr_repo.get_all(), [self.__tr])
 
         with self.assertRaises(RepoException) as cm:
             self.__tr_repo.add(self.__tr)
@@ -78,6 +79,48 @@ class TestCaseTransactionRepository(unittest.TestCase):
         self.__tr_repo.return_transaction(tr2.get_film(), tr2.get_client())
         self.assertFalse(self.__tr_repo.is_film_rented(self.__film))
 
+    def test_indexes(self):
+        """
+        Test function for the film, client and open rental indexes
+        """
+        film2 = Film(2, "film2", "desc2", "gen2")
+        cl2 = Client(2, "nume2", 6211110068801)
+        tr2 = Transaction(2, film2, self.__cl)
+        tr3 = Transaction(3, film2, cl2)
+        tr3.return_transaction()  # already returned when added
+
+        self.__tr_repo.add(self.__tr)
+        self.__tr_repo.add(tr3)
+        self.__tr_repo.add(tr2)
+
+        self.assertEqual(self.__tr_repo.get_all_for_client(self.__cl), [self.__tr, tr2])
+        self.assertEqual(self.__tr_repo.get_all_for_client(cl2), [tr3])
+        self.assertEqual(self.__tr_repo.get_all_for_film(film2), [tr3, tr2])
+        self.assertRaises(RepoException, self.__tr_repo.find_by_film_client, film2, cl2)
+        self.assertEqual(self.__tr_repo.find_by_film_client(film2, self.__cl), tr2)
+
+        self.__tr_repo.return_transaction(film2, self.__cl)
+        self.assertFalse(self.__tr_repo.is_film_rented(film2))
+        self.assertTrue(self.__tr_repo.is_film_rented(self.__film))
+
+        tr4 = Transaction(4, film2, cl2)
+        tr5 = Transaction(5, film2, cl2)
+        tr6 = Transaction(6, film2, self.__cl)
+        for tr in [tr4, tr5, tr6]:  # open rents of the same film, as they can be found in a file
+            self.__tr_repo.add(tr)
+        self.__tr_repo.return_transaction(film2, cl2)
+        self.assertTrue(tr4.is_returned())  # the oldest rent is returned first
+        self.assertEqual(self.__tr_repo.find_by_film_client(film2, cl2), tr5)
+        self.__tr_repo.return_transaction(film2, cl2)
+        self.assertRaises(RepoException, self.__tr_repo.return_transaction, film2, cl2)
+        self.assertTrue(self.__tr_repo.is_film_rented(film2))
+        self.__tr_repo.return_transaction(film2, self.__cl)
+        self.assertFalse(self.__tr_repo.is_film_rented(film2))
+
+        self.__tr_repo.clear()
+        self.assertFalse(self.__tr_repo.is_film_rented(self.__film))
+        self.assertEqual(self.__tr_repo.get_all_for_film(film2), [])
+
     def test_clear(self):
         """
         Test function for clear
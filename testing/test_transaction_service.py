@@ -2,10 +2,11 @@
 Test cases for transaction_service module
 """
 import os.path
+import random
 import unittest
 
 from domain.datatransfer import ClientDTO, FilmDTO
-from domain.entities import Film, Client
+from domain.entities import Film, Client, Transaction
 from domain.exceptions import RepoException, ValidatorException
 from domain.validators import TransactionValidator, FilmValidator, ClientValidator
 from repositories.client_file_repository import ClientFileRepository
@@ -16,6 +17,7 @@ from repositories.transaction_file_repository import TransactionFileRepository
 from repositories.transaction_repository import TransactionRepository
 from services.client_service import ClientService
 from services.film_service import FilmService
+from services.report_cache import ReportCache
 from services.transaction_service import TransactionService
 
 
@@ -251,6 +253,28 @@ class TestCaseTransactionService(unittest.TestCase):
 
         self.assertEqual(self.__tr_srv.report_first_clients(), [str(cldto1), str(cldto2)])
 
+    def test_report_first_clients_prefix(self):
+        """
+        Test function for report_first_clients being a prefix of report_clients_by_number, also for the clients
+        with the same number of films and the same name
+        """
+        rnd = random.Random(7)
+        for i in range(1, 41):
+            self.__film_repo.add(Film(i, f"film{i}", "desc", "gen"))
+        for i in range(1, 21):
+            self.__client_repo.add(Client(i, rnd.choice(["ana", "ion"]), 5211110068800 + i))
+        for i in range(1, 41):
+            self.__tr_repo.add(Transaction(i, self.__film_repo.find(i), self.__client_repo.find(rnd.randint(1, 20))))
+
+        def ids(dtos):
+            return [dto.get_id() for dto in dtos]
+
+        first = ids(self.__tr_srv.iter_first_clients())  # selected with a heap
+        by_number = ids(self.__tr_srv.iter_clients_by_number())
+        self.assertEqual(len(first), 6)
+        self.assertEqual(first, by_number[:len(first)])
+        self.assertEqual(ids(self.__tr_srv.iter_first_clients()), first)  # taken from the ranking
+
     def test_report_last_films(self):
         """
         Test function for report_last_films
@@ -288,6 +312,244 @@ class TestCaseTransactionService(unittest.TestCase):
 
         self.assertEqual(self.__tr_srv.report_last_films("fi"), [str(flmdto3), str(flmdto4)])
 
+    def test_report_incremental(self):
+        """
+        Test function for the aggregates kept up to date by rent and return
+        """
+        class CountingTransactionRepository(TransactionRepository):
+            def __init__(self):
+                super().__init__()
+                self.get_all_calls = 0
+
+            def get_all(self):
+                self.get_all_calls += 1
+                return super().get_all()
+
+        tr_repo = CountingTransactionRepository()
+        tr_srv = TransactionService(tr_repo, self.__tr_valid, self.__film_repo, self.__client_repo)
+
+        film = Film(1, "film1", "desc1", "gen1")
+        film2 = Film(2, "film2", "desc2", "gen2")
+        self.__film_repo.add(film)
+        self.__film_repo.add(film2)
+        client = Client(1, "nume1", 5211110068801)
+        self.__client_repo.add(client)
+
+        flmdto1 = FilmDTO(film.get_id(), film.get_title())
+        flmdto2 = FilmDTO(film2.get_id(), film2.get_title())
+        self.assertEqual(len(tr_srv.report_films()), 2)
+        self.assertEqual(tr_repo.get_all_calls, 1)
+
+        tr_srv.rent_film_to_client(1, film2.get_id(), client.get_id())
+        tr_srv.return_film_from_client(film2.get_id(), client.get_id())
+        flmdto2.inc_num_rent()
+        self.assertEqual(tr_srv.report_films(), [str(flmdto2), str(flmdto1)])
+        self.assertEqual(tr_repo.get_all_calls, 1)  # served from the updated aggregates
+
+        tr_repo.add(Transaction(2, film, client))  # changed outside the service, the aggregates are rebuilt
+        tr_repo.add(Transaction(3, film, client))
+        flmdto1.inc_num_rent()
+        flmdto1.inc_num_rent()
+        self.assertEqual(tr_srv.report_films(), [str(flmdto1), str(flmdto2)])
+        self.assertEqual(tr_repo.get_all_calls, 2)
+
+        self.__film_srv.modify_film(film2.get_id(), "film2 nou", "desc2", "gen2")
+        cldto = ClientDTO(client.get_id(), client.get_name(), [film2, film], 3)
+        self.assertEqual(tr_srv.report_clients_by_name(), [str(cldto)])
+        self.assertIn("film2 nou", tr_srv.report_clients_by_name()[0])
+
+    def test_report_ranking(self):
+        """
+        Test function for the clients and films ranked by the number of rents, kept up to date by rent
+        """
+        tr_srv = TransactionService(self.__tr_repo, self.__tr_valid, self.__film_repo, self.__client_repo)
+        for i in range(1, 7):
+            self.__film_repo.add(Film(i, f"film{i}", "desc", "gen"))
+        for i, name in enumerate(["b", "a", "b", "a"], start=1):  # same names, the clients are then ordered by id
+            self.__client_repo.add(Client(i, name, 5211110068800 + i))
+
+        def ids(dtos):
+            return [dto.get_id() for dto in dtos]
+
+        self.assertEqual(ids(tr_srv.iter_clients_by_number()), [3, 1, 4, 2])
+        self.assertEqual(ids(tr_srv.iter_films()), [1, 2, 3, 4, 5, 6])
+
+        rents = [(2, 4), (5, 2), (1, 4), (6, 1), (3, 2), (4, 3), (5, 1)]
+        for id_transaction, (id_film, id_client) in enumerate(rents, start=1):
+            tr_srv.rent_film_to_client(id_transaction, id_film, id_client)
+            tr_srv.return_film_from_client(id_film, id_client)
+
+            rebuilt_srv = TransactionService(self.__tr_repo, self.__tr_valid, self.__film_repo, self.__client_repo)
+            self.assertEqual(ids(tr_srv.iter_clients_by_number()), ids(rebuilt_srv.iter_clients_by_number()))
+            self.assertEqual(ids(tr_srv.iter_films()), ids(rebuilt_srv.iter_films()))
+
+        self.assertEqual(ids(tr_srv.iter_clients_by_number()), [1, 4, 2, 3])
+        self.assertEqual(ids(tr_srv.iter_films()), [5, 1, 2, 3, 4, 6])
+
+        self.__client_repo.modify(Client(2, "c", 5211110068802))  # changed outside, the ranking is sorted again
+        self.assertEqual(ids(tr_srv.iter_clients_by_number()), [2, 1, 4, 3])
+
+    def test_report_cache(self):
+        """
+        Test function for the reports served from the cache until the data changes
+        """
+        cache = ReportCache()
+        tr_srv = TransactionService(self.__tr_repo, self.__tr_valid, self.__film_repo, self.__client_repo, cache)
+
+        film = Film(1, "film1", "desc1", "gen1")
+        self.__film_repo.add(film)
+        client = Client(1, "nume1", 5211110068801)
+        self.__client_repo.add(client)
+
+        report = tr_srv.report_films()
+        self.assertEqual(tr_srv.report_films(), report)
+        self.assertEqual(tr_srv.report_last_films("f"), tr_srv.report_last_films("f"))
+        self.assertEqual(cache.get_miss_count(), 2)
+        self.assertEqual(cache.get_hit_count(), 2)
+
+        tr_srv.rent_film_to_client(1, film.get_id(), client.get_id())
+        self.assertNotEqual(tr_srv.report_films(), report)
+        self.assertEqual(cache.get_miss_count(), 3)
+
+        self.__client_srv.modify_client(client.get_id(), "nume nou", 5211110068801)
+        tr_srv.report_films()  # doesn't depend on the clients
+        self.assertEqual(cache.get_hit_count(), 3)
+        self.assertIn("nume nou", tr_srv.report_clients_by_name()[0])
+
+    def test_stream_reports(self):
+        """
+        Test function for the reports streamed one row at a time and served from the cache
+        """
+        cache = ReportCache()
+        tr_srv = TransactionService(self.__tr_repo, self.__tr_valid, self.__film_repo, self.__client_repo, cache)
+
+        film = Film(1, "film1", "desc1", "gen1")
+        self.__film_repo.add(film)
+        self.__film_repo.add(Film(2, "film2", "desc2", "gen2"))
+        client = Client(1, "nume1", 5211110068801)
+        self.__client_repo.add(client)
+        tr_srv.rent_film_to_client(1, film.get_id(), client.get_id())
+
+        rows = tr_srv.stream_films()
+        self.assertEqual(next(rows), str(FilmDTO(1, "film1", 1)))
+        rows.close()  # a report which wasn't read until the end is not cached
+        self.assertEqual(cache.size(), 0)
+
+        report = list(tr_srv.stream_films())
+        self.assertEqual(report, tr_srv.report_films())
+        self.assertEqual(list(tr_srv.stream_films()), report)
+        self.assertEqual(cache.get_hit_count(), 2)
+
+        self.assertEqual(list(tr_srv.stream_last_films("film")), tr_srv.report_last_films("film"))
+        self.assertEqual(list(tr_srv.stream_clients_by_name()), tr_srv.report_clients_by_name())
+        self.assertEqual(list(tr_srv.stream_clients_by_number()), tr_srv.report_clients_by_number())
+        self.assertEqual(list(tr_srv.stream_first_clients()), tr_srv.report_first_clients())
+        self.assertEqual(cache.get_hit_count(), 6)
+
+        cache = ReportCache(max_rows=1)  # the reports longer than one row are streamed without being kept
+        tr_srv = TransactionService(self.__tr_repo, self.__tr_valid, self.__film_repo, self.__client_repo, cache)
+        self.assertEqual(list(tr_srv.stream_films()), report)
+        self.assertEqual(list(tr_srv.stream_clients_by_name()), tr_srv.report_clients_by_name())
+        self.assertEqual(cache.size(), 1)
+
+    def test_iter_reports(self):
+        """
+        Test function for the reports generated one row at a time
+        """
+        self.assertEqual(list(self.__tr_srv.iter_films()), [])
+
+        film = Film(1, "film1", "desc1", "gen1")
+        film2 = Film(2, "film2", "desc2", "gen2")
+        self.__film_repo.add(film)
+        self.__film_repo.add(film2)
+        client = Client(1, "nume2", 5211110068801)
+        client2 = Client(2, "nume1", 5211110068823)
+        self.__client_repo.add(client)
+        self.__client_repo.add(client2)
+
+        self.__tr_srv.rent_film_to_client(1, film2.get_id(), client.get_id())
+
+        rows = self.__tr_srv.iter_clients_by_name()
+        row = next(rows)
+        self.assertIsInstance(row, ClientDTO)
+        self.assertEqual((row.get_id(), row.get_num_films()), (2, 0))
+        self.assertEqual([(cl_dto.get_id(), cl_dto.get_films()) for cl_dto in rows], [(1, [film2])])
+
+        self.assertEqual([cl_dto.get_id() for cl_dto in self.__tr_srv.iter_clients_by_number()], [1, 2])
+        self.assertEqual([cl_dto.get_id() for cl_dto in self.__tr_srv.iter_first_clients()], [1])
+        self.assertEqual([(flm_dto.get_id(), flm_dto.get_num_rent()) for flm_dto in self.__tr_srv.iter_films()], [(2, 1), (1, 0)])
+        self.assertEqual([flm_dto.get_id() for flm_dto in self.__tr_srv.iter_last_films("film")], [1])
+
+        self.assertEqual(self.__tr_srv.report_films(), list(map(str, self.__tr_srv.iter_films())))
+
+    def test_rent_return_io(self):
+        """
+        Test function for the number of file reads and writes made by rent and return
+        """
+        film_repo = FilmFileRepository("test_films.txt")
+        client_repo = ClientFileRepository("test_clients.txt")
+        tr_repo = TransactionFileRepository("test_transactions.txt", film_repo, client_repo)
+        tr_srv = TransactionService(tr_repo, self.__tr_valid, film_repo, client_repo)
+
+        film_repo.add(Film(1, "film1", "desc1", "gen1"))
+        film_repo.add(Film(2, "film2", "desc2", "gen2"))
+        client_repo.add(Client(1, "nume1", 5211110068801))
+        tr_srv.rent_film_to_client(1, 1, 1)
+
+        repos = [film_repo, client_repo, tr_repo]
+        loads = [repo.get_load_count() for repo in repos]
+        writes = [repo.get_write_count() for repo in repos]
+
+        tr_srv.rent_film_to_client(2, 2, 1)
+        tr_srv.return_film_from_client(1, 1)
+        with self.assertRaises(RepoException):
+            tr_srv.rent_film_to_client(3, 2, 1)  # a failed rent doesn't reload the snapshot
+
+        self.assertEqual([repo.get_load_count() for repo in repos], loads)
+        self.assertEqual([repo.get_write_count() for repo in repos], [writes[0], writes[1], writes[2] + 2])
+
+        with open("test_clients.txt", "a") as fh:  # the clients are changed by someone else
+            fh.write("2;nume2;5211110068802\n")
+        tr_srv.rent_film_to_client(3, 1, 2)
+        self.assertEqual([repo.get_load_count() for repo in repos], [loads[0], loads[1] + 1, loads[2]])
+        self.assertEqual(TransactionFileRepository("test_transactions.txt", film_repo, client_repo).size(), 3)
+
+    def test_rent_return_many(self):
+        """
+        Test function for renting and returning batches of films
+        """
+        film_repo = FilmFileRepository("test_films.txt")
+        client_repo = ClientFileRepository("test_clients.txt")
+        tr_repo = TransactionFileRepository("test_transactions.txt", film_repo, client_repo)
+        tr_srv = TransactionService(tr_repo, self.__tr_valid, film_repo, client_repo)
+
+        for id in range(1, 4):
+            film_repo.add(Film(id, f"film{id}", f"desc{id}", f"gen{id}"))
+        client_repo.add(Client(1, "nume1", 5211110068801))
+        writes = tr_repo.get_write_count()
+
+        failures = tr_srv.rent_many([(1, 1, 1), (2, 1, 2), (2, 1, 3), (7, 1, 4), (3, 1, -1), (3, 1, 5)])
+        self.assertEqual([(item, str(ex)) for item, ex in failures],
+                         [((2, 1, 3), "Filmul este deja inchiriat"), ((7, 1, 4), "Id invalid"), ((3, 1, -1), "Id invalid\n")])
+        self.assertEqual(tr_repo.size(), 3)
+        self.assertEqual(tr_repo.get_write_count(), writes + 1)
+
+        failures = tr_srv.return_many([(1, 1), (1, 1), (2, 1, 9), (2, 1, 2), (3, 2)])
+        self.assertEqual([item for item, ex in failures], [(1, 1), (2, 1, 9), (3, 2)])
+        self.assertEqual(tr_repo.get_write_count(), writes + 2)
+        self.assertFalse(tr_repo.is_film_rented(film_repo.find(2)))
+        self.assertTrue(tr_repo.is_film_rented(film_repo.find(3)))
+
+        failures = tr_srv.rent_many([(2, 1), 2, (2, 1, 6, 7), (2, 1, 6)])  # the malformed items fail alone
+        self.assertEqual([(item, str(ex)) for item, ex in failures],
+                         [((2, 1), "Inchiriere invalida\n"), (2, "Inchiriere invalida\n"), ((2, 1, 6, 7), "Inchiriere invalida\n")])
+        self.assertTrue(tr_repo.is_film_rented(film_repo.find(2)))
+
+        failures = tr_srv.return_many([(2,), None, (2, 1, 6, 7), (2, 1, 6)])
+        self.assertEqual([item for item, ex in failures], [(2,), None, (2, 1, 6, 7)])
+        self.assertTrue(all(isinstance(ex, ValidatorException) for item, ex in failures))
+        self.assertFalse(tr_repo.is_film_rented(film_repo.find(2)))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,186 @@
+"""
+Test cases for unit_of_work module
+"""
+import os
+import unittest
+
+from domain.entities import Film, Client, Transaction
+from repositories.client_file_repository import ClientFileRepository
+from repositories.client_repository import ClientRepository
+from repositories.film_file_repository import FilmFileRepository
+from repositories.transaction_file_repository import TransactionFileRepository
+from repositories.unit_of_work import UnitOfWork
+
+
+class TestCaseUnitOfWork(unittest.TestCase):
+    def setUp(self):
+        if os.path.exists("test_films.txt"):
+            os.remove("test_films.txt")
+        if os.path.exists("test_transactions.txt"):
+            os.remove("test_transactions.txt")
+        if os.path.exists("test_clients.txt"):
+            os.remove("test_clients.txt")
+        self.__film_repo = FilmFileRepository("test_films.txt", append_mode=True)
+        self.__film1 = Film(1, "film1", "desc1", "gen1")
+        self.__film2 = Film(2, "film2", "desc2", "gen2")
+        self.__film3 = Film(3, "film3", "desc3", "gen3")
+
+    def tearDown(self):
+        if os.path.exists("test_films.txt"):
+            os.remove("test_films.txt")
+        if os.path.exists("test_transactions.txt"):
+            os.remove("test_transactions.txt")
+        if os.path.exists("test_clients.txt"):
+            os.remove("test_clients.txt")
+
+    def __read_lines(self, filename):
+        with open(filename, "r") as fh:
+            return fh.readlines()
+
+    def test_commit(self):
+        """
+        Test function for committing a unit of work
+        """
+        with UnitOfWork(self.__film_repo):
+            self.__film_repo.add(self.__film1)
+            self.__film_repo.add(self.__film2)
+
+            with UnitOfWork(self.__film_repo):  # nested units of work are written by the outermost one
+                self.__film_repo.add(self.__film3)
+
+            self.assertFalse(os.path.exists("test_films.txt"))
+            self.assertEqual(self.__film_repo.size(), 3)
+
+        self.assertEqual(len(self.__read_lines("test_films.txt")), 3)
+        self.assertEqual(self.__film_repo.get_load_count(), 1)
+
+        with UnitOfWork(self.__film_repo):
+            self.__film_repo.delete(1)
+            self.__film_repo.add(self.__film1)
+
+        self.assertEqual(FilmFileRepository("test_films.txt").get_all(), [self.__film2, self.__film3, self.__film1])
+
+    def test_rollback(self):
+        """
+        Test function for rolling back a unit of work
+        """
+        self.__film_repo.add(self.__film1)
+
+        with self.assertRaises(ValueError):
+            with UnitOfWork(self.__film_repo):
+                self.__film_repo.add(self.__film2)
+                self.__film_repo.delete(1)
+                raise ValueError()
+
+        self.assertEqual(self.__film_repo.get_all(), [self.__film1])
+        self.assertEqual(len(self.__read_lines("test_films.txt")), 1)
+
+    def test_nested_rollback(self):
+        """
+        Test function for rolling back a nested unit of work which didn't change anything
+        """
+        with UnitOfWork(self.__film_repo):
+            self.__film_repo.add(self.__film1)
+
+            with self.assertRaises(ValueError):
+                with UnitOfWork(self.__film_repo):
+                    self.__film_repo.find(1)
+                    raise ValueError()
+
+            self.__film_repo.add(self.__film2)
+
+        self.assertEqual(len(self.__read_lines("test_films.txt")), 2)
+        self.assertEqual(self.__film_repo.get_load_count(), 1)
+        self.assertEqual(self.__film_repo.get_write_count(), 1)
+
+    def test_nested_rollback_changes(self):
+        """
+        Test function for rolling back a nested unit of work which changed the films, keeping the outer changes
+        """
+        self.__film_repo.add(self.__film3)
+
+        with UnitOfWork(self.__film_repo):
+            self.__film_repo.add(self.__film1)
+
+            with self.assertRaises(ValueError):
+                with UnitOfWork(self.__film_repo):
+                    self.__film_repo.add(self.__film2)
+                    self.__film_repo.modify(Film(1, "titlu nou", "desc nou", "gen nou"))
+                    self.__film_repo.delete(3)
+                    raise ValueError()
+
+            self.assertEqual(self.__film_repo.get_all(), [self.__film3, self.__film1])
+            self.assertEqual(self.__film_repo.find(1).get_title(), "film1")
+            self.assertEqual(self.__film_repo.find_by_title("film"), [self.__film3, self.__film1])
+
+        self.assertEqual(FilmFileRepository("test_films.txt").get_all(), [self.__film3, self.__film1])
+        self.assertEqual(len(self.__read_lines("test_films.txt")), 2)
+
+    def test_nested_rollback_clients_transactions(self):
+        """
+        Test function for rolling back a nested unit of work which changed the clients and the transactions
+        """
+        client1 = Client(1, "nume", 5211110068801)
+        client2 = Client(2, "altul", 6211110068801)
+        client_repo = ClientFileRepository("test_clients.txt", append_mode=True)
+        tr_repo = TransactionFileRepository("test_transactions.txt", self.__film_repo, client_repo)
+        self.__film_repo.add(self.__film1)
+
+        with UnitOfWork(client_repo, tr_repo):
+            client_repo.add(client1)
+            tr_repo.add(Transaction(1, self.__film1, client1))
+
+            with self.assertRaises(ValueError):
+                with UnitOfWork(client_repo, tr_repo):
+                    client_repo.add(client2)
+                    client_repo.modify(Client(1, "alt nume", 1960101223344))
+                    tr_repo.return_transaction(self.__film1, client1)
+                    raise ValueError()
+
+            self.assertEqual(client_repo.get_all(), [client1])
+            self.assertEqual(client_repo.find_by_cnp(5211110068801).get_name(), "nume")
+            self.assertTrue(tr_repo.is_film_rented(self.__film1))
+
+        self.assertEqual(ClientFileRepository("test_clients.txt").get_all(), [client1])
+        self.assertEqual(len(self.__read_lines("test_transactions.txt")), 1)
+        self.assertTrue(tr_repo.is_film_rented(self.__film1))
+
+    def test_commit_failure(self):
+        """
+        Test function for a unit of work in which a repository fails to write its file
+        """
+        failing_repo = FilmFileRepository(os.path.join("missing_directory", "test_films.txt"))
+        client_repo = ClientFileRepository("test_clients.txt")
+
+        with self.assertRaises(IOError):
+            with UnitOfWork(failing_repo, client_repo):
+                failing_repo.add(self.__film1)
+                client_repo.add(Client(1, "nume", 5211110068801))
+
+        self.assertEqual(failing_repo.size(), 0)  # the changes which weren't written are discarded
+        self.assertEqual(client_repo.size(), 0)  # rolled back, not left inside the unit of work
+
+        client_repo.add(Client(2, "altul", 6211110068801))
+        self.assertEqual(len(self.__read_lines("test_clients.txt")), 1)
+
+    def test_transactions(self):
+        """
+        Test function for a unit of work over films and transactions
+        """
+        client = Client(1, "nume", 5211110068801)
+        client_repo = ClientRepository()
+        client_repo.add(client)
+        tr_repo = TransactionFileRepository("test_transactions.txt", self.__film_repo, client_repo)
+
+        with UnitOfWork(self.__film_repo, client_repo, tr_repo):
+            self.__film_repo.add(self.__film1)
+            tr_repo.add(Transaction(1, self.__film1, client))
+            tr_repo.return_transaction(self.__film1, client)
+            tr_repo.add(Transaction(2, self.__film1, client))
+
+        self.assertEqual(len(self.__read_lines("test_transactions.txt")), 2)
+        self.assertTrue(tr_repo.is_film_rented(self.__film1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,8 @@
 Implementation of a menu-based console application
 """
 from domain.exceptions import RepoException, ValidatorException
+from services.export_service import ExportFormat
+from ui.report_writer import ReportWriter
 
 
 class Console:
@@ -9,17 +11,20 @@ class Console:
     Manages a menu application and handles events accordingly
     """
 
-    def __init__(self, film_srv, client_srv, transaction_srv):
+    def __init__(self, film_srv, client_srv, transaction_srv, export_srv):
         """
         Initializes the console UI
 
         :param film_srv: FilmService object
         :param client_srv: ClientService object
         :param transaction_srv: TransactionService object
+        :param export_srv: ExportService object
         """
         self.__film_service = film_srv
         self.__client_service = client_srv
         self.__transaction_service = transaction_srv
+        self.__export_service = export_srv
+        self.__report_writer = ReportWriter()
 
     def __get_command(self):
         """
@@ -56,6 +61,7 @@ class Console:
             "report_films": self.__report_films_ui,
             "report_first_clients": self.__report_first_clients_ui,
             "report_last_films": self.__report_last_films,
+            "export": self.__export_ui,
             "rent": self.__rent_ui,
             "return": self.__return_ui,
             "random": self.__random_ui,
@@ -238,53 +244,37 @@ class Console:
         """
         Prints the report of clients with a list of films for each client, ordered by the name
         """
-        report = self.__transaction_service.report_clients_by_name()
+        report = self.__transaction_service.stream_clients_by_name()
 
-        if not report:
+        if self.__report_writer.write(report) == 0:  # the rows are printed as they are generated or read from the cache
             print("Nu exista inchirieri")
-            return
-
-        for item in report:
-            print(item)
 
     def __report_clients_by_number_ui(self):
         """
         Prints the report of clients with a lits of films for each client, ordered descending by the number of films rented
         """
-        report = self.__transaction_service.report_clients_by_number()
+        report = self.__transaction_service.stream_clients_by_number()
 
-        if not report:
+        if self.__report_writer.write(report) == 0:  # the rows are printed as they are generated or read from the cache
             print("Nu exista inchirieri")
-            return
-
-        for item in report:
-            print(item)
 
     def __report_films_ui(self):
         """
         Prints the report of films ordered descending by number of transactions for the film
         """
-        report = self.__transaction_service.report_films()
+        report = self.__transaction_service.stream_films()
 
-        if not report:
+        if self.__report_writer.write(report) == 0:  # the rows are printed as they are generated or read from the cache
             print("Nu exista inchirieri")
-            return
-
-        for item in report:
-            print(item)
 
     def __report_first_clients_ui(self):
         """
         Prints the report of first 30% of clients order descending by the number of films rented
         """
-        report = self.__transaction_service.report_first_clients()
+        report = self.__transaction_service.stream_first_clients()
 
-        if not report:
+        if self.__report_writer.write(report) == 0:  # the rows are printed as they are generated or read from the cache
             print("Nu exista inchirieri")
-            return
-
-        for item in report:
-            print(item)
 
     def __report_last_films(self):
         """
@@ -292,14 +282,33 @@ class Console:
         """
         prefix = input("Introduceti un prefix: ").strip()
 
-        report = self.__transaction_service.report_last_films(prefix)
+        report = self.__transaction_service.stream_last_films(prefix)
 
-        if not report:
+        if self.__report_writer.write(report) == 0:  # the rows are printed as they are generated or read from the cache
             print("Nu exista inchirieri")
+
+    def __export_ui(self):
+        """
+        Exports a report to a CSV or JSON Lines file
+        """
+        names = self.__export_service.get_report_names()
+        report = input(f"Introduceti raportul ({', '.join(names)}): ").strip()
+        if report not in names:
+            print("Raport invalid")
+            return
+
+        formats = {"csv": ExportFormat.CSV, "jsonl": ExportFormat.JSONL}
+        export_format = input("Introduceti formatul (csv, jsonl): ").strip().lower()
+        if export_format not in formats:
+            print("Format invalid")
             return
 
-        for item in report:
-            print(item)
+        prefix = input("Introduceti un prefix: ").strip() if report == "last_films" else ""
+        filename = input("Introduceti numele fisierului: ").strip()
+
+        count = self.__export_service.export_report_to_file(report, formats[export_format], filename, prefix)
+
+        print(f"Au fost exportate {count} randuri in fisierul {filename}")
 
     def __find_client_by_name_ui(self):
         """
@@ -318,7 +327,8 @@ class Console:
 
     def __find_film_by_title_ui(self):
         """
-        Searches for the films with the given title in the repository and prints them if found any
+        Searches for the films with the given title in the repository and prints them if found any,
+        otherwise prints the films with similar titles
         """
         title = input("Introduceti un titlu: ").strip()
 
@@ -326,6 +336,12 @@ class Console:
 
         if not films:
             print("Nu au fost gasit niciun film")
+
+            suggestions = self.__film_service.find_film_by_title_fuzzy(title)
+            if suggestions:
+                print("Filme cu titluri asemanatoare:")
+                for film in suggestions:
+                    print(film)
             return
 
         for film in films:
@@ -408,6 +424,7 @@ class Console:
         report_films - generare raport cele mai inchiriate filme
         report_first_clients - generare raport primii 30% clienti cu cele mai multe filme 
         report_last_films - generare raport top 50% cele mai putin inchiriate filme care incep cu un string dat, sortate alfabetic dupa nume.
+        export - exporta un raport intr-un fisier CSV sau JSON Lines
         rent - inchiriaza film catre client
         return - returneaza film de la client
         random - genereaza X entitati random pentru Film, Client, Inchiriere
@@ -433,5 +450,7 @@ class Console:
                     action()  # invoke the selected action
                 except IOError:
                     print("Eroare la nivel de fisiere")
+                except RepoException as re:  # the data can't be loaded, e.g. duplicate CNPs in the clients file
+                    print(re)
             else:
                 print("Comanda invalida")
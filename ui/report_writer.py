@@ -0,0 +1,33 @@
+"""
+Class definition of the writer of the reports
+"""
+import sys
+
+
+class ReportWriter:
+    """
+    Writes the rows of a report to a text stream one at a time, as they are produced (the writer doesn't keep them)
+    """
+    def __init__(self, fh=None):
+        """
+        Initializes the writer
+
+        :param fh: a text file handle - optional, by default the standard output
+        """
+        self.__fh = fh
+
+    def write(self, rows):
+        """
+        Writes every row of a report, followed by an empty line (the same layout as printing the rows)
+
+        :param rows: an iterable of rows, written with their string representation (strings or DTO objects)
+        :return: the number of rows written, integer
+        """
+        fh = sys.stdout if self.__fh is None else self.__fh  # looked up on every write, the standard output may be replaced
+
+        count = 0
+        for row in rows:
+            fh.write(f"{row}\n")
+            count += 1
+
+        return count
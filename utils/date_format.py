@@ -0,0 +1,37 @@
+"""
+Utility functions for reading and writing the dates of the transactions in the fixed "dd.mm.YYYY HH:MM" layout
+"""
+import datetime
+from functools import lru_cache
+
+DATE_FORMAT = "%d.%m.%Y %H:%M"
+
+
+@lru_cache(maxsize=4096)
+def parse_date(text):
+    """
+    Parses a date written in the "dd.mm.YYYY HH:MM" layout
+    (the results are cached, since many transactions share the same minute)
+
+    :param text: string
+    :return: the datetime object
+    :raises ValueError: if the text is not a valid date
+    """
+    if len(text) != 16 or text[2] != "." or text[5] != "." or text[10] != " " or text[13] != ":":
+        return datetime.datetime.strptime(text, DATE_FORMAT)  # not zero padded, let strptime handle it
+
+    if not (text[0:2] + text[3:5] + text[6:10] + text[11:13] + text[14:16]).isdecimal():
+        return datetime.datetime.strptime(text, DATE_FORMAT)  # int() would accept signs and spaces, strptime decides
+
+    return datetime.datetime(int(text[6:10]), int(text[3:5]), int(text[0:2]), int(text[11:13]), int(text[14:16]))
+
+
+@lru_cache(maxsize=4096)
+def format_date(date):
+    """
+    Writes a date in the "dd.mm.YYYY HH:MM" layout (the results are cached, like for parse_date)
+
+    :param date: datetime object
+    :return: the string
+    """
+    return f"{date.day:02d}.{date.month:02d}.{date.year:04d} {date.hour:02d}:{date.minute:02d}"
@@ -0,0 +1,37 @@
+"""
+Edit distance between strings, used by the fuzzy searches
+"""
+
+
+def bounded_levenshtein(text1, text2, max_distance):
+    """
+    Computes the Levenshtein distance (insertions, deletions and substitutions) between two strings,
+    stopping as soon as it is known to be greater than max_distance
+
+    :param text1: string
+    :param text2: string
+    :param max_distance: integer
+    :return: the distance if it is at most max_distance, max_distance + 1 otherwise
+    """
+    too_far = max_distance + 1
+    if abs(len(text1) - len(text2)) > max_distance:
+        return too_far
+
+    # only the cells at most max_distance away from the diagonal can hold a distance <= max_distance
+    previous = [j if j <= max_distance else too_far for j in range(len(text2) + 1)]
+    for i in range(1, len(text1) + 1):
+        current = [too_far] * (len(text2) + 1)
+        if i <= max_distance:
+            current[0] = i
+
+        row_min = current[0]
+        for j in range(max(1, i - max_distance), min(len(text2), i + max_distance) + 1):
+            distance = min(previous[j - 1] + (text1[i - 1] != text2[j - 1]), previous[j] + 1, current[j - 1] + 1)
+            current[j] = min(distance, too_far)
+            row_min = min(row_min, current[j])
+
+        if row_min >= too_far:  # every path goes through this row
+            return too_far
+        previous = current
+
+    return previous[len(text2)]
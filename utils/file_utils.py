@@ -0,0 +1,40 @@
+"""
+Utility functions for the file based repositories
+"""
+import os
+from enum import Enum
+
+
+def get_file_signature(filename):
+    """
+    Computes a signature of the file that changes whenever the file is modified or replaced
+
+    :param filename: string
+    :return: a tuple (inode, size, modification time in nanoseconds) or None if the file doesn't exist
+    """
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class FsyncPolicy(Enum):
+    """
+    Enum for possible policies of forcing the written data to the disk
+    """
+    NEVER = 1  # leave the flushing to the operating system
+    ALWAYS = 2  # force the data to the disk after every write
+
+
+def sync_file(fh, fsync_policy):
+    """
+    Forces the data written in the file handle to the disk, if the policy requires it
+
+    :param fh: a file handle opened for writing
+    :param fsync_policy: FsyncPolicy
+    """
+    if fsync_policy == FsyncPolicy.ALWAYS:
+        fh.flush()
+        os.fsync(fh.fileno())
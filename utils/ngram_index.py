@@ -0,0 +1,153 @@
+"""
+Class definition of an n-gram index used for substring searches
+"""
+
+
+class NgramIndex:
+    """
+    Maps keys to texts and finds the keys of the texts which contain a substring, using the n-grams of the texts
+    """
+    def __init__(self, n=3, padded=False):
+        """
+        Initializes an empty index
+
+        :param n: integer, the length of the n-grams - optional, by default 3 (trigrams)
+        :param padded: bool, if the texts are padded at both ends, so their beginning and end give n-grams too and even
+        the short texts have enough n-grams for search_similar - optional, by default False
+        """
+        self.__n = n
+        self.__padding = "\0" * (n - 1) if padded else ""  # a character which doesn't appear in the texts
+        self.__texts = {}  # key -> text
+        self.__order = {}  # key -> sequence number, the results are given in the order the keys were added
+        self.__next_order = 0
+        self.__postings = {}  # n-gram -> set of the keys of the texts which contain it
+
+    def __grams(self, text):
+        """
+        Computes the distinct n-grams of a text
+
+        :param text: string
+        :return: a set of strings
+        """
+        return {text[i:i + self.__n] for i in range(len(text) - self.__n + 1)}
+
+    def __padded_grams(self, text):
+        """
+        Computes the distinct n-grams of a text, after padding it if the index is padded
+
+        :param text: string
+        :return: a set of strings
+        """
+        return self.__grams(self.__padding + text + self.__padding)
+
+    def add(self, key, text):
+        """
+        Adds a text to the index, replacing the previous text of the key (the key keeps its position)
+
+        :param key: a hashable object
+        :param text: string
+        """
+        if key in self.__texts:
+            self.__remove_postings(key)
+        else:
+            self.__order[key] = self.__next_order
+            self.__next_order += 1
+
+        self.__texts[key] = text
+        for gram in self.__padded_grams(text):
+            self.__postings.setdefault(gram, set()).add(key)
+
+    def __remove_postings(self, key):
+        """
+        Removes the key from the postings of the n-grams of its text
+
+        :param key: a hashable object
+        """
+        for gram in self.__padded_grams(self.__texts[key]):
+            keys = self.__postings[gram]
+            keys.discard(key)
+            if not keys:
+                del self.__postings[gram]
+
+    def remove(self, key):
+        """
+        Removes the text of a key from the index
+
+        :param key: a hashable object
+        """
+        if key not in self.__texts:
+            return
+
+        self.__remove_postings(key)
+        del self.__texts[key]
+        del self.__order[key]
+
+    def search(self, substring):
+        """
+        Finds the keys of the texts which contain the substring
+
+        :param substring: string
+        :return: a list of keys, in the order they were added
+        """
+        if len(substring) < self.__n:  # too short to have n-grams, every text is checked
+            return [key for key, text in self.__texts.items() if substring in text]
+
+        postings = []
+        for gram in self.__grams(substring):
+            if gram not in self.__postings:
+                return []
+            postings.append(self.__postings[gram])
+
+        postings.sort(key=len)  # intersect starting from the rarest n-gram
+        candidates = set(postings[0])
+        for keys in postings[1:]:
+            candidates &= keys
+            if not candidates:
+                return []
+
+        # the n-grams can be found in a text in a different order, so the candidates are checked
+        result = [key for key in candidates if substring in self.__texts[key]]
+        result.sort(key=self.__order.__getitem__)
+
+        return result
+
+    def search_similar(self, text, max_distance):
+        """
+        Finds the keys of the texts which can be at most max_distance edits away from the text: an edit changes at most
+        n of the n-grams of the text, so such a text contains all but at most max_distance * n of them
+
+        :param text: string
+        :param max_distance: integer
+        :return: a list of keys, in the order they were added (a superset of the keys of the similar texts)
+        """
+        max_missing = max_distance * self.__n
+        grams = sorted(self.__padded_grams(text), key=lambda gram: len(self.__postings.get(gram, ())))
+        if len(grams) <= max_missing:  # a text without any of the n-grams can still be similar
+            return list(self.__texts)
+
+        # a similar text contains at least one of any max_missing + 1 n-grams, the rarest ones give the fewest candidates
+        candidates = set()
+        for gram in grams[:max_missing + 1]:
+            candidates |= self.__postings.get(gram, set())
+
+        result = []
+        for key in candidates:
+            missing = 0
+            for gram in grams:
+                if key not in self.__postings.get(gram, ()):
+                    missing += 1
+                    if missing > max_missing:
+                        break
+            if missing <= max_missing:
+                result.append(key)
+        result.sort(key=self.__order.__getitem__)
+
+        return result
+
+    def clear(self):
+        """
+        Removes all the texts from the index
+        """
+        self.__texts.clear()
+        self.__order.clear()
+        self.__postings.clear()
@@ -0,0 +1,98 @@
+"""
+Class definition of a sorted index of texts used for searches by prefix
+"""
+from bisect import bisect_left, insort
+
+
+class PrefixIndex:
+    """
+    Maps keys to texts and finds the keys of the texts which start with a prefix, using the texts in sorted order
+    """
+    def __init__(self):
+        """
+        Initializes an empty index
+        """
+        self.__entries = {}  # key -> (text, sequence number), the results are given in the order the keys were added
+        self.__next_order = 0
+        self.__sorted = []  # tuples (text, sequence number, key) in ascending order
+
+    def add(self, key, text):
+        """
+        Adds a text to the index, replacing the previous text of the key (the key keeps its position)
+
+        :param key: a hashable object
+        :param text: string
+        """
+        if key in self.__entries:
+            order = self.__entries[key][1]
+            self.__remove_sorted(key)
+        else:
+            order = self.__next_order
+            self.__next_order += 1
+
+        self.__entries[key] = (text, order)
+        insort(self.__sorted, (text, order, key))  # the sequence numbers are unique, so the keys are never compared
+
+    def add_all(self, items):
+        """
+        Adds several texts to the index at once, sorting the entries a single time instead of inserting them one by one
+
+        :param items: an iterable of pairs (key, text)
+        """
+        for key, text in items:
+            if key in self.__entries:
+                order = self.__entries[key][1]
+            else:
+                order = self.__next_order
+                self.__next_order += 1
+            self.__entries[key] = (text, order)
+
+        self.__sorted = sorted((text, order, key) for key, (text, order) in self.__entries.items())
+
+    def __remove_sorted(self, key):
+        """
+        Removes the entry of the key from the sorted list
+
+        :param key: a hashable object
+        """
+        text, order = self.__entries[key]
+        del self.__sorted[bisect_left(self.__sorted, (text, order))]  # (text, order) comes right before (text, order, key)
+
+    def remove(self, key):
+        """
+        Removes the text of a key from the index
+
+        :param key: a hashable object
+        """
+        if key not in self.__entries:
+            return
+
+        self.__remove_sorted(key)
+        del self.__entries[key]
+
+    def search(self, prefix):
+        """
+        Finds the keys of the texts which start with the prefix, in O(log n + k) for k results
+
+        :param prefix: string
+        :return: a list of keys, in the order they were added
+        """
+        if not prefix:
+            return list(self.__entries)
+
+        matches = []
+        i = bisect_left(self.__sorted, (prefix,))  # the texts with the prefix are consecutive from here
+        while i < len(self.__sorted) and self.__sorted[i][0].startswith(prefix):
+            matches.append(self.__sorted[i])
+            i += 1
+
+        matches.sort(key=lambda entry: entry[1])
+
+        return [entry[2] for entry in matches]
+
+    def clear(self):
+        """
+        Removes all the texts from the index
+        """
+        self.__entries.clear()
+        self.__sorted.clear()
@@ -1,6 +1,7 @@
 """
 Utility functions for sorting a list of objects using different implementations/algorithms
 """
+import heapq
 from enum import Enum
 
 
@@ -130,3 +131,22 @@ class Sorting:
             return Sorting.__merge_sort(list_obj, compare)
         elif method == SortingMethod.BINGO_SORT:
             return Sorting.__bingo_sort(list_obj, compare, key)
+
+    @staticmethod
+    def first_k(list_obj, k, *, key=None, reverse=False):
+        """
+        Returns the first k elements of the sorted list from list_obj, without sorting the whole list
+        (only a heap of k elements is kept while iterating over the list)
+
+        :param list_obj: a list of objects
+        :param k: integer, the number of elements returned
+        :param key: a function with one argument that returns the value to be compared for each element - optional, by default returns the element
+        :param reverse: selects the greatest elements, in descending order, if True, the smallest ones otherwise - optional, by default False
+        :return: the sorted list of the first k objects
+        """
+        key = (lambda x: x) if key is None else key
+
+        if reverse:
+            return heapq.nlargest(k, list_obj, key=key)
+
+        return heapq.nsmallest(k, list_obj, key=key)
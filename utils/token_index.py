@@ -0,0 +1,158 @@
+"""
+Class definition of an inverted index of the normalized tokens of texts, used for searches by prefixes of words
+"""
+import re
+import unicodedata
+from bisect import bisect_left, insort
+
+
+def tokenize(text):
+    """
+    Splits a text into normalized tokens: case-folded words without diacritics
+
+    :param text: string
+    :return: a list of strings
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))  # "ș" -> "s", "ă" -> "a"
+
+    return re.findall(r"\w+", stripped)
+
+
+class TokenIndex:
+    """
+    Maps keys to texts and finds the keys of the texts in which every word of a query starts a word
+    """
+    def __init__(self):
+        """
+        Initializes an empty index
+        """
+        self.__tokens = {}  # key -> set of the tokens of its text
+        self.__order = {}  # key -> sequence number, the results are given in the order the keys were added
+        self.__next_order = 0
+        self.__postings = {}  # token -> set of the keys of the texts which contain it
+        self.__sorted_tokens = []  # the tokens from __postings in ascending order, for the prefix searches
+
+    @staticmethod
+    def matches(query, text):
+        """
+        Checks if every word of the query starts a word of the text (the same rule as search, without an index)
+
+        :param query: string
+        :param text: string
+        :return: True if the text matches, False otherwise
+        """
+        tokens = tokenize(text)
+
+        return all(any(token.startswith(prefix) for token in tokens) for prefix in tokenize(query))
+
+    def add(self, key, text):
+        """
+        Adds a text to the index, replacing the previous text of the key (the key keeps its position)
+
+        :param key: a hashable object
+        :param text: string
+        """
+        if key in self.__tokens:
+            self.__remove_postings(key)
+        else:
+            self.__order[key] = self.__next_order
+            self.__next_order += 1
+
+        self.__tokens[key] = set(tokenize(text))
+        for token in self.__tokens[key]:
+            if token not in self.__postings:
+                self.__postings[token] = set()
+                insort(self.__sorted_tokens, token)
+            self.__postings[token].add(key)
+
+    def add_all(self, items):
+        """
+        Adds several texts to the index at once, sorting the tokens a single time instead of inserting them one by one
+
+        :param items: an iterable of pairs (key, text)
+        """
+        for key, text in items:
+            if key in self.__tokens:
+                self.__remove_postings(key, keep_sorted=False)
+            else:
+                self.__order[key] = self.__next_order
+                self.__next_order += 1
+
+            self.__tokens[key] = set(tokenize(text))
+            for token in self.__tokens[key]:
+                self.__postings.setdefault(token, set()).add(key)
+
+        self.__sorted_tokens = sorted(self.__postings)
+
+    def __remove_postings(self, key, keep_sorted=True):
+        """
+        Removes the key from the postings of the tokens of its text
+
+        :param key: a hashable object
+        :param keep_sorted: bool, if the tokens left without keys are removed from the sorted tokens too - optional,
+        by default True (add_all sorts them again at the end)
+        """
+        for token in self.__tokens[key]:
+            keys = self.__postings[token]
+            keys.discard(key)
+            if not keys:
+                del self.__postings[token]
+                if keep_sorted:
+                    del self.__sorted_tokens[bisect_left(self.__sorted_tokens, token)]
+
+    def remove(self, key):
+        """
+        Removes the text of a key from the index
+
+        :param key: a hashable object
+        """
+        if key not in self.__tokens:
+            return
+
+        self.__remove_postings(key)
+        del self.__tokens[key]
+        del self.__order[key]
+
+    def __search_prefix(self, prefix):
+        """
+        Finds the keys of the texts with a token that starts with the prefix
+
+        :param prefix: string, a normalized token
+        :return: a set of keys
+        """
+        keys = set()
+        i = bisect_left(self.__sorted_tokens, prefix)  # the tokens with the prefix are consecutive from here
+        while i < len(self.__sorted_tokens) and self.__sorted_tokens[i].startswith(prefix):
+            keys |= self.__postings[self.__sorted_tokens[i]]
+            i += 1
+
+        return keys
+
+    def search(self, query):
+        """
+        Finds the keys of the texts in which every word of the query starts a word, ignoring the case and the diacritics
+
+        :param query: string
+        :return: a list of keys, in the order they were added
+        """
+        prefixes = sorted(set(tokenize(query)), key=len, reverse=True)  # the longest prefixes match the fewest tokens
+        if not prefixes:
+            return list(self.__tokens)
+
+        result = self.__search_prefix(prefixes[0])
+        for prefix in prefixes[1:]:
+            if not result:
+                break
+            result &= self.__search_prefix(prefix)
+
+        return sorted(result, key=self.__order.__getitem__)
+
+    def clear(self):
+        """
+        Removes all the texts from the index
+        """
+        self.__tokens.clear()
+        self.__order.clear()
+        self.__postings.clear()
+        self.__sorted_tokens.clear()